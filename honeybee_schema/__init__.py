@@ -1 +1,25 @@
+"""Honeybee schema objects and the utilities that validate and update them.
 
+Submodules are imported the first time they are accessed as attributes of the
+package (eg. honeybee_schema.model) such that commands that do not need the
+pydantic schema objects (like the CLI help) do not pay the cost of importing them.
+"""
+
+import importlib
+import pkgutil
+
+# public submodules and subpackages, which are found without importing them
+_SUBMODULES = frozenset(
+    module.name for module in pkgutil.iter_modules(__path__)
+    if not module.name.startswith("_")
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
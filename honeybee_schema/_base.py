@@ -1,9 +1,23 @@
 """Base class for all objects requiring a valid names for all engines."""
 
+from typing import Union
+
 from pydantic import ConfigDict, BaseModel, Field
+from pydantic_core import core_schema
+from typing_extensions import Annotated
+
+
+class DeferredBaseModel(BaseModel):
+    """Base class for all objects, which builds their validators on first use.
+
+    Building the validators of every object when the schema modules are
+    imported is slow, while most processes only use a part of the schema.
+    """
+
+    model_config = ConfigDict(defer_build=True)
 
 
-class NoExtraBaseModel(BaseModel):
+class NoExtraBaseModel(DeferredBaseModel):
     """Base class for all objects that are not extensible with additional keys.
 
     This effectively includes all objects except for the Properties classes
@@ -40,3 +54,72 @@ class IDdBaseModel(NoExtraBaseModel):
         "type to ensure correct serialization of the object (eg. str, float, "
         "int, list).",
     )
+
+
+def _type_tag(value):
+    """Get the type key of a dictionary or the type attribute of a schema object."""
+    if isinstance(value, dict):
+        return value.get("type")
+    return getattr(value, "type", None)
+
+
+class _TypeDispatch:
+    """Annotation that validates a Union of schema classes by their type key.
+
+    The JSON schema is that of a plain Union of the classes (an anyOf in the
+    order of the classes) such that the published schema is not changed by the
+    dispatching.
+    """
+
+    def __init__(self, classes):
+        self.classes = classes
+        # the tag of each class and its position among the classes of that tag
+        self.positions, counts = [], {}
+        for cls in classes:
+            tag = cls.model_fields["type"].default
+            self.positions.append((tag, counts.get(tag, 0)))
+            counts[tag] = counts.get(tag, 0) + 1
+
+    def __get_pydantic_core_schema__(self, source, handler):
+        groups = {}
+        for cls, (tag, _) in zip(self.classes, self.positions):
+            groups.setdefault(tag, []).append(handler.generate_schema(cls))
+        choices = {
+            tag: group[0] if len(group) == 1 else core_schema.union_schema(group)
+            for tag, group in groups.items()
+        }
+        return core_schema.tagged_union_schema(choices, _type_tag)
+
+    def __get_pydantic_json_schema__(self, schema, handler):
+        return handler(self._plain_union(schema))
+
+    def _plain_union(self, schema):
+        """Replace the tagged Union in a core schema with a plain Union of the classes.
+
+        Validators of the field (eg. function-after schemas) are kept around it.
+        """
+        if schema["type"] != "tagged-union":
+            return dict(schema, schema=self._plain_union(schema["schema"]))
+        choices = schema["choices"]
+        members = [
+            choices[tag]["choices"][i] if choices[tag]["type"] == "union"
+            else choices[tag]
+            for tag, i in self.positions
+        ]
+        return core_schema.union_schema(members)
+
+
+def type_union(*classes):
+    """Get a Union of schema classes that is dispatched on their type key.
+
+    Each input dictionary is validated against only the class with a matching
+    type instead of trying every member of the Union until one passes. This
+    is faster for large Unions and it yields error messages for a single class.
+    Classes that share the same type (eg. EnergyMaterial and
+    EnergyMaterialVegetation) are grouped into a regular Union under that type.
+    The JSON schema is the same as that of a plain Union of the classes.
+
+    Args:
+        classes: Schema classes that each have a type field with a default value.
+    """
+    return Annotated[Union[classes], _TypeDispatch(classes)]
@@ -0,0 +1,122 @@
+"""Helpers for the Face3D geometry and tolerances of Model dictionaries.
+
+The geometry checks, the spatial index and the adjacency tools all read the
+vertices of Face3D dictionaries as columns of x, y and z values, which are
+summed with the operator functions rather than one vertex at a time.
+"""
+
+import math
+from itertools import chain
+from operator import add, mul, sub
+
+# tolerance of Models that do not specify one
+DEFAULT_TOLERANCE = 0.01
+
+# angle tolerance in degrees of Models that do not specify one
+DEFAULT_ANGLE_TOLERANCE = 1.0
+
+
+def model_tolerances(model_dict, tolerance=None, angle_tolerance=None):
+    """Get the tolerance and angle tolerance to use for a Model.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        tolerance: A tolerance that overrides the one of the Model.
+        angle_tolerance: An angle tolerance in degrees that overrides the one
+            of the Model.
+
+    Returns:
+        A tuple with the tolerance and angle tolerance. Values that are None
+        or zero in both the arguments and the Model are the defaults.
+    """
+    return (
+        tolerance or model_dict.get("tolerance") or DEFAULT_TOLERANCE,
+        angle_tolerance or model_dict.get("angle_tolerance") or DEFAULT_ANGLE_TOLERANCE,
+    )
+
+
+def face_loops(geometry):
+    """Get the boundary and holes of a Face3D dictionary as lists of x, y and z values.
+
+    Args:
+        geometry: The geometry dictionary of an object.
+
+    Returns:
+        A list with the boundary followed by the holes, each as a tuple of the
+        lists of x, y and z values of its vertices. None if the geometry is
+        not a valid Face3D dictionary.
+    """
+    if not isinstance(geometry, dict) or geometry.get("type") != "Face3D":
+        return None
+    try:
+        loops = [
+            tuple(map(list, zip(*loop)))
+            for loop in chain((geometry["boundary"],), geometry.get("holes") or ())
+        ]
+    except (TypeError, KeyError):
+        return None
+    if any(len(loop) != 3 or len(loop[0]) < 3 for loop in loops):
+        return None  # invalid geometry is reported by the schema validation
+    return loops or None
+
+
+def face_normal(geometry, boundary):
+    """Get the normal of a Face3D scaled to twice the area of its boundary.
+
+    If the Face3D has a plane, the normal points in the direction of the plane
+    normal. Otherwise it follows the order of the boundary vertices.
+
+    Args:
+        geometry: The Face3D dictionary.
+        boundary: The boundary of the Face3D as returned by face_loops.
+    """
+    normal = loop_normal(boundary)
+    plane = geometry.get("plane")
+    if isinstance(plane, dict) and \
+            sum(map(mul, normal, plane.get("n") or (0, 0, 0))) < 0:
+        normal = [-n for n in normal]
+    return normal
+
+
+def loop_normal(loop):
+    """Get the normal of a loop of vertices with Newell's method.
+
+    The normal follows the order of the vertices and its length is twice the
+    area enclosed by the loop.
+
+    Args:
+        loop: A tuple of the lists of x, y and z values of the vertices.
+    """
+    xs, ys, zs = loop
+    xn, yn, zn = xs[1:] + xs[:1], ys[1:] + ys[:1], zs[1:] + zs[:1]
+    return [
+        sum(map(mul, map(sub, ys, yn), map(add, zs, zn))),
+        sum(map(mul, map(sub, zs, zn), map(add, xs, xn))),
+        sum(map(mul, map(sub, xs, xn), map(add, ys, yn))),
+    ]
+
+
+def face_area(loops):
+    """Get the area of a Face3D, which is that of its boundary minus its holes.
+
+    Args:
+        loops: The boundary and holes of the Face3D as returned by face_loops.
+    """
+    areas = [magnitude(loop_normal(loop)) / 2 for loop in loops]
+    return areas[0] - sum(areas[1:])
+
+
+def loop_center(loop):
+    """Get the center of the bounding box of a loop of vertices.
+
+    Unlike the centroid, it is not affected by collinear vertices.
+
+    Args:
+        loop: A tuple of the lists of x, y and z values of the vertices.
+    """
+    return tuple((min(values) + max(values)) / 2 for values in loop)
+
+
+def magnitude(vector):
+    """Get the length of a vector."""
+    return math.sqrt(sum(map(mul, vector, vector)))
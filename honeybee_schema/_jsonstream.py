@@ -0,0 +1,192 @@
+"""Incremental reader for walking large JSON documents one value at a time."""
+
+import os
+import json
+import re
+
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def load_json(value):
+    """Get a decoded JSON document from a dictionary or the path to a JSON file.
+
+    Args:
+        value: A dictionary, which is returned as it is, or the path to a
+            JSON file, which is loaded.
+    """
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, (str, os.PathLike)):
+        with open(value, "rb") as json_file:
+            return json.load(json_file)
+    raise TypeError(
+        "Expected a Model dictionary or JSON file path. Got {}.".format(type(value))
+    )
+
+
+class JsonStream:
+    """Read a JSON document from a binary file without loading all of it at once.
+
+    The stream exposes the structure of the document through iter_object and
+    iter_array while individual values are decoded with read_value. Only the
+    value currently being decoded (plus one read chunk) is held in memory so
+    the peak memory is bounded by the largest single value that is read rather
+    than the size of the whole file.
+
+    The file is decoded as latin-1 so that every character in the buffer is
+    exactly one byte in the file. This keeps all reported offsets in bytes
+    while values that contain non-ASCII text are re-decoded as UTF-8.
+
+    Args:
+        file: A file object opened in binary mode.
+        chunk_size: Number of bytes to read from the file at a time.
+    """
+
+    def __init__(self, file, chunk_size=CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0
+        self._eof = False
+        self._ascii = True
+
+    def tell(self):
+        """Get the byte offset in the file of the next unread character."""
+        return self._offset + self._pos
+
+    def peek(self):
+        """Get the next non-whitespace character without consuming it.
+
+        An empty string is returned at the end of the file.
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read(self._chunk_size):
+                return ""
+
+    def iter_object(self):
+        """Iterate over the keys of the JSON object that starts at the stream position.
+
+        The value of each key must be consumed (with read_value, iter_object
+        or iter_array) before the next key is requested.
+        """
+        self._consume("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._decode()[0]
+            if not isinstance(key, str):
+                raise ValueError(
+                    "Expecting an object key at byte {}.".format(self.tell())
+                )
+            self._consume(":")
+            yield key
+            if self._consume_separator("}") == "}":
+                return
+
+    def iter_array(self):
+        """Iterate over the items of the JSON array that starts at the stream position.
+
+        Each iteration yields the index of the item and the item itself must be
+        consumed (with read_value, iter_object or iter_array) before the next
+        item is requested.
+        """
+        self._consume("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self._consume_separator("]") == "]":
+                return
+
+    def read_value(self):
+        """Decode the JSON value that starts at the stream position."""
+        return self._decode()[0]
+
+    def read_span(self):
+        """Decode the next JSON value and get the byte range it occupies in the file.
+
+        Returns:
+            A tuple with three items.
+
+            -   value: The decoded JSON value.
+
+            -   start: The byte offset at which the value starts in the file.
+
+            -   end: The byte offset just after the end of the value in the file.
+        """
+        return self._decode()
+
+    def _read(self, size):
+        """Drop consumed text from the buffer and append up to size new bytes."""
+        if self._pos:
+            self._offset += self._pos
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        data = self._file.read(size)
+        if not data:
+            self._eof = True
+            return False
+        self._ascii = self._ascii and data.isascii()
+        self._buffer += data.decode("latin-1")
+        return True
+
+    def _consume(self, char):
+        """Consume a single structural character, raising an error if it is not found."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                "Expecting {!r} at byte {} but found {!r}.".format(
+                    char, self.tell(), found
+                )
+            )
+        self._pos += 1
+
+    def _consume_separator(self, closing):
+        """Consume and return either a comma or the closing character of a container."""
+        found = self.peek()
+        if found not in (",", closing):
+            raise ValueError(
+                "Expecting ',' or {!r} at byte {} but found {!r}.".format(
+                    closing, self.tell(), found
+                )
+            )
+        self._pos += 1
+        return found
+
+    def _decode(self):
+        """Decode the next value, reading more of the file until it is complete."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                position = self._offset + e.pos
+                if not self._read(size):
+                    raise ValueError(
+                        "Invalid JSON at byte {}: {}".format(position, e.msg)
+                    ) from None
+                size = max(size, len(self._buffer))
+                continue
+            # a number that ends with the buffer may continue in the next chunk
+            if end == len(self._buffer) and not self._eof and self._read(size):
+                continue
+            break
+        if not self._ascii:
+            text = self._buffer[self._pos:end]
+            if not text.isascii():
+                value = json.loads(text.encode("latin-1"))
+        start = self.tell()
+        self._pos = end
+        return value, start, self.tell()
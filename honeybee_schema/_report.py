@@ -0,0 +1,128 @@
+"""Utilities for building ValidationReport objects from validation outcomes."""
+
+import re
+from importlib import metadata
+
+from .validation import (
+    ValidationReport,
+    ValidationError,
+    ValidationParent,
+    ExtensionTypes,
+    ObjectTypes,
+)
+
+# the object and extension type of the items in each list of a Model dictionary
+ELEMENT_TYPES = {
+    "rooms": (ObjectTypes.room, ExtensionTypes.core),
+    "faces": (ObjectTypes.face, ExtensionTypes.core),
+    "apertures": (ObjectTypes.aperture, ExtensionTypes.core),
+    "doors": (ObjectTypes.door, ExtensionTypes.core),
+    "shades": (ObjectTypes.shade, ExtensionTypes.core),
+    "orphaned_faces": (ObjectTypes.face, ExtensionTypes.core),
+    "orphaned_shades": (ObjectTypes.shade, ExtensionTypes.core),
+    "orphaned_apertures": (ObjectTypes.aperture, ExtensionTypes.core),
+    "orphaned_doors": (ObjectTypes.door, ExtensionTypes.core),
+    "shade_meshes": (ObjectTypes.shade, ExtensionTypes.core),
+    "materials": (ObjectTypes.material, ExtensionTypes.energy),
+    "constructions": (ObjectTypes.construction, ExtensionTypes.energy),
+    "construction_sets": (ObjectTypes.construction_set, ExtensionTypes.energy),
+    "schedule_type_limits": (ObjectTypes.schedule_type_limit, ExtensionTypes.energy),
+    "schedules": (ObjectTypes.schedule, ExtensionTypes.energy),
+    "program_types": (ObjectTypes.program_type, ExtensionTypes.energy),
+    "hvacs": (ObjectTypes.hvac, ExtensionTypes.energy),
+    "shws": (ObjectTypes.shw, ExtensionTypes.energy),
+    "modifiers": (ObjectTypes.modifier, ExtensionTypes.radiance),
+    "modifier_sets": (ObjectTypes.modifier_set, ExtensionTypes.radiance),
+    "sensor_grids": (ObjectTypes.sensor_grid, ExtensionTypes.radiance),
+    "views": (ObjectTypes.view, ExtensionTypes.radiance),
+}
+
+# error codes for objects that do not match the schema, one for each extension
+SCHEMA_ERROR_CODES = {
+    ExtensionTypes.core: "000000",
+    ExtensionTypes.radiance: "010000",
+    ExtensionTypes.energy: "020000",
+}
+
+_ELEMENT_ID = re.compile(r"^[^,;!\n\t]{1,100}$")
+
+
+def schema_version():
+    """Get the version of the installed honeybee-schema as a major.minor.patch string.
+
+    This is 0.0.0 if the package is not installed (eg. when running from source).
+    """
+    try:
+        version = metadata.version("honeybee-schema")
+    except metadata.PackageNotFoundError:
+        return "0.0.0"
+    match = re.match(r"[0-9]+\.[0-9]+\.[0-9]+", version)
+    return match.group() if match else "0.0.0"
+
+
+def element_id(identifier, key, index):
+    """Get a valid ValidationError element_id for an object.
+
+    Args:
+        identifier: The identifier of the object, which may be None or invalid
+            if the object itself failed to validate.
+        key: The key of the list in which the object lives (eg. rooms).
+        index: The index of the object in the list.
+    """
+    if isinstance(identifier, str) and _ELEMENT_ID.match(identifier):
+        return identifier
+    return "{}[{}]".format(key, index)
+
+
+def schema_error(result):
+    """Get a ValidationError for an ElementResult that did not match the schema.
+
+    Args:
+        result: An ElementResult with an error from one of the Model lists
+            in ELEMENT_TYPES.
+    """
+    key = result.path[-1]
+    element_type, extension_type = ELEMENT_TYPES[key]
+    return ValidationError(
+        code=SCHEMA_ERROR_CODES[extension_type],
+        error_type="Invalid Schema",
+        extension_type=extension_type,
+        element_type=element_type,
+        element_id=[element_id(result.identifier, key, result.index)],
+        message=str(result.error),
+    )
+
+
+def validation_parents(parents):
+    """Get a list of ValidationParent from the parents yielded by iter_objects.
+
+    Args:
+        parents: A tuple of (ParentTypes, dictionary) pairs for the parents
+            of an object, starting from the immediate parent.
+    """
+    parent_objects = []
+    for parent_type, parent in parents:
+        parent_info = {"parent_type": parent_type, "id": parent["identifier"]}
+        if parent.get("display_name"):
+            parent_info["name"] = parent["display_name"]
+        parent_objects.append(ValidationParent(**parent_info))
+    return parent_objects
+
+
+def validation_report(errors, fatal_error=""):
+    """Get a ValidationReport from a list of ValidationErrors.
+
+    Args:
+        errors: A list of ValidationError objects.
+        fatal_error: Text for an exception that prevented the Model from
+            being serialized. (Default: "").
+    """
+    version = schema_version()
+    return ValidationReport(
+        app_name="Honeybee",
+        app_version=version,
+        schema_version=version,
+        valid=not errors and not fatal_error,
+        fatal_error=fatal_error,
+        errors=errors,
+    )
@@ -0,0 +1,127 @@
+"""Utilities for walking the geometry objects of a Model dictionary."""
+
+from .validation import ObjectTypes, ParentTypes
+
+# keys of the top-level Model lists with geometry and the type of each item
+MODEL_OBJECTS = {
+    "rooms": ObjectTypes.room,
+    "orphaned_faces": ObjectTypes.face,
+    "orphaned_apertures": ObjectTypes.aperture,
+    "orphaned_doors": ObjectTypes.door,
+    "orphaned_shades": ObjectTypes.shade,
+    "shade_meshes": ObjectTypes.shade,
+}
+
+# keys for the child objects of each type of geometry object
+_CHILDREN = {
+    ObjectTypes.room: (
+        ("faces", ObjectTypes.face),
+        ("indoor_shades", ObjectTypes.shade),
+        ("outdoor_shades", ObjectTypes.shade),
+    ),
+    ObjectTypes.face: (
+        ("apertures", ObjectTypes.aperture),
+        ("doors", ObjectTypes.door),
+        ("indoor_shades", ObjectTypes.shade),
+        ("outdoor_shades", ObjectTypes.shade),
+    ),
+    ObjectTypes.aperture: (
+        ("indoor_shades", ObjectTypes.shade),
+        ("outdoor_shades", ObjectTypes.shade),
+    ),
+    ObjectTypes.door: (
+        ("indoor_shades", ObjectTypes.shade),
+        ("outdoor_shades", ObjectTypes.shade),
+    ),
+    ObjectTypes.shade: (),
+}
+
+# keys for the lists of child objects of each type of geometry object by type name
+CHILD_KEYS = {
+    element_type.value: tuple(key for key, _ in children)
+    for element_type, children in _CHILDREN.items() if children
+}
+
+
+def iter_objects(model_dict):
+    """Iterate over all geometry objects of a Model dictionary, including nested ones.
+
+    Rooms and orphaned objects are yielded before their children. Invalid
+    entries (eg. lists that are not lists or items that are not dictionaries)
+    are skipped.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+
+    Yields:
+        A tuple with three items.
+
+        -   element_type: The ObjectTypes of the object.
+
+        -   obj: The dictionary of the object.
+
+        -   parents: A tuple of (ParentTypes, dictionary) pairs for the parents
+            of the object, starting from the immediate parent. This is an
+            empty tuple for top-level objects.
+    """
+    stack = []
+    for key, element_type in reversed(MODEL_OBJECTS.items()):
+        _extend(stack, model_dict.get(key), element_type, ())
+    while stack:
+        element_type, obj, parents = stack.pop()
+        yield element_type, obj, parents
+        children = _CHILDREN[element_type]
+        if children:
+            child_parents = ((ParentTypes(element_type.value), obj),) + parents
+            for key, child_type in reversed(children):
+                _extend(stack, obj.get(key), child_type, child_parents)
+
+
+def iter_properties(model_dict, extension):
+    """Iterate over the extension properties of all geometry objects in a Model dictionary.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        extension: The name of the extension (eg. energy or radiance).
+
+    Yields:
+        Tuples of (element_type, obj, parents, properties) where the first three
+        items are the same as those of iter_objects and properties is the
+        dictionary of the object's properties for the extension. Objects
+        without properties for the extension are skipped.
+    """
+    for element_type, obj, parents in iter_objects(model_dict):
+        properties = obj.get("properties")
+        if isinstance(properties, dict):
+            ext_properties = properties.get(extension)
+            if isinstance(ext_properties, dict):
+                yield element_type, obj, parents, ext_properties
+
+
+def iter_tree(obj):
+    """Iterate over a geometry object and all of its nested child objects.
+
+    Args:
+        obj: The dictionary of a Room, Face, Aperture, Door or Shade.
+
+    Yields:
+        The dictionary of the object followed by those of its children in
+        depth-first order.
+    """
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        yield current
+        for key in reversed(CHILD_KEYS.get(current.get("type"), ())):
+            children = current.get(key)
+            if isinstance(children, list):
+                stack.extend(c for c in reversed(children) if isinstance(c, dict))
+
+
+def _extend(stack, items, element_type, parents):
+    """Add the valid dictionaries in a list to the stack in reverse order."""
+    if isinstance(items, list):
+        stack.extend(
+            (element_type, item, parents) for item in reversed(items)
+            if isinstance(item, dict)
+        )
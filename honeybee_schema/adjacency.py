@@ -0,0 +1,245 @@
+"""Solve the Surface boundary conditions between the adjacent Rooms of a Model.
+
+Faces of different Rooms are adjacent when the centers of their bounding boxes
+coincide, their normals point in opposite directions and their areas match
+within the tolerance of the Model. The center of every Face is hashed into a
+grid of cells the size of the tolerance such that the candidates of each Face
+are found in the neighboring cells of its own, which scales linearly with the
+number of Faces. When a SpatialIndex of the Model is already at hand, its
+coplanar query is used to find the candidates instead. The Apertures and Doors
+of each pair of adjacent Faces are matched the same way and all matched objects
+get reciprocal Surface boundary conditions.
+"""
+
+import math
+from operator import mul
+from typing import NamedTuple
+
+from ._geometry import face_area, face_loops, face_normal, loop_center, magnitude, \
+    model_tolerances
+
+# keys of the lists of sub-faces of a Face that are matched
+SUB_FACE_KEYS = ("apertures", "doors")
+
+
+class AdjacencyResult(NamedTuple):
+    """The outcome of solving the adjacencies of a Model.
+
+    Properties:
+        adjacent_faces: A list of tuples with the identifiers of each pair of
+            Faces that were set to be adjacent.
+        mismatched_faces: A list of tuples with the identifiers of each pair
+            of Faces that are adjacent but whose Apertures or Doors do not
+            match. Their boundary conditions are left unchanged.
+    """
+
+    adjacent_faces: list
+    mismatched_faces: list
+
+
+class _Candidate(NamedTuple):
+    """The geometry of a Face, Aperture or Door needed to match it."""
+
+    obj: dict
+    parent: dict
+    center: tuple
+    normal: tuple
+    area: float
+
+
+def solve_adjacency(model_dict, tolerance=None, angle_tolerance=None, overwrite=False,
+                    index=None):
+    """Set Surface boundary conditions between the matching Faces of different Rooms.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model, which is edited in place.
+        tolerance: The maximum distance between the centers of matching
+            Faces and the maximum difference in their areas. If None, the
+            tolerance of the Model is used.
+        angle_tolerance: The maximum angle in degrees by which the normals of
+            matching Faces can deviate from opposite directions. If None, the
+            angle_tolerance of the Model is used.
+        overwrite: Boolean to note whether Faces that already have a Surface
+            boundary condition should be matched again. If False, they are
+            left as they are. (Default: False).
+        index: An optional SpatialIndex of the Model, whose coplanar query is
+            used to find the candidates of each Face. Its tolerances should not
+            be smaller than those used for matching. If None, the centers of
+            the Faces are hashed into a grid, which is faster than building
+            an index.
+
+    Returns:
+        An AdjacencyResult with the identifiers of the adjacent Faces.
+    """
+    tolerance, angle_tolerance = \
+        model_tolerances(model_dict, tolerance, angle_tolerance)
+    min_cos = math.cos(math.radians(angle_tolerance))
+    grid = _CenterGrid(tolerance) if index is None else _IndexMatcher(index, tolerance)
+    for room in _dicts(model_dict.get("rooms")):
+        for face in _dicts(room.get("faces")):
+            bc = face.get("boundary_condition")
+            if not overwrite and isinstance(bc, dict) and bc.get("type") == "Surface":
+                continue
+            candidate = _candidate(face, room)
+            if candidate is not None:
+                grid.add(candidate)
+
+    adjacent, mismatched, matched = [], [], set()
+    for face in grid.candidates:
+        if id(face.obj) in matched:
+            continue
+        other = grid.match(face, min_cos, lambda c: id(c.obj) not in matched and
+                           c.parent is not face.parent)
+        if other is None:
+            continue
+        matched.add(id(face.obj))
+        matched.add(id(other.obj))
+        pairs = _sub_face_pairs(face.obj, other.obj, tolerance, min_cos)
+        if pairs is None:
+            mismatched.append((face.obj.get("identifier"), other.obj.get("identifier")))
+            continue
+        _set_surface(face.obj, other.obj, other.parent)
+        _set_surface(other.obj, face.obj, face.parent)
+        for sub_face, other_sub_face in pairs:
+            _set_surface(sub_face, other_sub_face, other.obj, other.parent)
+            _set_surface(other_sub_face, sub_face, face.obj, face.parent)
+        adjacent.append((face.obj.get("identifier"), other.obj.get("identifier")))
+    return AdjacencyResult(adjacent, mismatched)
+
+
+class _CenterGrid:
+    """A hash of the centers of candidates into cells the size of the tolerance."""
+
+    def __init__(self, tolerance):
+        self.tolerance = tolerance
+        self.candidates = []
+        self._cells = {}
+
+    def add(self, candidate):
+        """Add a candidate to the cell of its center."""
+        self.candidates.append(candidate)
+        self._cells.setdefault(self._cell(candidate.center), []).append(candidate)
+
+    def match(self, candidate, min_cos, accept):
+        """Get the nearest candidate that matches a candidate or None.
+
+        Args:
+            candidate: The candidate to match.
+            min_cos: The minimum cosine of the angle between the reversed
+                normal of the candidate and the normal of a match.
+            accept: A function that returns False for candidates that cannot
+                be matched (eg. those of the same Room).
+        """
+        tol = self.tolerance
+        cx, cy, cz = self._cell(candidate.center)
+        best, best_distance = None, None
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for other in self._cells.get((cx + dx, cy + dy, cz + dz), ()):
+                        if other is candidate or not accept(other):
+                            continue
+                        if not _is_adjacent(candidate, other, tol, min_cos):
+                            continue
+                        distance = math.dist(candidate.center, other.center)
+                        if best is None or distance < best_distance:
+                            best, best_distance = other, distance
+        return best
+
+    def _cell(self, point):
+        """Get the key of the cell of a point."""
+        tol = self.tolerance
+        return tuple(math.floor(c / tol) for c in point)
+
+
+class _IndexMatcher:
+    """Find the matches of candidates with the coplanar query of a SpatialIndex."""
+
+    def __init__(self, index, tolerance):
+        self.index = index
+        self.tolerance = tolerance
+        self.candidates = []
+        self._by_object = {}
+
+    def add(self, candidate):
+        """Add a candidate that can be matched."""
+        self.candidates.append(candidate)
+        self._by_object[id(candidate.obj)] = candidate
+
+    def match(self, candidate, min_cos, accept):
+        """Get the nearest candidate that matches a candidate or None.
+
+        The arguments are the same as those of _CenterGrid.match.
+        """
+        i = self.index.index_of(candidate.obj)
+        if i is None:
+            raise ValueError(
+                'Face "{}" is not in the SpatialIndex. The index must be built '
+                "from the same Model.".format(candidate.obj.get("identifier")))
+        # coplanar entries are sorted from the nearest to the farthest
+        for j in self.index.coplanar(i, opposite=True):
+            other = self._by_object.get(id(self.index.entries[j].obj))
+            if other is not None and accept(other) and \
+                    _is_adjacent(candidate, other, self.tolerance, min_cos):
+                return other
+        return None
+
+
+def _candidate(obj, parent):
+    """Get a _Candidate for an object with Face3D geometry or None."""
+    geometry = obj.get("geometry")
+    loops = face_loops(geometry)
+    if loops is None:
+        return None
+    normal = face_normal(geometry, loops[0])
+    length = magnitude(normal)
+    if length == 0:
+        return None
+    return _Candidate(obj, parent, loop_center(loops[0]),
+                      tuple(n / length for n in normal), face_area(loops))
+
+
+def _is_adjacent(candidate, other, tolerance, min_cos):
+    """Check whether two candidates have coincident centers and opposite normals."""
+    return all(abs(a - b) <= tolerance for a, b in zip(candidate.center, other.center)) \
+        and sum(map(mul, candidate.normal, other.normal)) <= -min_cos \
+        and abs(candidate.area - other.area) <= tolerance
+
+
+def _sub_face_pairs(face, other_face, tolerance, min_cos):
+    """Get the pairs of matching Apertures and Doors of two adjacent Faces.
+
+    Returns None if any Aperture or Door of one Face has no match in the other.
+    """
+    pairs = []
+    for key in SUB_FACE_KEYS:
+        sub_faces = [_candidate(s, face) for s in _dicts(face.get(key))]
+        others = [_candidate(s, other_face) for s in _dicts(other_face.get(key))]
+        if len(sub_faces) != len(others) or None in sub_faces or None in others:
+            return None
+        for sub_face in sub_faces:
+            match = next(
+                (o for o in others if _is_adjacent(sub_face, o, tolerance, min_cos)),
+                None)
+            if match is None:
+                return None
+            others.remove(match)
+            pairs.append((sub_face.obj, match.obj))
+    return pairs
+
+
+def _set_surface(obj, adjacent, *parents):
+    """Set a Surface boundary condition on an object pointing to the adjacent object."""
+    obj["boundary_condition"] = {
+        "type": "Surface",
+        "boundary_condition_objects": [
+            o.get("identifier") for o in (adjacent,) + parents
+        ],
+    }
+
+
+def _dicts(items):
+    """Get the dictionaries in a list, ignoring any other values."""
+    if not isinstance(items, list):
+        return []
+    return [item for item in items if isinstance(item, dict)]
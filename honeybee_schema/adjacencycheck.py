@@ -0,0 +1,224 @@
+"""Check that the Surface boundary conditions of a Model are consistent.
+
+The schema only checks that each Surface boundary condition lists two or three
+identifiers. It cannot check that they exist, that the adjacent object points
+back at the object or that the two objects match. The checks here index every
+Face, Aperture and Door of the Rooms of a Model by identifier in one pass and
+then test each Surface boundary condition with dictionary lookups, such that
+the whole Model is checked in linear time. Errors name both objects of the
+offending pair in their element_id. Identifiers shared by several objects and
+Surface boundary conditions of objects that are not in a Room are reported too,
+since neither can be resolved to a single adjacent object.
+"""
+
+from .validation import ExtensionTypes, ObjectTypes, ParentTypes, ValidationError
+from ._report import element_id, validation_parents, validation_report
+from ._traverse import iter_objects
+from ._geometry import face_area, face_loops, model_tolerances
+
+# error codes for inconsistent Surface boundary conditions
+MISSING_CODE = "000201"
+AREA_CODE = "000202"
+RECIPROCAL_CODE = "000203"
+SUB_FACE_CODE = "000204"
+DUPLICATE_CODE = "000205"
+ORPHANED_CODE = "000206"
+
+# types of objects that can have a Surface boundary condition and the number
+# of identifiers in their boundary_condition_objects
+_SURFACE_LENGTHS = {
+    ObjectTypes.face: 2,
+    ObjectTypes.aperture: 3,
+    ObjectTypes.door: 3,
+}
+
+
+def adjacency_errors(model_dict, tolerance=None, index=None):
+    """Get ValidationErrors for the inconsistent Surface boundary conditions of a Model.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        tolerance: The maximum difference between the areas of adjacent objects.
+            If None, the tolerance of the Model is used.
+        index: An optional SpatialIndex of the Model from which the areas of
+            adjacent objects are read. If None, they are computed.
+
+    Returns:
+        A list of ValidationErrors for Surface boundary conditions that point
+        at missing objects or objects with other parents, adjacent objects
+        that do not point back at each other, adjacent objects with different
+        areas or numbers of Apertures and Doors, identifiers of adjacent
+        objects that are shared by several objects and Surface boundary
+        conditions of objects that are not in a Room.
+    """
+    tolerance, _ = model_tolerances(model_dict, tolerance)
+    # objects of the Rooms by identifier, which should each list a single object
+    errors, entries, objects = [], [], {}
+    for element_type, obj, parents in iter_objects(model_dict):
+        if element_type not in _SURFACE_LENGTHS:
+            continue
+        if parents and parents[-1][0] is ParentTypes.room:
+            entry = (element_type, obj, parents)
+            entries.append(entry)
+            objects.setdefault(obj.get("identifier"), []).append(entry)
+        elif _is_surface(obj):
+            errors.append(_error(
+                ORPHANED_CODE, "Orphaned Adjacency", element_type, [(obj, parents)],
+                '{} "{}" has a Surface boundary condition but it is not in a '
+                "Room.".format(element_type.value, obj.get("identifier"))))
+
+    checked, referenced = set(), set()
+    for element_type, obj, parents in entries:
+        if not _is_surface(obj):
+            continue
+        bc_objects = obj["boundary_condition"].get("boundary_condition_objects") or []
+        referenced.update(bc_objects[:1])
+        group = objects.get(bc_objects[0]) if bc_objects else None
+        adjacent = group[0] if group else None
+        problem = _missing_problem(element_type, bc_objects, adjacent)
+        if problem:
+            errors.append(_error(
+                MISSING_CODE, "Missing Adjacent Object", element_type,
+                [(obj, parents)],
+                '{} "{}" has a Surface boundary condition with {}.'.format(
+                    element_type.value, obj.get("identifier"), problem)))
+            continue
+
+        _, adjacent_obj, adjacent_parents = adjacent
+        pair = [(obj, parents), (adjacent_obj, adjacent_parents)]
+        if not _points_back(adjacent_obj, obj, parents):
+            errors.append(_error(
+                RECIPROCAL_CODE, "Non-Reciprocal Adjacency", element_type, pair,
+                '{} "{}" is adjacent to "{}" but the boundary condition of "{}" '
+                'does not point back at "{}".'.format(
+                    element_type.value, obj.get("identifier"),
+                    adjacent_obj.get("identifier"), adjacent_obj.get("identifier"),
+                    obj.get("identifier"))))
+            continue
+
+        # each reciprocal pair is compared once
+        key = frozenset((id(obj), id(adjacent_obj)))
+        if key in checked:
+            continue
+        checked.add(key)
+        area, adjacent_area = _area(obj, index), _area(adjacent_obj, index)
+        if area is not None and adjacent_area is not None and \
+                abs(area - adjacent_area) > tolerance:
+            errors.append(_error(
+                AREA_CODE, "Mismatched Area Adjacency", element_type, pair,
+                '{} "{}" has an area of {} but the adjacent "{}" has an area of {}, '
+                "which differ by more than the tolerance of {}.".format(
+                    element_type.value, obj.get("identifier"), area,
+                    adjacent_obj.get("identifier"), adjacent_area, tolerance)))
+        if element_type is ObjectTypes.face:
+            for key in ("apertures", "doors"):
+                count, adjacent_count = _count(obj, key), _count(adjacent_obj, key)
+                if count != adjacent_count:
+                    errors.append(_error(
+                        SUB_FACE_CODE, "Mismatched Sub-Face Adjacency", element_type,
+                        pair, 'Face "{}" has {} {} but the adjacent Face "{}" has '
+                        "{}.".format(obj.get("identifier"), count, key,
+                                     adjacent_obj.get("identifier"), adjacent_count)))
+
+    for identifier, group in objects.items():
+        if len(group) > 1 and (identifier in referenced or
+                               any(_is_surface(obj) for _, obj, _ in group)):
+            errors.append(_error(
+                DUPLICATE_CODE, "Duplicate Adjacency Identifier", group[0][0],
+                [(obj, parents) for _, obj, parents in group],
+                '{} objects share the identifier "{}", which makes their '
+                "Surface boundary conditions ambiguous.".format(len(group), identifier)))
+    return errors
+
+
+def check_adjacency(model_dict, tolerance=None, index=None):
+    """Check the consistency of the Surface boundary conditions of a Model.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        tolerance: The maximum difference between the areas of adjacent objects.
+            If None, the tolerance of the Model is used.
+        index: An optional SpatialIndex of the Model from which the areas of
+            adjacent objects are read. If None, they are computed.
+
+    Returns:
+        A ValidationReport with a ValidationError for each inconsistent
+        Surface boundary condition or pair of adjacent objects.
+    """
+    return validation_report(adjacency_errors(model_dict, tolerance, index))
+
+
+def _missing_problem(element_type, bc_objects, adjacent):
+    """Get text for what is wrong with the identifiers of a Surface boundary condition.
+
+    Returns an empty string if the identifiers name an object of the same type
+    with the listed parents.
+    """
+    length = _SURFACE_LENGTHS[element_type]
+    if len(bc_objects) != length:
+        return "{} identifiers instead of {}".format(len(bc_objects), length)
+    if adjacent is None:
+        return 'an adjacent object "{}" that is not in the Model'.format(bc_objects[0])
+    adjacent_type, _, adjacent_parents = adjacent
+    if adjacent_type is not element_type:
+        return 'an adjacent object "{}" that is a {}'.format(
+            bc_objects[0], adjacent_type.value)
+    parent_ids = [parent.get("identifier") for _, parent in adjacent_parents]
+    if parent_ids != bc_objects[1:]:
+        return 'parents {} but the parents of "{}" are {}'.format(
+            bc_objects[1:], bc_objects[0], parent_ids)
+    return ""
+
+
+def _is_surface(obj):
+    """Check whether an object has a Surface boundary condition."""
+    bc = obj.get("boundary_condition")
+    return isinstance(bc, dict) and bc.get("type") == "Surface"
+
+
+def _points_back(adjacent_obj, obj, parents):
+    """Check whether the Surface boundary condition of an object names another one."""
+    if not _is_surface(adjacent_obj):
+        return False
+    expected = [obj.get("identifier")] + [parent.get("identifier") for _, parent in parents]
+    bc_objects = adjacent_obj["boundary_condition"].get("boundary_condition_objects")
+    return bc_objects == expected
+
+
+def _area(obj, index=None):
+    """Get the area of the Face3D of an object or None if it has no valid Face3D."""
+    i = None if index is None else index.index_of(obj)
+    if i is not None:
+        return index.entries[i].area
+    loops = face_loops(obj.get("geometry"))
+    return None if loops is None else face_area(loops)
+
+
+def _count(face, key):
+    """Get the number of objects in a list of sub-faces of a Face."""
+    items = face.get(key)
+    return len(items) if isinstance(items, list) else 0
+
+
+def _error(code, error_type, element_type, objects, message):
+    """Get a ValidationError for one object or a pair of adjacent objects.
+
+    Args:
+        objects: A list of (object, parents) tuples for the objects that
+            caused the error.
+    """
+    return ValidationError(
+        code=code,
+        error_type=error_type,
+        extension_type=ExtensionTypes.core,
+        element_type=element_type,
+        element_id=[
+            element_id(obj.get("identifier"), element_type.value, "?")
+            for obj, _ in objects
+        ],
+        element_name=[
+            obj.get("display_name") or obj.get("identifier") for obj, _ in objects
+        ],
+        message=message,
+        parents=[validation_parents(parents) for _, parents in objects],
+    )
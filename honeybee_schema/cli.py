@@ -7,12 +7,14 @@ except ImportError:
         'click module is not installed. Try `pip install honeybee-schema[cli]` command.'
     )
 
+import os
 import sys
+import glob
+import time
 import logging
 import json
-import importlib
-from inspect import getmembers, isfunction
-import pkgutil
+import stat
+import tempfile
 
 from honeybee_schema import updater
 
@@ -72,37 +74,13 @@ def update_model(model_json, version, output_file):
             # let's consider exporting the same file as success
             sys.exit(0)
 
-        # get functions with a higher version than model_version
-        updaters = []
-
-        for sub_module in pkgutil.walk_packages(updater.__path__):
-            if not sub_module.name.startswith('version_'):
-                continue
-            module = importlib.import_module(f'honeybee_schema.updater.{sub_module.name}')
-            for name, func in getmembers(module, isfunction):
-                if not name.startswith('version_'):
-                    continue
-                func_version = tuple(int(v) for v in name.split('_')[1:])
-                if model_version > func_version or func_version > up_version:
-                    continue
-                updaters.append((func_version, func))
-
-        # sort updaters based on version
-        updaters = sorted(updaters, key=lambda x: x[0])
-
-        # update the dictionary
-        for func_version, up_func in updaters:
+        # update the dictionary with all migrations fused into a single pass
+        for migration in updater.select_migrations(model_version, version):
             print(
-                f'Updating to version {".".join(map(str, func_version))}',
+                f'Updating to version {".".join(map(str, migration.version))}',
                 file=sys.stderr
             )
-            model_dict = up_func(model_dict)
-
-        # update the model dictionary version and write it to log file
-        if version:
-            model_dict['version'] = version
-        elif updaters:
-            model_dict['version'] = '.'.join((str(i) for i in updaters[-1][0]))
+        model_dict = updater.upgrade(model_dict, to=version)
         output_file.write(json.dumps(model_dict))
     except Exception as e:
         _logger.exception('Failed to update Honeybee Model JSON.\n{}'.format(e))
@@ -111,5 +89,226 @@ def update_model(model_json, version, output_file):
         sys.exit(0)
 
 
+@main.command('validate-model')
+@click.argument('model-json', type=click.Path(
+    exists=True, file_okay=True, dir_okay=False, resolve_path=True))
+@click.option('--processes', '-p', help='An integer for the number of worker '
+              'processes used to validate the Rooms and resources of the Model. '
+              'If unspecified, it will be the number of CPUs on the machine.',
+              type=int, default=None)
+@click.option('--chunk-size', '-c', help='An integer for the maximum number of '
+              'Rooms or resources that a worker validates in one task.',
+              type=int, default=100, show_default=True)
+@click.option('--incremental/--full', help='Flag to note whether the '
+              'outcome of each Room, orphaned object and resource should be cached '
+              'in the schema cache folder such that only the elements that changed '
+              'since the last run are validated again. Incremental validation runs '
+              'in a single process.', default=False, show_default=True)
+@click.option('--output-file', help='Optional file to output the JSON string of '
+              'the ValidationReport. By default, it will be printed out to stdout',
+              type=click.File('w'), default='-', show_default=True)
+def validate_model(model_json, processes, chunk_size, incremental, output_file):
+    """Validate a Honeybee Model JSON against the schema using several processes.
+
+    The Rooms, orphaned objects and extension resources of the Model are split
+    into chunks that are validated in parallel and the result is written
+    as a ValidationReport JSON. With --incremental, the elements with an outcome
+    cached by an earlier run are not validated again.
+
+    \b
+    Args:
+        model_json: Full path to a Model JSON file.
+    """
+    try:
+        from honeybee_schema.parallel import validate_model_parallel
+        from honeybee_schema.schemacache import cache_folder, load_cache
+        load_cache()
+        with open(model_json) as json_file:
+            model_dict = json.load(json_file)
+        if incremental:
+            from honeybee_schema.incremental import (
+                ValidationCache, validate_model_incremental)
+            cache = ValidationCache(folder=cache_folder())
+            report = validate_model_incremental(model_dict, cache)
+            cache.save()
+        else:
+            report = validate_model_parallel(model_dict, processes, chunk_size)
+        output_file.write(report.model_dump_json(exclude_none=True))
+    except Exception as e:
+        _logger.exception('Failed to validate Honeybee Model JSON.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
+@main.command('update-models')
+@click.argument('models', nargs=-1, required=True)
+@click.option('--version', '-v', help='Text to indicate the version to which the model '
+              'JSONs will be updated (eg. 1.41.2). Versions must always consist of '
+              'three integers separated b periods. If None, the Model JSONs will '
+              'be updated to the last release that included a breaking change.',
+              type=str, default=None)
+@click.option('--output-folder', '-o', help='Optional folder into which the updated '
+              'Model JSONs will be written, keeping their paths relative to the '
+              'input folder. The input files must then share a root folder (eg. be '
+              'on the same drive). By default, each input file is replaced.',
+              type=click.Path(file_okay=False, dir_okay=True, resolve_path=True),
+              default=None)
+@click.option('--processes', '-p', help='An integer for the number of worker '
+              'processes used to update the files. If unspecified, it will be the '
+              'number of CPUs on the machine.', type=int, default=None)
+def update_models(models, version, output_folder, processes):
+    """Update many Honeybee Model JSONs to a newer version of honeybee-schema.
+
+    The files are spread over a pool of worker processes. Each updated file is
+    written to a temporary file that then replaces the target such that an
+    interrupted run never leaves a partially-written Model behind. A summary of
+    the run is printed at the end.
+
+    \b
+    Args:
+        models: Any number of Model JSON files, folders (which are searched
+            recursively for .hbjson files) or glob patterns (eg. ./archive/**/*.hbjson).
+    """
+    try:
+        from concurrent.futures import ProcessPoolExecutor
+        model_files = _find_model_files(models)
+        if not model_files:
+            raise ValueError('No Model JSON files were found in: {}'.format(
+                ', '.join(models)))
+        if output_folder is None:
+            output_files = model_files
+        else:
+            try:
+                base_folder = os.path.commonpath(
+                    [os.path.dirname(f) for f in model_files])
+            except ValueError:  # eg. files on different drives on Windows
+                raise click.UsageError(
+                    'The Model JSONs do not share a root folder such that their paths '
+                    'cannot be kept relative to --output-folder. Update the files of '
+                    'each drive separately.')
+            output_files = [os.path.join(output_folder, os.path.relpath(f, base_folder))
+                            for f in model_files]
+        processes = processes or os.cpu_count() or 1
+
+        start = time.perf_counter()
+        args = (model_files, output_files, [version] * len(model_files))
+        if processes == 1 or len(model_files) == 1:
+            results = list(map(_update_model_file, *args))
+        else:
+            chunk_size = max(1, len(model_files) // (processes * 4))
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                results = list(executor.map(
+                    _update_model_file, *args, chunksize=chunk_size))
+        elapsed = time.perf_counter() - start
+
+        failed = [(f, msg) for f, (status, msg) in zip(model_files, results)
+                  if status == 'failed']
+        updated = sum(1 for status, _ in results if status == 'updated')
+        click.echo(
+            f'Processed {len(model_files)} model files in {elapsed:.2f} seconds '
+            f'({len(model_files) / elapsed:.1f} files/s).'
+        )
+        click.echo(
+            f'{updated} updated, {len(model_files) - updated - len(failed)} '
+            f'already up to date, {len(failed)} failed.'
+        )
+        for model_file, msg in failed:
+            click.echo(f'Failed to update {model_file}: {msg}', err=True)
+    except click.ClickException:
+        raise
+    except Exception as e:
+        _logger.exception('Failed to update Honeybee Model JSONs.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(1 if failed else 0)
+
+
+@main.command('build-schema-cache')
+@click.option('--folder', '-f', help='Optional folder into which the cache file will '
+              'be written. By default, it is the folder in the HONEYBEE_SCHEMA_CACHE '
+              'environment variable or ~/.cache/honeybee_schema.',
+              type=click.Path(file_okay=False, dir_okay=True, resolve_path=True),
+              default=None)
+def build_schema_cache(folder):
+    """Build the validators of the schema objects and cache them on disk.
+
+    Processes that load the cache (eg. the validate-model command) can validate
+    their first Model without generating the validators of every schema object.
+    The cache is specific to the installed versions of honeybee-schema and
+    pydantic and it is ignored once either of them changes.
+    """
+    try:
+        from honeybee_schema.schemacache import build_cache
+        click.echo(build_cache(folder))
+    except Exception as e:
+        _logger.exception('Failed to build the schema cache.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
+def _find_model_files(models):
+    """Get a sorted list of unique Model JSON files from paths, folders and globs."""
+    model_files = set()
+    for model in models:
+        if os.path.isdir(model):
+            pattern = os.path.join(model, '**', '*.hbjson')
+            model_files.update(glob.glob(pattern, recursive=True))
+        elif os.path.isfile(model):
+            model_files.add(model)
+        else:
+            model_files.update(
+                f for f in glob.glob(model, recursive=True) if os.path.isfile(f))
+    return sorted(os.path.abspath(f) for f in model_files)
+
+
+def _update_model_file(model_json, output_json, version):
+    """Update a single Model JSON file and write it atomically to output_json.
+
+    Returns:
+        A tuple of the status (updated, skipped or failed) and a message.
+    """
+    try:
+        with open(model_json) as json_file:
+            model_dict = json.load(json_file)
+        original_version = model_dict.get('version')
+        model_dict = updater.upgrade(model_dict, to=version)
+        if model_dict['version'] != original_version:
+            status = 'updated'
+        else:
+            status = 'skipped'
+            if output_json == model_json:
+                return status, ''
+        _write_atomic(output_json, json.dumps(model_dict))
+        return status, ''
+    except Exception as e:
+        return 'failed', str(e) or type(e).__name__
+
+
+def _write_atomic(file_path, content):
+    """Write text to a file through a temporary file that then replaces the target.
+
+    The file keeps the permissions of the target it replaces. New files are
+    readable by everyone and writable by the owner.
+    """
+    folder = os.path.dirname(file_path)
+    os.makedirs(folder, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, temp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as temp_file:
+            temp_file.write(content)
+        # mkstemp creates the file readable only by the owner
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
 if __name__ == "__main__":
     main()
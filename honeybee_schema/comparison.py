@@ -1,10 +1,12 @@
 """Schema for the comparison object returned by the comparison command"""
 
-from pydantic import StringConstraints, BaseModel, Field
+from pydantic import StringConstraints, Field
 from typing import List
 from enum import Enum
 from typing_extensions import Annotated
 
+from ._base import DeferredBaseModel
+
 
 class GeometryObjectTypes(str, Enum):
     """Types of Honeybee geometry objects."""
@@ -16,7 +18,7 @@ class GeometryObjectTypes(str, Enum):
     room = "Room"
 
 
-class _DiffObjectBase(BaseModel):
+class _DiffObjectBase(DeferredBaseModel):
     element_type: GeometryObjectTypes = Field(
         ..., description="Text for the type of object that has been changed."
     )
@@ -117,7 +119,7 @@ class AddedObject(_DiffObjectBase):
     )
 
 
-class ComparisonReport(BaseModel):
+class ComparisonReport(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^ComparisonReport$")] = "ComparisonReport"
 
     changed_objects: List[ChangedObject] = Field(
@@ -178,7 +180,7 @@ class AddedInstruction(_DiffObjectBase):
     type: Annotated[str, StringConstraints(pattern="^AddedInstruction$")] = "AddedInstruction"
 
 
-class SyncInstructions(BaseModel):
+class SyncInstructions(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^SyncInstructions$")] = "SyncInstructions"
 
     changed_objects: List[ChangedInstruction] = Field(
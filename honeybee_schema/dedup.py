@@ -0,0 +1,143 @@
+"""Remove resources of a Model that only differ from another resource by name.
+
+Models merged from several sources often carry many copies of the same
+material, construction or schedule under different identifiers. Resources are
+compared by a hash of their content without identifier and display_name. All
+but the first resource of each hash are removed and every reference to the
+removed resources is redirected to the one that is kept.
+"""
+
+import json
+from typing import NamedTuple
+
+from .hashing import content_hash
+from .reference import REFERENCE_FIELDS
+
+# energy resource lists that are deduplicated, in the order of their dependencies
+# (constructions reference materials and schedules but schedules only reference
+# type limits, which are not deduplicated)
+DEDUPLICATED_LISTS = ("materials", "schedules", "constructions")
+
+# keys of the Model properties with resources that are never deduplicated
+_SKIPPED_KEYS = ("global_construction_set", "global_modifier_set")
+
+
+class DedupResult(NamedTuple):
+    """The outcome of deduplicating the resources of a Model.
+
+    Properties:
+        renamed: A dictionary with a key for each resource list (eg. schedules)
+            and a dictionary that maps the identifier of each removed resource
+            to the identifier of the resource that replaced it.
+        removed_count: The total number of removed resources, including
+            exact copies that had the same identifier as the resource kept.
+        bytes_saved: The number of bytes by which the removed resources
+            shrink the compact JSON of the Model.
+    """
+
+    renamed: dict
+    removed_count: int
+    bytes_saved: int
+
+
+def deduplicate_resources(model_dict, keys=DEDUPLICATED_LISTS):
+    """Remove duplicated resources of a Model dictionary and redirect their references.
+
+    Materials and schedules are deduplicated before constructions so that
+    constructions which only differed by the names of their materials or
+    schedules are merged too. The references of all objects in the Model are
+    then rewritten in a single traversal.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model, which is edited in place.
+        keys: The names of the resource lists in the Model energy properties
+            to deduplicate. Lists of DEDUPLICATED_LISTS are always processed
+            in its order. (Default: materials, schedules and constructions).
+
+    Returns:
+        A DedupResult with the identifiers of the removed resources.
+    """
+    energy = (model_dict.get("properties") or {}).get("energy") or {}
+    renamed, removed_count, bytes_saved = {}, 0, 0
+    order = {key: i for i, key in enumerate(DEDUPLICATED_LISTS)}
+    for key in sorted(keys, key=lambda k: order.get(k, len(order))):
+        resources = energy.get(key)
+        if not isinstance(resources, list):
+            continue
+        # earlier renames can make resources of this list identical
+        for resource in resources:
+            _rewrite_object(resource, renamed)
+        kept, renames, unique = {}, {}, []
+        for resource in resources:
+            if not isinstance(resource, dict):
+                unique.append(resource)
+                continue
+            original = kept.setdefault(content_hash(resource), resource)
+            if original is resource:
+                unique.append(resource)
+                continue
+            if resource.get("identifier") != original.get("identifier"):
+                renames[resource.get("identifier")] = original.get("identifier")
+            removed_count += 1
+            bytes_saved += _json_size(resource)
+        if len(unique) != len(resources):
+            energy[key] = unique
+        if renames:
+            renamed[key] = renames
+    if renamed:
+        rewrite_references(model_dict, renamed)
+    return DedupResult(renamed, removed_count, bytes_saved)
+
+
+def rewrite_references(model_dict, renamed):
+    """Redirect the references of all objects in a Model dictionary to new identifiers.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model, which is edited in place.
+        renamed: A dictionary with a key for each resource list (eg. schedules)
+            and a dictionary that maps old identifiers to new identifiers.
+
+    Returns:
+        The number of references that were rewritten.
+    """
+    count, stack = 0, [model_dict]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(v for v in value if isinstance(v, (dict, list)))
+            continue
+        count += _rewrite_object(value, renamed)
+        stack.extend(
+            v for k, v in value.items()
+            if isinstance(v, (dict, list)) and k not in _SKIPPED_KEYS
+        )
+    return count
+
+
+def _rewrite_object(obj, renamed):
+    """Redirect the references held directly by one object and count them."""
+    fields = REFERENCE_FIELDS.get(obj.get("type")) if isinstance(obj, dict) else None
+    if not fields:
+        return 0
+    count = 0
+    for field, key in fields.items():
+        renames = renamed.get(key)
+        if not renames:
+            continue
+        value = obj.get(field)
+        if isinstance(value, str):
+            if value in renames:
+                obj[field] = renames[value]
+                count += 1
+        elif isinstance(value, list):
+            new_value = [renames.get(v, v) if isinstance(v, str) else v for v in value]
+            if new_value != value:
+                count += sum(1 for old, new in zip(value, new_value) if old != new)
+                obj[field] = new_value
+    return count
+
+
+def _json_size(obj):
+    """Get the size in bytes of an item in the compact JSON of a list."""
+    # one extra byte for the comma that separates the item from the next one
+    return len(json.dumps(obj, separators=(",", ":")).encode("utf-8")) + 1
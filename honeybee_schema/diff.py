@@ -0,0 +1,209 @@
+"""Compare two Models and report the objects that were changed, added or deleted.
+
+The top-level objects of both Models (Rooms and orphaned Faces, Apertures, Doors
+and Shades) are matched by identifier. Objects that are identical in both Models
+(by their Merkle hashes when these are available) are skipped without looking
+further. For the others, the geometry is compared vertex by vertex within the
+tolerance of the base Model and the energy and radiance properties are compared
+as a whole.
+"""
+
+from itertools import chain
+from operator import eq, sub
+
+from .comparison import AddedObject, ChangedObject, ComparisonReport, DeletedObject
+from ._jsonstream import load_json
+from ._traverse import iter_tree
+from .units import conversion_factor
+
+# top-level lists of the Model that are compared and the type of their objects
+COMPARED_OBJECTS = {
+    "rooms": "Room",
+    "orphaned_faces": "Face",
+    "orphaned_apertures": "Aperture",
+    "orphaned_doors": "Door",
+    "orphaned_shades": "Shade",
+}
+
+# RGBA colors of each type of object in the display geometry
+_COLORS = {
+    "Room": (200, 200, 200, 255),
+    "Face": (200, 200, 200, 255),
+    "Aperture": (64, 180, 255, 128),
+    "Door": (160, 150, 100, 255),
+    "Shade": (120, 75, 190, 255),
+}
+
+
+def compare_models(base_model, new_model, base_hashes=None, new_hashes=None):
+    """Compare a base Model with a new Model.
+
+    Args:
+        base_model: A dictionary of the base Honeybee Model or the path to
+            its JSON file.
+        new_model: A dictionary of the new Honeybee Model or the path to
+            its JSON file. If its units differ from those of the base Model,
+            its geometry is scaled to the base units before it is compared.
+        base_hashes: An optional ModelHashes of the base Model. When both
+            base_hashes and new_hashes are given, objects are matched as
+            unchanged from their hashes, which is fastest when the hashes are
+            reused across several comparisons (eg. of successive revisions).
+            Otherwise, objects are matched as unchanged by comparing their
+            dictionaries directly, which is faster than hashing them once.
+        new_hashes: An optional ModelHashes of the new Model.
+
+    Returns:
+        A ComparisonReport with the changed, added and deleted top-level objects.
+    """
+    base_model, new_model = load_json(base_model), load_json(new_model)
+    tolerance = base_model.get("tolerance", 0.01)
+    scale = conversion_factor(
+        new_model.get("units", "Meters"), base_model.get("units", "Meters"))
+    if base_hashes is not None and new_hashes is not None:
+        def unchanged(base_obj, new_obj):
+            return base_hashes.object_hash(base_obj) == new_hashes.object_hash(new_obj)
+    else:
+        unchanged = eq
+    changed, deleted, added = [], [], []
+    for key, element_type in COMPARED_OBJECTS.items():
+        base_objects = _by_identifier(base_model.get(key))
+        new_objects = _by_identifier(new_model.get(key))
+        for identifier, base_obj in base_objects.items():
+            new_obj = new_objects.get(identifier)
+            if new_obj is None:
+                deleted.append(DeletedObject(
+                    geometry=display_geometry(base_obj),
+                    **_diff_info(element_type, base_obj)))
+                continue
+            if scale == 1 and unchanged(base_obj, new_obj):
+                continue
+            change = compare_objects(base_obj, new_obj, tolerance, scale)
+            if change is not None:
+                changed.append(change)
+        for identifier, new_obj in new_objects.items():
+            if identifier not in base_objects:
+                added.append(AddedObject(
+                    geometry=display_geometry(new_obj, scale),
+                    **_diff_info(element_type, new_obj)))
+    return ComparisonReport(
+        changed_objects=changed, deleted_objects=deleted, added_objects=added)
+
+
+def compare_objects(base_obj, new_obj, tolerance, scale=1.0):
+    """Compare two versions of the same top-level object.
+
+    Args:
+        base_obj: The dictionary of the object in the base Model.
+        new_obj: The dictionary of the object in the new Model.
+        tolerance: The maximum difference between x, y and z values at which
+            vertices are considered equivalent.
+        scale: A number to multiply the coordinates of the new object by to
+            convert them to the units of the base object.
+
+    Returns:
+        A ChangedObject if the geometry, energy or radiance properties changed.
+        None if none of them changed.
+    """
+    base_coords, base_counts = _coordinates(base_obj)
+    new_coords, new_counts = _coordinates(new_obj)
+    if scale != 1:
+        new_coords = [c * scale for c in new_coords]
+    geometry_changed = base_counts != new_counts or \
+        max(map(abs, map(sub, base_coords, new_coords)), default=0) > tolerance
+    base_props = base_obj.get("properties") or {}
+    new_props = new_obj.get("properties") or {}
+    energy_changed = base_props.get("energy") != new_props.get("energy")
+    radiance_changed = base_props.get("radiance") != new_props.get("radiance")
+    if not (geometry_changed or energy_changed or radiance_changed):
+        return None
+    change = ChangedObject(
+        geometry_changed=geometry_changed,
+        energy_changed=energy_changed,
+        radiance_changed=radiance_changed,
+        geometry=display_geometry(new_obj, scale),
+        **_diff_info(_object_type(new_obj), new_obj),
+    )
+    if geometry_changed:
+        change.existing_geometry = display_geometry(base_obj)
+    return change
+
+
+def display_geometry(obj, scale=1.0):
+    """Get a list of DisplayFace3D dictionaries for an object and its children.
+
+    Args:
+        obj: The dictionary of a Room, Face, Aperture, Door or Shade.
+        scale: A number to multiply all coordinates by.
+    """
+    display = []
+    for child in iter_tree(obj):
+        geometry = child.get("geometry")
+        if not isinstance(geometry, dict) or geometry.get("type") != "Face3D":
+            continue
+        if scale != 1:
+            geometry = _scale_face3d(geometry, scale)
+        r, g, b, a = _COLORS.get(child.get("type"), _COLORS["Face"])
+        display.append({
+            "type": "DisplayFace3D",
+            "geometry": geometry,
+            "color": {"type": "Color", "r": r, "g": g, "b": b, "a": a},
+            "display_mode": "Shaded",
+        })
+    return display
+
+
+def _by_identifier(items):
+    """Get a dictionary from identifier to object for the dictionaries in a list."""
+    if not isinstance(items, list):
+        return {}
+    return {item.get("identifier"): item for item in items if isinstance(item, dict)}
+
+
+def _object_type(obj):
+    """Get the GeometryObjectTypes value of an object dictionary."""
+    obj_type = obj.get("type")
+    return obj_type if obj_type in _COLORS else "Shade"
+
+
+def _diff_info(element_type, obj):
+    """Get the element keyword arguments shared by all diff objects."""
+    info = {"element_type": element_type, "element_id": obj.get("identifier")}
+    if obj.get("display_name"):
+        info["element_name"] = obj["display_name"]
+    return info
+
+
+def _coordinates(obj):
+    """Get a flat list of all vertex coordinates of an object and its children.
+
+    Returns:
+        A tuple with the flat list of coordinates and a list with the number of
+        vertices of each boundary and hole, which describes the structure of
+        the geometry.
+    """
+    polygons = []
+    for child in iter_tree(obj):
+        geometry = child.get("geometry")
+        if not isinstance(geometry, dict):
+            continue
+        boundary = geometry.get("boundary")
+        if boundary is not None:
+            polygons.append(boundary)
+        polygons.extend(geometry.get("holes") or ())
+    counts = [len(polygon) for polygon in polygons]
+    coords = list(chain.from_iterable(chain.from_iterable(polygons)))
+    return coords, counts
+
+
+def _scale_face3d(geometry, scale):
+    """Get a copy of a Face3D dictionary with its coordinates multiplied by a scale."""
+    scaled = dict(geometry)
+    scaled["boundary"] = [[c * scale for c in pt] for pt in geometry["boundary"]]
+    if geometry.get("holes"):
+        scaled["holes"] = [
+            [[c * scale for c in pt] for pt in hole] for hole in geometry["holes"]
+        ]
+    if geometry.get("plane"):
+        plane = scaled["plane"] = dict(geometry["plane"])
+        plane["o"] = [c * scale for c in plane["o"]]
+    return scaled
@@ -1,9 +1,9 @@
 """Model energy properties."""
 
 from pydantic import StringConstraints, Field
-from typing import List, Union
+from typing import List
 
-from .._base import NoExtraBaseModel
+from .._base import NoExtraBaseModel, type_union
 from .constructionset import ConstructionSetAbridged, ConstructionSet
 from .global_constructionset import GlobalConstructionSet
 from .construction import (
@@ -346,16 +346,16 @@ class ModelEnergyProperties(NoExtraBaseModel):
         frozen=True,
     )
 
-    construction_sets: List[Union[ConstructionSetAbridged, ConstructionSet]] | None = (
-        Field(
-            default=None,
-            description="List of all unique ConstructionSets in the Model.",
-        )
+    construction_sets: (
+        List[type_union(ConstructionSetAbridged, ConstructionSet)] | None
+    ) = Field(
+        default=None,
+        description="List of all unique ConstructionSets in the Model.",
     )
 
     constructions: (
         List[
-            Union[
+            type_union(
                 OpaqueConstructionAbridged,
                 WindowConstructionAbridged,
                 WindowConstructionShadeAbridged,
@@ -367,7 +367,7 @@ class ModelEnergyProperties(NoExtraBaseModel):
                 WindowConstructionDynamic,
                 AirBoundaryConstruction,
                 ShadeConstruction,
-            ]
+            )
         ]
         | None
     ) = Field(
@@ -379,7 +379,7 @@ class ModelEnergyProperties(NoExtraBaseModel):
 
     materials: (
         List[
-            Union[
+            type_union(
                 EnergyMaterial,
                 EnergyMaterialNoMass,
                 EnergyMaterialVegetation,
@@ -391,7 +391,7 @@ class ModelEnergyProperties(NoExtraBaseModel):
                 EnergyWindowFrame,
                 EnergyWindowMaterialBlind,
                 EnergyWindowMaterialShade,
-            ]
+            )
         ]
         | None
     ) = Field(
@@ -402,7 +402,7 @@ class ModelEnergyProperties(NoExtraBaseModel):
 
     hvacs: (
         List[
-            Union[
+            type_union(
                 IdealAirSystemAbridged,
                 VAV,
                 PVAV,
@@ -423,7 +423,7 @@ class ModelEnergyProperties(NoExtraBaseModel):
                 GasUnitHeater,
                 Radiant,
                 DetailedHVAC,
-            ]
+            )
         ]
         | None
     ) = Field(default=None, description="List of all unique HVAC systems in the Model.")
@@ -433,18 +433,18 @@ class ModelEnergyProperties(NoExtraBaseModel):
         description="List of all unique Service Hot Water (SHW) systems in the Model.",
     )
 
-    program_types: List[Union[ProgramTypeAbridged, ProgramType]] | None = Field(
+    program_types: List[type_union(ProgramTypeAbridged, ProgramType)] | None = Field(
         default=None, description="List of all unique ProgramTypes in the Model."
     )
 
     schedules: (
         List[
-            Union[
+            type_union(
                 ScheduleRulesetAbridged,
                 ScheduleFixedIntervalAbridged,
                 ScheduleRuleset,
                 ScheduleFixedInterval,
-            ]
+            )
         ]
         | None
     ) = Field(
@@ -3,6 +3,7 @@
 from pydantic import (
     Field,
     StringConstraints,
+    field_serializer,
     field_validator,
     model_validator,
 )
@@ -12,6 +13,7 @@ import datetime
 
 from ._base import IDdEnergyBaseModel, DatedBaseModel, EnergyBaseModel
 from ..altnumber import NoLimit
+from ..packed import PackedValues, check_count, is_packed
 from typing_extensions import Annotated
 
 
@@ -344,6 +346,23 @@ class ScheduleFixedIntervalAbridged(IDdEnergyBaseModel):
         "immediately upon the beginning time corresponding to them.",
     )
 
+    @field_validator("values", mode="wrap")
+    @classmethod
+    def pack_values(cls, v, handler, info):
+        """Store the values as PackedValues when packed arrays are requested."""
+        if isinstance(v, PackedValues):
+            return check_count(v, 24, 527040)
+        if is_packed(info):
+            return PackedValues.from_values(v, 24, 527040)
+        return handler(v)
+
+    @field_serializer("values", mode="wrap")
+    def unpack_values(self, v, handler):
+        """Serialize PackedValues as a list of numbers."""
+        if isinstance(v, PackedValues):
+            return v.to_list()
+        return handler(v)
+
     @model_validator(mode="after")
     def check_number_of_values(self):
         "Ensure an acceptable number of schedule values."
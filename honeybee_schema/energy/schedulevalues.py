@@ -0,0 +1,318 @@
+"""Evaluate ScheduleRulesets into annual series of values.
+
+A ScheduleRuleset is compiled once into an array that maps each day of the year
+to one of its ScheduleDays and an array of values at the timestep for each
+ScheduleDay. The annual series is then assembled by joining the values of each
+day rather than evaluating the rules and the times of every day in Python.
+
+Compiled rulesets are cached by the content that affects their values such that
+rulesets with identical days and rules (eg. copies with different identifiers)
+are compiled only once.
+"""
+
+import json
+import datetime
+from array import array
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+DAYS_OF_WEEK = (
+    "Sunday",
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+)
+_APPLY_KEYS = tuple("apply_{}".format(day.lower()) for day in DAYS_OF_WEEK)
+
+# keys of a ScheduleRuleset that affect its values
+_CONTENT_KEYS = (
+    "day_schedules",
+    "default_day_schedule",
+    "schedule_rules",
+    "holiday_schedule",
+    "summer_designday_schedule",
+    "winter_designday_schedule",
+)
+
+VALID_TIMESTEPS = (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60)
+
+
+class CompiledRuleset:
+    """A ScheduleRuleset compiled for the fast evaluation of its values.
+
+    Args:
+        ruleset: A dictionary of a ScheduleRuleset or ScheduleRulesetAbridged.
+
+    Properties:
+        * day_schedules
+        * default_index
+        * holiday_index
+        * summer_designday_index
+        * winter_designday_index
+        * rules
+    """
+
+    def __init__(self, ruleset):
+        days = ruleset["day_schedules"]
+        self.day_schedules = tuple(day["identifier"] for day in days)
+        self._days = tuple(days)
+        self.default_index = self._day_index(ruleset["default_day_schedule"])
+        self.holiday_index = self._day_index(ruleset.get("holiday_schedule"))
+        self.summer_designday_index = self._day_index(
+            ruleset.get("summer_designday_schedule")
+        )
+        self.winter_designday_index = self._day_index(
+            ruleset.get("winter_designday_schedule")
+        )
+        self.rules = tuple(
+            (
+                self._day_index(rule["schedule_day"]),
+                tuple(rule.get(key, False) for key in _APPLY_KEYS),
+                tuple(rule.get("start_date", (1, 1))[:2]),
+                tuple(rule.get("end_date", (12, 31))[:2]),
+            )
+            for rule in ruleset.get("schedule_rules") or ()
+        )
+        self._day_values = {}
+        self._indices = {}
+
+    def day_indices(self, leap_year=False, start_day_of_week="Sunday", holidays=None):
+        """Get the index of the ScheduleDay that applies to each day of the year.
+
+        Args:
+            leap_year: Boolean to note whether the year has 366 days.
+            start_day_of_week: Text for the day of the week on January 1st.
+            holidays: An optional list of (month, day) pairs for the holidays
+                of the year. Holidays use the holiday_schedule (or the
+                default_day_schedule if there is none) over any rule.
+
+        Returns:
+            An array of integers with one index into day_schedules for each
+            day of the year.
+        """
+        day_count = 366 if leap_year else 365
+        first_dow = _day_of_week(start_day_of_week)
+        indices = array("H", [self.default_index]) * day_count
+        # apply the rules from lowest to highest priority so that the latter win
+        for day_index, apply_days, start_date, end_date in reversed(self.rules):
+            start = _day_of_year(start_date, leap_year)
+            end = _day_of_year(end_date, leap_year)
+            periods = ((start, end),) if start <= end else \
+                ((start, day_count - 1), (0, end))
+            for dow, apply_day in enumerate(apply_days):
+                if not apply_day:
+                    continue
+                for period_start, period_end in periods:
+                    first = period_start + (dow - first_dow - period_start) % 7
+                    days = slice(first, period_end + 1, 7)
+                    count = len(range(*days.indices(day_count)))
+                    if count:
+                        indices[days] = array("H", [day_index]) * count
+        if holidays:
+            holiday_index = self.default_index if self.holiday_index is None \
+                else self.holiday_index
+            for month, day in holidays:
+                indices[_day_of_year((month, day), leap_year)] = holiday_index
+        return indices
+
+    def day_values(self, index, timestep=1):
+        """Get the values of one of the ScheduleDays at a given timestep.
+
+        Args:
+            index: The index of the ScheduleDay in day_schedules.
+            timestep: An integer for the number of values per hour.
+
+        Returns:
+            An array of 24 * timestep floats for the values of the ScheduleDay.
+        """
+        return array("d", self._day_bytes(timestep)[index])
+
+    def values(
+        self, timestep=1, leap_year=False, start_day_of_week="Sunday", holidays=None
+    ):
+        """Get the values of the ruleset for every timestep of a year.
+
+        Args:
+            timestep: An integer for the number of values per hour.
+            leap_year: Boolean to note whether the year has 366 days.
+            start_day_of_week: Text for the day of the week on January 1st.
+            holidays: An optional list of (month, day) pairs for the holidays.
+
+        Returns:
+            An array of 8760 * timestep floats (8784 * timestep for a leap year).
+        """
+        holidays = tuple(tuple(date[:2]) for date in holidays) if holidays else ()
+        key = (bool(leap_year), start_day_of_week, holidays)
+        try:
+            indices = self._indices[key]
+        except KeyError:
+            indices = self._indices[key] = self.day_indices(*key)
+        day_bytes = self._day_bytes(timestep)
+        values = array("d")
+        values.frombytes(b"".join([day_bytes[i] for i in indices]))
+        return values
+
+    def design_day_values(self, design_day, timestep=1):
+        """Get the values of the summer or winter design day at a given timestep.
+
+        Args:
+            design_day: Text for the design day. Either summer or winter. If
+                the ruleset has no schedule for the design day, the values of
+                the default_day_schedule are returned.
+            timestep: An integer for the number of values per hour.
+        """
+        if design_day == "summer":
+            index = self.summer_designday_index
+        elif design_day == "winter":
+            index = self.winter_designday_index
+        else:
+            raise ValueError(
+                "Design day must be summer or winter. Got {!r}.".format(design_day)
+            )
+        return self.day_values(
+            self.default_index if index is None else index, timestep
+        )
+
+    def _day_index(self, identifier):
+        """Get the index of a ScheduleDay from its identifier."""
+        if identifier is None:
+            return None
+        try:
+            return self.day_schedules.index(identifier)
+        except ValueError:
+            raise ValueError(
+                "ScheduleDay {!r} is not in the day_schedules.".format(identifier)
+            ) from None
+
+    def _day_bytes(self, timestep):
+        """Get the bytes of the values of each ScheduleDay at a timestep."""
+        try:
+            return self._day_values[timestep]
+        except KeyError:
+            day_bytes = self._day_values[timestep] = tuple(
+                schedule_day_values(day, timestep).tobytes() for day in self._days
+            )
+            return day_bytes
+
+
+def schedule_day_values(schedule_day, timestep=1):
+    """Get the values of a ScheduleDay at each timestep of the day.
+
+    The value of each timestep is the value in effect at the start of the
+    timestep. If the ScheduleDay interpolates, values are linearly interpolated
+    between successive times and the last value is held until the end of the day.
+
+    Args:
+        schedule_day: A ScheduleDay object or a dictionary of a ScheduleDay.
+        timestep: An integer for the number of values per hour.
+
+    Returns:
+        An array of 24 * timestep floats.
+    """
+    if timestep not in VALID_TIMESTEPS:
+        raise ValueError(
+            '"{}" is not a valid timestep. Choose from {}'.format(
+                timestep, VALID_TIMESTEPS
+            )
+        )
+    if isinstance(schedule_day, BaseModel):
+        schedule_day = schedule_day.model_dump()
+    step_count = 24 * timestep
+    step_minutes = 60 // timestep
+    day_values = schedule_day["values"]
+    # the first step of each value as the first step starting at or after its time
+    steps = [
+        min(-(-(hour * 60 + minute) // step_minutes), step_count)
+        for hour, minute in schedule_day.get("times", [[0, 0]])
+    ]
+    steps[0] = 0
+    steps.append(step_count)
+    values = array("d")
+    if not schedule_day.get("interpolate"):
+        for value, start, end in zip(day_values, steps, steps[1:]):
+            values.extend(array("d", [value]) * (end - start))
+        return values
+    minutes = [hour * 60 + minute for hour, minute in schedule_day["times"]]
+    for i, (start, end) in enumerate(zip(steps, steps[1:])):
+        if i + 1 == len(day_values):
+            values.extend(array("d", [day_values[i]]) * (end - start))
+            break
+        t_0, t_1 = minutes[i], minutes[i + 1]
+        v_0, v_1 = day_values[i], day_values[i + 1]
+        slope = (v_1 - v_0) / (t_1 - t_0) if t_1 != t_0 else 0
+        values.extend(
+            v_0 + slope * (step * step_minutes - t_0) for step in range(start, end)
+        )
+    return values
+
+
+def compile_ruleset(ruleset):
+    """Compile a ScheduleRuleset, reusing a previous compilation of identical content.
+
+    Args:
+        ruleset: A ScheduleRuleset or ScheduleRulesetAbridged object or a
+            dictionary of one.
+
+    Returns:
+        A CompiledRuleset. Rulesets with the same days and rules share the
+        same CompiledRuleset regardless of their identifiers.
+    """
+    if isinstance(ruleset, BaseModel):
+        ruleset = ruleset.model_dump(include=set(_CONTENT_KEYS), exclude_none=True)
+    content = {key: ruleset[key] for key in _CONTENT_KEYS if ruleset.get(key)}
+    return _compile(json.dumps(content, sort_keys=True))
+
+
+def annual_values(
+    ruleset, timestep=1, leap_year=False, start_day_of_week="Sunday", holidays=None
+):
+    """Get the values of a ScheduleRuleset for every timestep of a year.
+
+    Args:
+        ruleset: A ScheduleRuleset or ScheduleRulesetAbridged object or a
+            dictionary of one.
+        timestep: An integer for the number of values per hour.
+        leap_year: Boolean to note whether the year has 366 days.
+        start_day_of_week: Text for the day of the week on January 1st.
+        holidays: An optional list of (month, day) pairs for the holidays.
+
+    Returns:
+        An array of 8760 * timestep floats (8784 * timestep for a leap year).
+    """
+    return compile_ruleset(ruleset).values(
+        timestep, leap_year, start_day_of_week, holidays
+    )
+
+
+@lru_cache(maxsize=4096)
+def _compile(content):
+    """Compile the JSON text of the content of a ScheduleRuleset."""
+    return CompiledRuleset(json.loads(content))
+
+
+def _day_of_week(day_name):
+    """Get the index of a day of the week with Sunday as 0."""
+    try:
+        return DAYS_OF_WEEK.index(day_name)
+    except ValueError:
+        raise ValueError(
+            "{!r} is not a day of the week. Choose from: {}".format(
+                day_name, ", ".join(DAYS_OF_WEEK)
+            )
+        ) from None
+
+
+def _day_of_year(date, leap_year):
+    """Get the 0-based day of the year for a (month, day) date.
+
+    Like in honeybee-energy, Feb 29 is clamped to Feb 28 in a year that is not
+    a leap year such that a rule ending on Feb 29 does not cover Mar 1.
+    """
+    year, month, day = 2016 if leap_year else 2017, date[0], date[1]
+    if not leap_year and (month, day) == (2, 29):
+        day = 28
+    return datetime.date(year, month, day).timetuple().tm_yday - 1
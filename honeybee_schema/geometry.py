@@ -1,7 +1,8 @@
 """Geometry objects for model."""
-from pydantic import StringConstraints, Field
+from pydantic import StringConstraints, Field, field_validator, field_serializer
 from typing import List
 from ._base import NoExtraBaseModel
+from .packed import PackedPoints, PackedFaces, check_count, is_packed, unpack
 from typing_extensions import Annotated
 
 
@@ -99,6 +100,31 @@ class Face3D(NoExtraBaseModel):
         'If None, the plane will usually be derived from the boundary points.'
     )
 
+    @field_validator('boundary', mode='wrap')
+    @classmethod
+    def pack_boundary(cls, v, handler, info):
+        """Store the boundary as PackedPoints when packed arrays are requested."""
+        if isinstance(v, PackedPoints):
+            return check_count(v, 3)
+        if is_packed(info):
+            return PackedPoints.from_points(v, 3)
+        return handler(v)
+
+    @field_validator('holes', mode='wrap')
+    @classmethod
+    def pack_holes(cls, v, handler, info):
+        """Store each hole as PackedPoints when packed arrays are requested."""
+        if v is not None and is_packed(info):
+            if not isinstance(v, list):
+                raise ValueError('Holes must be a list of lists of points.')
+            return [check_count(h, 3) if isinstance(h, PackedPoints)
+                    else PackedPoints.from_points(h, 3) for h in v]
+        return handler(v)
+
+    @field_serializer('boundary', 'holes', mode='wrap')
+    def unpack_points(self, v, handler):
+        return handler(unpack(v))
+
 
 class Color(NoExtraBaseModel):
     """A RGB color."""
@@ -160,3 +186,27 @@ class Mesh3D(NoExtraBaseModel):
         description='An optional list of colors that correspond to either the faces '
         'of the mesh or the vertices of the mesh.'
     )
+
+    @field_validator('vertices', mode='wrap')
+    @classmethod
+    def pack_vertices(cls, v, handler, info):
+        """Store the vertices as PackedPoints when packed arrays are requested."""
+        if isinstance(v, PackedPoints):
+            return check_count(v, 3)
+        if is_packed(info):
+            return PackedPoints.from_points(v, 3)
+        return handler(v)
+
+    @field_validator('faces', mode='wrap')
+    @classmethod
+    def pack_faces(cls, v, handler, info):
+        """Store the faces as PackedFaces when packed arrays are requested."""
+        if isinstance(v, PackedFaces):
+            return check_count(v, 1)
+        if is_packed(info):
+            return PackedFaces.from_faces(v, 1)
+        return handler(v)
+
+    @field_serializer('vertices', 'faces', mode='wrap')
+    def unpack_mesh(self, v, handler):
+        return handler(unpack(v))
@@ -0,0 +1,338 @@
+"""Check the Face3D geometry of a Model for conditions that the schema cannot catch.
+
+The schema only checks that each Face3D has at least three vertices of three
+values each. The checks here test every Face3D of a Model (of Faces, Apertures,
+Doors and Shades) for duplicated vertices and zero area, for vertices out of the
+plane of the face and for boundaries and holes that intersect themselves or
+each other. The faces of each Room are tested for a closed volume, where every
+edge is shared by exactly two faces. All tests use the tolerance of the Model.
+
+Each error carries helper_geometry that locates the problem: Point3Ds for
+duplicated, out-of-plane and intersection vertices and LineSegment3Ds for the
+naked and non-manifold edges of Rooms.
+"""
+
+import math
+from itertools import chain, compress
+from operator import mul, sub
+
+from .geometry import LineSegment3D, Point3D
+from .validation import ExtensionTypes, ObjectTypes, ValidationError
+from ._geometry import face_loops, face_normal, model_tolerances
+from ._report import element_id, validation_parents, validation_report
+from ._traverse import iter_objects
+
+# error codes for invalid geometry, following those of honeybee-core
+NON_PLANAR_CODE = "000101"
+SELF_INTERSECTING_CODE = "000102"
+DEGENERATE_CODE = "000103"
+NON_SOLID_CODE = "000106"
+
+
+def geometry_errors(model_dict, tolerance=None):
+    """Get ValidationErrors for the invalid Face3D and Room geometry of a Model.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        tolerance: The maximum difference between values at which vertices are
+            considered equivalent. If None, the tolerance of the Model is used.
+
+    Returns:
+        A list of ValidationErrors with one error for each object and type of
+        problem, each with the helper_geometry that locates the problem.
+    """
+    tolerance, _ = model_tolerances(model_dict, tolerance)
+    errors = []
+    for element_type, obj, parents in iter_objects(model_dict):
+        loops = face_loops(obj.get("geometry"))
+        if loops is not None:
+            errors.extend(face_errors(obj, element_type, parents, loops, tolerance))
+        if element_type is ObjectTypes.room:
+            errors.extend(room_errors(obj, tolerance))
+    return errors
+
+
+def check_geometry(model_dict, tolerance=None):
+    """Check the Face3D geometry and the closed volume of all Rooms of a Model.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        tolerance: The maximum difference between values at which vertices are
+            considered equivalent. If None, the tolerance of the Model is used.
+
+    Returns:
+        A ValidationReport with a ValidationError for each degenerate,
+        non-planar or self-intersecting geometry and each Room that is not
+        a closed volume.
+    """
+    return validation_report(geometry_errors(model_dict, tolerance))
+
+
+def face_errors(obj, element_type, parents, loops, tolerance):
+    """Get the ValidationErrors for the Face3D of one geometry object.
+
+    Args:
+        obj: The dictionary of a Face, Aperture, Door or Shade.
+        element_type: The ObjectTypes of the object.
+        parents: The parents of the object as yielded by iter_objects.
+        loops: A list with the boundary followed by the holes of the Face3D,
+            each as a tuple of the lists of x, y and z values of its vertices.
+        tolerance: The maximum difference between values at which vertices are
+            considered equivalent.
+    """
+    errors = []
+    duplicates = list(chain.from_iterable(
+        _duplicate_vertices(loop, tolerance) for loop in loops))
+    normal = face_normal(obj["geometry"], loops[0])
+    area = math.sqrt(sum(map(mul, normal, normal))) / 2
+    if duplicates or area <= tolerance * tolerance:
+        detail = "{} duplicated vertices".format(len(duplicates)) if duplicates \
+            else "an area of {}".format(area)
+        errors.append(_error(
+            obj, element_type, parents, DEGENERATE_CODE, "Degenerate Geometry",
+            'The geometry of {} "{}" is degenerate. It has {} at a tolerance '
+            "of {}.".format(element_type.value, obj.get("identifier"), detail, tolerance),
+            [_point(pt) for pt in duplicates]))
+    if area <= tolerance * tolerance:
+        return errors  # the plane of a face without area is meaningless
+
+    length = math.sqrt(sum(map(mul, normal, normal)))
+    normal = [n / length for n in normal]
+    origin = _origin(obj["geometry"], loops[0])
+    out_of_plane, max_distance = [], 0
+    for xs, ys, zs in loops:
+        distances = _plane_distances(xs, ys, zs, normal, origin)
+        far = [abs(d) > tolerance for d in distances]
+        if any(far):
+            max_distance = max(max_distance, max(map(abs, distances)))
+            out_of_plane.extend(compress(zip(xs, ys, zs), far))
+    if out_of_plane:
+        errors.append(_error(
+            obj, element_type, parents, NON_PLANAR_CODE, "Non-Planar Geometry",
+            'The geometry of {} "{}" is not planar. {} vertices are up to {} away '
+            "from its plane at a tolerance of {}.".format(
+                element_type.value, obj.get("identifier"), len(out_of_plane),
+                max_distance, tolerance),
+            [_point(pt) for pt in out_of_plane]))
+
+    # duplicated vertices make adjacent edges overlap, which is reported above
+    intersections = [] if duplicates else _intersections(loops, normal, tolerance)
+    if intersections:
+        errors.append(_error(
+            obj, element_type, parents, SELF_INTERSECTING_CODE,
+            "Self-Intersecting Geometry",
+            'The geometry of {} "{}" intersects itself at {} points.'.format(
+                element_type.value, obj.get("identifier"), len(intersections)),
+            [_point(pt) for pt in intersections]))
+    return errors
+
+
+def room_errors(room, tolerance):
+    """Get the ValidationErrors for a Room whose faces do not form a closed volume.
+
+    Vertices of the faces within the tolerance of one another are merged and
+    the edges are counted. Edges of one face that run along several collinear
+    edges of another face (eg. at a T-junction) are matched too.
+
+    Args:
+        room: The dictionary of a Room.
+        tolerance: The maximum difference between values at which vertices are
+            considered equivalent.
+    """
+    vertices = _VertexIndex(tolerance)
+    edges = {}
+    for face in room.get("faces") or ():
+        loops = face_loops(face.get("geometry")) if isinstance(face, dict) else None
+        for xs, ys, zs in loops or ():
+            ids = [vertices.index(pt) for pt in zip(xs, ys, zs)]
+            for a, b in zip(ids, ids[1:] + ids[:1]):
+                if a != b:
+                    edge = (a, b) if a < b else (b, a)
+                    edges[edge] = edges.get(edge, 0) + 1
+    naked = [edge for edge, count in edges.items() if count == 1]
+    if naked:
+        naked = _unmatched_edges(naked, vertices.points, tolerance)
+    non_manifold = [edge for edge, count in edges.items() if count > 2]
+    if not naked and not non_manifold:
+        return []
+    points = vertices.points
+    segments = [_segment(points[a], points[b]) for a, b in naked + non_manifold]
+    return [_error(
+        room, ObjectTypes.room, (), NON_SOLID_CODE, "Non-Solid Room Geometry",
+        'Room "{}" is not a closed volume. It has {} naked edges and {} '
+        "non-manifold edges at a tolerance of {}.".format(
+            room.get("identifier"), len(naked), len(non_manifold), tolerance),
+        segments)]
+
+
+class _VertexIndex:
+    """Merge vertices within a tolerance into indices through a grid of cells."""
+
+    def __init__(self, tolerance):
+        self.tolerance = tolerance
+        self.points = []
+        self._exact = {}
+        self._cells = {}
+
+    def index(self, pt):
+        """Get the index of the merged vertex for a point."""
+        try:
+            return self._exact[pt]
+        except KeyError:
+            pass
+        tol = self.tolerance
+        cx, cy, cz = (math.floor(c / tol) for c in pt)
+        for dx in (0, -1, 1):
+            for dy in (0, -1, 1):
+                for dz in (0, -1, 1):
+                    for i in self._cells.get((cx + dx, cy + dy, cz + dz), ()):
+                        other = self.points[i]
+                        if abs(other[0] - pt[0]) <= tol and \
+                                abs(other[1] - pt[1]) <= tol and \
+                                abs(other[2] - pt[2]) <= tol:
+                            self._exact[pt] = i
+                            return i
+        i = self._exact[pt] = len(self.points)
+        self.points.append(pt)
+        self._cells.setdefault((cx, cy, cz), []).append(i)
+        return i
+
+
+def _duplicate_vertices(loop, tolerance):
+    """Get the vertices of a loop that are equivalent to the vertex before them."""
+    xs, ys, zs = loop
+    same = [
+        abs(dx) <= tolerance and abs(dy) <= tolerance and abs(dz) <= tolerance
+        for dx, dy, dz in zip(
+            map(sub, xs, xs[-1:] + xs[:-1]),
+            map(sub, ys, ys[-1:] + ys[:-1]),
+            map(sub, zs, zs[-1:] + zs[:-1]))
+    ]
+    return list(compress(zip(xs, ys, zs), same))
+
+
+def _origin(geometry, boundary):
+    """Get the origin of the plane of a Face3D, which is its first vertex by default."""
+    plane = geometry.get("plane")
+    if isinstance(plane, dict) and isinstance(plane.get("o"), list):
+        return plane["o"]
+    return [boundary[0][0], boundary[1][0], boundary[2][0]]
+
+
+def _plane_distances(xs, ys, zs, normal, origin):
+    """Get the signed distances of vertices to a plane with a unit normal."""
+    nx, ny, nz = normal
+    offset = sum(map(mul, normal, origin))
+    return [
+        x * nx + y * ny + z * nz - offset for x, y, z in zip(xs, ys, zs)
+    ]
+
+
+def _intersections(loops, normal, tolerance):
+    """Get the points where the edges of the boundary and holes of a face cross.
+
+    The loops are projected onto the coordinate plane that is closest to the
+    plane of the face and every pair of edges that are not adjacent in their
+    loop is tested, skipping pairs whose bounding boxes do not overlap.
+    """
+    if len(loops) == 1 and len(loops[0][0]) < 4:
+        return []  # a triangle cannot intersect itself
+    drop = max(range(3), key=lambda i: abs(normal[i]))
+    u, v = [i for i in range(3) if i != drop]
+    edges = []
+    for loop_id, loop in enumerate(loops):
+        count = len(loop[0])
+        points = list(zip(*loop))
+        for i in range(count):
+            p, q = points[i], points[(i + 1) % count]
+            edges.append((
+                loop_id, i, count, p, q, p[u], p[v], q[u], q[v],
+                min(p[u], q[u]) - tolerance, max(p[u], q[u]) + tolerance,
+                min(p[v], q[v]) - tolerance, max(p[v], q[v]) + tolerance,
+            ))
+    edges.sort(key=lambda e: e[9])
+    points = []
+    for i, edge in enumerate(edges):
+        loop_a, ia, count, p, q, ax, ay, bx, by, _, max_u, min_v, max_v = edge
+        for other in edges[i + 1:]:
+            if other[9] > max_u:
+                break  # all remaining edges start beyond the end of this one
+            if other[12] < min_v or other[11] > max_v:
+                continue
+            loop_b, ib = other[0], other[1]
+            if loop_a == loop_b and (abs(ia - ib) == 1 or abs(ia - ib) == count - 1):
+                continue  # adjacent edges share a vertex
+            t = _crossing(ax, ay, bx, by, *other[5:9])
+            if t is not None:
+                points.append(tuple(a + t * (b - a) for a, b in zip(p, q)))
+    return points
+
+
+def _crossing(ax, ay, bx, by, cx, cy, dx, dy):
+    """Get the parameter along segment ab where it crosses segment cd or None."""
+    rx, ry, sx, sy = bx - ax, by - ay, dx - cx, dy - cy
+    denominator = rx * sy - ry * sx
+    if denominator == 0:
+        return None  # parallel edges are caught by the duplicate vertex check
+    qx, qy = cx - ax, cy - ay
+    t = (qx * sy - qy * sx) / denominator
+    s = (qx * ry - qy * rx) / denominator
+    if 0 <= t <= 1 and 0 <= s <= 1:
+        return t
+    return None
+
+
+def _unmatched_edges(naked, points, tolerance):
+    """Get the naked edges that are not covered by collinear naked edges of other faces.
+
+    Each naked edge is split at the naked vertices that lie on it and the
+    pieces are counted again such that T-junctions match.
+    """
+    naked_vertices = sorted({i for edge in naked for i in edge})
+    pieces = {}
+    for a, b in naked:
+        pa, pb = points[a], points[b]
+        direction = list(map(sub, pb, pa))
+        length_sq = sum(map(mul, direction, direction))
+        splits = [(0, a), (1, b)]
+        for i in naked_vertices:
+            if i == a or i == b:
+                continue
+            t = sum(map(mul, map(sub, points[i], pa), direction)) / length_sq
+            if 0 < t < 1:
+                closest = [c + t * d for c, d in zip(pa, direction)]
+                if all(abs(c - o) <= tolerance for c, o in zip(closest, points[i])):
+                    splits.append((t, i))
+        splits.sort()
+        for (_, i), (_, j) in zip(splits, splits[1:]):
+            piece = (i, j) if i < j else (j, i)
+            pieces[piece] = pieces.get(piece, 0) + 1
+    return [piece for piece, count in pieces.items() if count == 1]
+
+
+def _point(pt):
+    """Get a Point3D from a tuple of three values."""
+    return Point3D(x=pt[0], y=pt[1], z=pt[2])
+
+
+def _segment(start, end):
+    """Get a LineSegment3D between two points."""
+    return LineSegment3D(p=list(start), v=list(map(sub, end, start)))
+
+
+def _error(obj, element_type, parents, code, error_type, message, helper_geometry):
+    """Get a ValidationError for a geometry object."""
+    error = {
+        "code": code,
+        "error_type": error_type,
+        "extension_type": ExtensionTypes.core,
+        "element_type": element_type,
+        "element_id": [element_id(obj.get("identifier"), element_type.value, "?")],
+        "message": message,
+        "helper_geometry": helper_geometry,
+    }
+    if obj.get("display_name"):
+        error["element_name"] = [obj["display_name"]]
+    if parents:
+        error["parents"] = [validation_parents(parents)]
+    return ValidationError(**error)
@@ -0,0 +1,163 @@
+"""Stable content hashes for the objects of a Model dictionary.
+
+Objects are hashed from a canonical JSON text with sorted keys and no
+whitespace such that two objects with the same content always have the same
+hash regardless of the order of their keys or how they were formatted in a file.
+The ModelHashes class composes these hashes along the hierarchy of the geometry
+objects such that unchanged Rooms can be recognized from their hash alone.
+"""
+
+import json
+import hashlib
+
+from ._traverse import CHILD_KEYS, MODEL_OBJECTS
+
+# keys that name an object without affecting what it describes
+NAME_KEYS = ("identifier", "display_name")
+
+
+def canonical_json(obj, exclude=()):
+    """Get the canonical JSON text of an object.
+
+    Args:
+        obj: A JSON-serializable object (eg. the dictionary of a Construction).
+        exclude: An optional list of top-level keys of the object to leave
+            out of the text.
+    """
+    if exclude and isinstance(obj, dict):
+        obj = {key: value for key, value in obj.items() if key not in exclude}
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def content_hash(obj, exclude=NAME_KEYS):
+    """Get a hash of the content of an object.
+
+    Args:
+        obj: A JSON-serializable object (eg. the dictionary of a Construction).
+        exclude: A list of top-level keys of the object that do not contribute
+            to the hash. By default, the identifier and display_name are
+            excluded such that objects that only differ in name share a hash.
+
+    Returns:
+        Text for the hexadecimal digest of the hash.
+    """
+    text = canonical_json(obj, exclude)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ModelHashes:
+    """Merkle-style content hashes for the objects and resources of a Model dictionary.
+
+    The hash of a geometry object is computed from its own keys with each
+    list of child objects replaced by the hashes of the children. A Room's
+    hash is thus composed from the hashes of its Faces, which are composed
+    from the hashes of their Apertures, Doors and Shades. Any change to an
+    object changes its hash and that of all its parents while the hashes of
+    all other objects stay the same. Unlike content_hash, these hashes
+    include the identifier and display_name of each object.
+
+    Hashes are computed when they are first requested and cached. The cache
+    assumes that the objects of the Model are not edited in place. The clear
+    method should be called after editing them.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+
+    Properties:
+        * model_dict
+    """
+
+    def __init__(self, model_dict):
+        self.model_dict = model_dict
+        self._cache = {}
+
+    def object_hash(self, obj):
+        """Get the hash of a geometry object, resource or any other object dictionary.
+
+        Args:
+            obj: A dictionary of a Room, Face, Aperture, Door, Shade, ShadeMesh
+                or any resource of the Model.
+
+        Returns:
+            Text for the hexadecimal digest of the hash.
+        """
+        try:
+            return self._cache[id(obj)][1]
+        except KeyError:
+            pass
+        child_keys = CHILD_KEYS.get(obj.get("type"), ())
+        if child_keys:
+            content = dict(obj)
+            for key in child_keys:
+                children = obj.get(key)
+                if isinstance(children, list):
+                    content[key] = self._list_hashes(children)
+        else:
+            content = obj
+        digest = content_hash(content, exclude=())
+        # keep a reference to the object such that its id is never reused
+        self._cache[id(obj)] = (obj, digest)
+        return digest
+
+    def collection(self, key):
+        """Get the hashes of the objects in one of the top-level lists of the Model.
+
+        Args:
+            key: The name of a top-level list of the Model (eg. rooms).
+
+        Returns:
+            A dictionary mapping the identifier of each object to its hash.
+        """
+        return self._hashes(self.model_dict.get(key))
+
+    def rooms(self):
+        """Get a dictionary mapping the identifier of each Room to its hash."""
+        return self.collection("rooms")
+
+    def resources(self, extension, key):
+        """Get the hashes of the resources in a list of an extension's Model properties.
+
+        Args:
+            extension: The name of the extension (eg. energy or radiance).
+            key: The name of the resource list (eg. schedules or modifiers).
+
+        Returns:
+            A dictionary mapping the identifier of each resource to its hash.
+        """
+        properties = self.model_dict.get("properties") or {}
+        return self._hashes((properties.get(extension) or {}).get(key))
+
+    def model_hash(self):
+        """Get a single hash for the whole Model, composed from its object hashes."""
+        content = dict(self.model_dict)
+        for key in MODEL_OBJECTS:
+            if isinstance(content.get(key), list):
+                content[key] = self._list_hashes(content[key])
+        properties = content.get("properties")
+        if isinstance(properties, dict):
+            properties = content["properties"] = dict(properties)
+            for extension, ext_properties in properties.items():
+                if not isinstance(ext_properties, dict):
+                    continue
+                ext_properties = properties[extension] = dict(ext_properties)
+                for key, value in ext_properties.items():
+                    if isinstance(value, list):
+                        ext_properties[key] = self._list_hashes(value)
+        return content_hash(content, exclude=())
+
+    def clear(self):
+        """Clear the cache of hashes after any object of the Model has been edited."""
+        self._cache = {}
+
+    def _hashes(self, items):
+        """Get a dictionary from identifier to hash for the dictionaries in a list."""
+        if not isinstance(items, list):
+            return {}
+        return {
+            item.get("identifier"): self.object_hash(item)
+            for item in items if isinstance(item, dict)
+        }
+
+    def _list_hashes(self, items):
+        """Replace the dictionaries in a list with their hashes."""
+        return [self.object_hash(v) if isinstance(v, dict) else v for v in items]
@@ -0,0 +1,205 @@
+"""Validate Models incrementally by caching the outcome of each Room and resource.
+
+Models are validated element by element as with validate_model_parallel. The
+outcome of each element is stored in a ValidationCache under a digest of the
+element's content. When a Model is validated again after a few of its Rooms
+or resources were edited, only the elements without a cached outcome are
+validated and the cached errors of all others are spliced into the report.
+
+Digests are computed from the pickled bytes of each element, which is several
+times faster than validating it. The bytes depend on the order of the keys of
+the element such that an element with reordered keys is validated again but
+two elements with different content never share a digest.
+"""
+
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+from collections import OrderedDict
+
+from .model import Model
+from .parallel import chunk_validator, partition_model
+from .schemacache import cache_key
+from .stream import ElementResult, validate_element
+from ._report import schema_error, validation_report
+
+# default maximum number of element outcomes held by a ValidationCache
+CACHE_SIZE = 100000
+
+# placeholder for an element without a cached outcome
+_MISSING = object()
+
+
+class ValidationCache:
+    """A least-recently-used cache from element digests to validation outcomes.
+
+    The cache can be saved to a folder and is then loaded again by any
+    ValidationCache created with the same folder. Saved caches are keyed by the
+    same environment fingerprint as the schema cache such that the outcomes
+    are discarded once honeybee-schema or pydantic changes. Note that the cache
+    is a pickle file and it should only be loaded from a folder that is not
+    writable by untrusted users.
+
+    Args:
+        maxsize: The maximum number of element outcomes to keep. The least
+            recently used outcomes are evicted past this size. (Default: 100000).
+        folder: An optional folder to load the cache from and save it to.
+
+    Properties:
+        * maxsize
+        * folder
+        * path
+        * hits
+        * misses
+    """
+
+    def __init__(self, maxsize=CACHE_SIZE, folder=None):
+        self.maxsize = maxsize
+        self.folder = folder
+        self.hits = 0
+        self.misses = 0
+        self._outcomes = OrderedDict()
+        if folder is not None:
+            self.load()
+
+    @property
+    def path(self):
+        """Get the path to the cache file in the folder or None if there is no folder."""
+        if self.folder is None:
+            return None
+        return os.path.join(self.folder, "validation-{}.pickle".format(cache_key()))
+
+    def get(self, digest, default=None):
+        """Get the outcome for a digest and mark it as recently used.
+
+        Args:
+            digest: Bytes for the digest of an element.
+            default: Value to return if the digest is not in the cache.
+
+        Returns:
+            Text for the validation error message of the element or None if
+            the element is valid. The default if the digest is not cached.
+        """
+        try:
+            self._outcomes.move_to_end(digest)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return self._outcomes[digest]
+
+    def put(self, digest, message):
+        """Add the outcome for a digest to the cache.
+
+        Args:
+            digest: Bytes for the digest of an element.
+            message: Text for the validation error message of the element or
+                None if the element is valid.
+        """
+        self._outcomes[digest] = message
+        self._outcomes.move_to_end(digest)
+        while len(self._outcomes) > self.maxsize:
+            self._outcomes.popitem(last=False)
+
+    def clear(self):
+        """Remove all outcomes from the cache."""
+        self._outcomes.clear()
+
+    def load(self):
+        """Load the outcomes saved in the folder, if any.
+
+        Returns:
+            True if the outcomes were loaded. False if there is no folder or
+            no readable cache file for the running environment.
+        """
+        if self.folder is None:
+            return False
+        try:
+            with open(self.path, "rb") as cache_file:
+                outcomes = pickle.load(cache_file)
+        except Exception:  # a missing or corrupt cache starts empty
+            return False
+        for digest, message in outcomes:
+            self.put(digest, message)
+        return True
+
+    def save(self):
+        """Save the outcomes to the cache folder.
+
+        Returns:
+            The path to the written cache file.
+        """
+        if self.folder is None:
+            raise ValueError("A folder is required to save the ValidationCache.")
+        path = self.path
+        os.makedirs(self.folder, exist_ok=True)
+        # write to a temporary file first such that readers never see a partial cache
+        fd, temp_path = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as cache_file:
+                pickle.dump(list(self._outcomes.items()), cache_file,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return path
+
+    def __len__(self):
+        return len(self._outcomes)
+
+    def __contains__(self, digest):
+        return digest in self._outcomes
+
+
+# cache shared by all incremental validations in the process that do not get one
+_DEFAULT_CACHE = ValidationCache()
+
+
+def element_digest(key, element):
+    """Get the digest of an element of a Model under which its outcome is cached.
+
+    Args:
+        key: The name of the list of the element (eg. rooms or schedules).
+        element: The decoded JSON of the element.
+    """
+    data = pickle.dumps((key, element), protocol=5)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def validate_model_incremental(model_dict, cache=None):
+    """Validate a Model dictionary, reusing the cached outcomes of unchanged elements.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        cache: A ValidationCache with the outcomes of earlier validations,
+            which is updated with the outcomes of this one. If None, a cache
+            shared by all calls in the current process is used.
+
+    Returns:
+        A ValidationReport with a ValidationError for each invalid Room, orphaned
+        object or resource. Errors in the rest of the Model are reported as
+        the fatal_error of the report.
+    """
+    cache = _DEFAULT_CACHE if cache is None else cache
+    header, chunks = partition_model(model_dict, sys.maxsize)
+    errors = []
+    for path, start, items in chunks:
+        validator = chunk_validator(path)
+        for index, item in enumerate(items, start):
+            digest = element_digest(path[-1], item)
+            message = cache.get(digest, _MISSING)
+            if message is _MISSING:
+                result = validate_element(path, index, item, validator)
+                message = None if result.error is None else str(result.error)
+                cache.put(digest, message)
+            if message is not None:
+                identifier = item.get("identifier") if isinstance(item, dict) else None
+                errors.append(schema_error(
+                    ElementResult(path, index, identifier, None, message)))
+    header_result = validate_element((), None, header, Model.model_validate)
+    fatal_error = "" if header_result.error is None else str(header_result.error)
+    return validation_report(errors, fatal_error)
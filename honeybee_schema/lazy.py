@@ -0,0 +1,274 @@
+"""Load Model JSON files lazily, validating only the elements that are accessed."""
+
+from collections.abc import Sequence
+
+from ._jsonstream import JsonStream, CHUNK_SIZE
+from .model import Model
+from .stream import MODEL_COLLECTIONS, EXTENSION_PROPERTIES, item_adapter
+
+
+class LazyList(Sequence):
+    """A list of Model elements that are read and validated when accessed.
+
+    Each item is validated the first time it is requested and the validated
+    object is cached for later access.
+
+    Args:
+        lazy_model: The LazyModel to which the list belongs.
+        path: Tuple of keys locating the list in the Model JSON.
+        spans: A list of (start, end) byte offsets for each item in the file.
+        identifiers: A list with the identifier of each item (None for items
+            without an identifier).
+        validator: A function that validates the JSON bytes of one item.
+
+    Properties:
+        * path
+        * identifiers
+    """
+
+    def __init__(self, lazy_model, path, spans, identifiers, validator):
+        self._lazy_model = lazy_model
+        self.path = path
+        self._spans = spans
+        self.identifiers = identifiers
+        self._validator = validator
+        self._cache = {}
+        self._lookup = None
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("{} index out of range.".format("/".join(self.path)))
+        try:
+            return self._cache[index]
+        except KeyError:
+            value = self._validator(self.raw_json(index))
+            self._cache[index] = value
+            return value
+
+    def index(self, identifier):
+        """Get the index of the item with a given identifier.
+
+        Raises a ValueError if no item has the identifier.
+        """
+        if self._lookup is None:
+            self._lookup = {}
+            for i, item_id in enumerate(self.identifiers):
+                self._lookup.setdefault(item_id, i)
+        try:
+            return self._lookup[identifier]
+        except KeyError:
+            raise ValueError(
+                "No item with identifier {!r} in {}.".format(
+                    identifier, "/".join(self.path)
+                )
+            ) from None
+
+    def get(self, identifier, default=None):
+        """Get the validated item with a given identifier.
+
+        Args:
+            identifier: Text for the identifier of the item.
+            default: Value to return if no item has the identifier.
+        """
+        try:
+            return self[self.index(identifier)]
+        except ValueError:
+            return default
+
+    def raw_json(self, index):
+        """Get the JSON bytes of an item without validating it."""
+        start, end = self._spans[index]
+        return self._lazy_model.read_bytes(start, end)
+
+    def is_loaded(self, index):
+        """Check whether an item has already been validated and cached."""
+        return index in self._cache
+
+
+class LazyModel:
+    """A Model JSON file that is indexed up front and validated on demand.
+
+    Upon initialization, the file is scanned once to record the byte offsets
+    and identifiers of every Room, orphaned object, ShadeMesh and every item of
+    the resource lists under properties.energy and properties.radiance. No
+    element is validated during the scan and only one element is held in
+    memory at a time. Elements are then read from the file, validated and
+    cached only when they are accessed.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        chunk_size: Number of bytes to read from the file at a time when
+            scanning it. (Default: 1 MB).
+
+    Properties:
+        * model_json
+        * header
+        * identifier
+        * rooms
+        * orphaned_faces
+        * orphaned_shades
+        * orphaned_apertures
+        * orphaned_doors
+        * shade_meshes
+    """
+
+    def __init__(self, model_json, chunk_size=CHUNK_SIZE):
+        self.model_json = model_json
+        self._lists = {}
+        self._header = None
+        with open(model_json, "rb") as json_file:
+            self._raw_header = self._scan(JsonStream(json_file, chunk_size))
+
+    @property
+    def header(self):
+        """The Model validated without any of its lazily-loaded lists.
+
+        It contains the identifier, units, tolerance and the properties of the
+        Model other than the resource lists.
+        """
+        if self._header is None:
+            self._header = Model.model_validate(self._raw_header)
+        return self._header
+
+    @property
+    def identifier(self):
+        """The identifier of the Model as it is written in the file."""
+        return self._raw_header.get("identifier")
+
+    @property
+    def rooms(self):
+        """A LazyList of the Rooms of the Model."""
+        return self.collection("rooms")
+
+    @property
+    def orphaned_faces(self):
+        """A LazyList of the orphaned Faces of the Model."""
+        return self.collection("orphaned_faces")
+
+    @property
+    def orphaned_shades(self):
+        """A LazyList of the orphaned Shades of the Model."""
+        return self.collection("orphaned_shades")
+
+    @property
+    def orphaned_apertures(self):
+        """A LazyList of the orphaned Apertures of the Model."""
+        return self.collection("orphaned_apertures")
+
+    @property
+    def orphaned_doors(self):
+        """A LazyList of the orphaned Doors of the Model."""
+        return self.collection("orphaned_doors")
+
+    @property
+    def shade_meshes(self):
+        """A LazyList of the ShadeMeshes of the Model."""
+        return self.collection("shade_meshes")
+
+    def collection(self, key):
+        """Get a LazyList for one of the top-level lists of the Model (eg. rooms).
+
+        An empty LazyList is returned if the Model does not have the list.
+        """
+        if key not in MODEL_COLLECTIONS:
+            raise ValueError(
+                "{!r} is not a Model collection. Choose from: {}".format(
+                    key, ", ".join(MODEL_COLLECTIONS)
+                )
+            )
+        return self._get_list((key,))
+
+    def resources(self, extension, field):
+        """Get a LazyList for a resource list of an extension's Model properties.
+
+        Args:
+            extension: The name of the extension (eg. energy or radiance).
+            field: The name of the list in the extension's Model properties
+                (eg. schedules, construction_sets or modifiers).
+
+        An empty LazyList is returned if the Model does not have the list.
+        """
+        properties_class = EXTENSION_PROPERTIES.get(extension)
+        if properties_class is None or item_adapter(properties_class, field) is None:
+            raise ValueError(
+                "{!r} is not a resource list of the {!r} Model properties.".format(
+                    field, extension
+                )
+            )
+        return self._get_list(("properties", extension, field))
+
+    def paths(self):
+        """Get the paths to all of the lists that were found in the file."""
+        return list(self._lists)
+
+    def read_bytes(self, start, end):
+        """Read a range of bytes from the Model JSON file."""
+        with open(self.model_json, "rb") as json_file:
+            json_file.seek(start)
+            return json_file.read(end - start)
+
+    def to_model(self):
+        """Get a fully-validated Model from the file."""
+        with open(self.model_json, "rb") as json_file:
+            return Model.model_validate_json(json_file.read())
+
+    def _get_list(self, path):
+        """Get the LazyList at a path, creating an empty one if it is not in the file."""
+        try:
+            return self._lists[path]
+        except KeyError:
+            return LazyList(self, path, [], [], _validator(path))
+
+    def _scan(self, stream):
+        """Scan the Model JSON, indexing its lists and returning the remaining keys."""
+        header = {}
+        for key in stream.iter_object():
+            if key in MODEL_COLLECTIONS and stream.peek() == "[":
+                self._index_items(stream, (key,))
+            elif key == "properties" and stream.peek() == "{":
+                header[key] = self._scan_properties(stream)
+            else:
+                header[key] = stream.read_value()
+        return header
+
+    def _scan_properties(self, stream):
+        """Scan the Model properties, indexing the resource lists of each extension."""
+        properties = {}
+        for key in stream.iter_object():
+            properties_class = EXTENSION_PROPERTIES.get(key)
+            if properties_class is None or stream.peek() != "{":
+                properties[key] = stream.read_value()
+                continue
+            ext_properties = properties[key] = {}
+            for field in stream.iter_object():
+                if item_adapter(properties_class, field) is not None and \
+                        stream.peek() == "[":
+                    self._index_items(stream, ("properties", key, field))
+                else:
+                    ext_properties[field] = stream.read_value()
+        return properties
+
+    def _index_items(self, stream, path):
+        """Record the byte offsets and identifiers of the items of a JSON array."""
+        spans, identifiers = [], []
+        for _ in stream.iter_array():
+            value, start, end = stream.read_span()
+            spans.append((start, end))
+            identifiers.append(
+                value.get("identifier") if isinstance(value, dict) else None
+            )
+        self._lists[path] = LazyList(self, path, spans, identifiers, _validator(path))
+
+
+def _validator(path):
+    """Get a function that validates the JSON bytes of an item in the list at a path."""
+    if len(path) == 1:
+        return MODEL_COLLECTIONS[path[0]].model_validate_json
+    return item_adapter(EXTENSION_PROPERTIES[path[1]], path[2]).validate_json
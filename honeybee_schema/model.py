@@ -4,13 +4,12 @@ from pydantic import (
     model_validator,
     field_validator,
     StringConstraints,
-    BaseModel,
     Field,
 )
-from typing import List, Union
+from typing import List
 from enum import Enum
 
-from ._base import IDdBaseModel
+from ._base import DeferredBaseModel, IDdBaseModel, type_union
 from .boundarycondition import (
     Outdoors,
     Surface,
@@ -45,7 +44,7 @@ from .geometry import Face3D, Mesh3D
 from typing_extensions import Annotated
 
 
-class ShadeMeshPropertiesAbridged(BaseModel):
+class ShadeMeshPropertiesAbridged(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^ShadeMeshPropertiesAbridged$")] = (
         "ShadeMeshPropertiesAbridged"
     )
@@ -74,7 +73,7 @@ class ShadeMesh(IDdBaseModel):
     )
 
 
-class ShadePropertiesAbridged(BaseModel):
+class ShadePropertiesAbridged(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^ShadePropertiesAbridged$")] = (
         "ShadePropertiesAbridged"
     )
@@ -104,7 +103,7 @@ class Shade(IDdBaseModel):
     )
 
 
-class DoorPropertiesAbridged(BaseModel):
+class DoorPropertiesAbridged(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^DoorPropertiesAbridged$")] = (
         "DoorPropertiesAbridged"
     )
@@ -119,7 +118,7 @@ class Door(IDdBaseModel):
 
     geometry: Face3D = Field(..., description="Planar Face3D for the geometry.")
 
-    boundary_condition: Union[Outdoors, Surface]
+    boundary_condition: type_union(Outdoors, Surface)
 
     @field_validator("boundary_condition")
     def surface_bc_objects(cls, v):
@@ -153,7 +152,7 @@ class Door(IDdBaseModel):
     )
 
 
-class AperturePropertiesAbridged(BaseModel):
+class AperturePropertiesAbridged(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^AperturePropertiesAbridged$")] = (
         "AperturePropertiesAbridged"
     )
@@ -168,7 +167,7 @@ class Aperture(IDdBaseModel):
 
     geometry: Face3D = Field(..., description="Planar Face3D for the geometry.")
 
-    boundary_condition: Union[Outdoors, Surface]
+    boundary_condition: type_union(Outdoors, Surface)
 
     @field_validator("boundary_condition")
     def surface_bc_objects(cls, v):
@@ -203,7 +202,7 @@ class Aperture(IDdBaseModel):
     )
 
 
-class FacePropertiesAbridged(BaseModel):
+class FacePropertiesAbridged(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^FacePropertiesAbridged$")] = (
         "FacePropertiesAbridged"
     )
@@ -227,9 +226,9 @@ class Face(IDdBaseModel):
 
     face_type: FaceType
 
-    boundary_condition: Union[
+    boundary_condition: type_union(
         Ground, Outdoors, Adiabatic, Surface, OtherSideTemperature
-    ]
+    )
 
     @field_validator("boundary_condition")
     def surface_bc_objects(cls, v):
@@ -279,7 +278,7 @@ class Face(IDdBaseModel):
         return self
 
 
-class RoomPropertiesAbridged(BaseModel):
+class RoomPropertiesAbridged(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^RoomPropertiesAbridged$")] = (
         "RoomPropertiesAbridged"
     )
@@ -360,7 +359,7 @@ class Units(str, Enum):
     centimeters = "Centimeters"
 
 
-class ModelProperties(BaseModel):
+class ModelProperties(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^ModelProperties$")] = (
         "ModelProperties"
     )
@@ -0,0 +1,393 @@
+"""Compact array-backed storage for the large numeric fields of the schema.
+
+By default, pydantic validates every coordinate of a geometry into its own
+Python float inside its own list. When a Model is validated with the
+packed_arrays context, the largest numeric fields are instead checked in bulk
+and stored in contiguous arrays of the standard library array module, which
+use a fraction of the memory. The packed objects serialize back to exactly
+the same JSON as the default lists. Input that is not made of numbers (eg.
+numeric strings) is coerced the same way as in the default validation and
+packed objects that are passed in directly get the same length checks.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_schema.model import Model
+    from honeybee_schema.packed import PACKED_ARRAYS
+
+    model = Model.model_validate_json(json_data, context={PACKED_ARRAYS: True})
+"""
+
+import sys
+import base64
+from array import array
+from itertools import chain
+from typing import List
+
+from pydantic import TypeAdapter, ValidationError
+
+PACKED_ARRAYS = "packed_arrays"
+
+# validators of the default lists for input that cannot be packed in bulk
+_FLOATS = TypeAdapter(List[float])
+_INTEGERS = TypeAdapter(List[int])
+
+
+def is_packed(info):
+    """Check whether a pydantic ValidationInfo requests packed arrays."""
+    return bool(info.context) and bool(info.context.get(PACKED_ARRAYS))
+
+
+def check_count(packed, min_count=0, max_count=None):
+    """Check that packed values have a number of items allowed by their field.
+
+    Args:
+        packed: PackedPoints, PackedFaces or PackedValues.
+        min_count: The minimum number of items that must be in the packed values.
+        max_count: The maximum number of items that can be in the packed values.
+
+    Returns:
+        The input packed values.
+    """
+    _check_count(len(packed), min_count, max_count, packed._ITEMS)
+    return packed
+
+
+def _check_count(count, min_count, max_count, items):
+    """Raise a ValueError if a number of items is outside of the limits."""
+    if count < min_count:
+        raise ValueError("At least {} {} are required but {} were given.".format(
+            min_count, items, count))
+    if max_count is not None and count > max_count:
+        raise ValueError("At most {} {} are allowed but {} were given.".format(
+            max_count, items, count))
+
+
+def _coerced_array(typecode, values, adapter, message, rows=None):
+    """Get an array from values that are coerced like the default validation does.
+
+    This is the slow path for input that could not be packed in bulk, such as
+    numeric strings or numbers that are too large for the array.
+
+    Args:
+        typecode: The typecode of the array.
+        values: An iterable of the values.
+        adapter: A TypeAdapter for a list of the type of the values.
+        message: The message of the ValueError for values that are not valid.
+        rows: An optional list of the lists that the values were flattened from,
+            which must all be lists or tuples rather than eg. strings.
+    """
+    if rows is not None and not all(isinstance(row, (list, tuple)) for row in rows):
+        raise ValueError(message)
+    try:
+        return array(typecode, adapter.validate_python(list(values)))
+    except (ValidationError, OverflowError):
+        raise ValueError(message) from None
+
+
+class PackedPoints:
+    """A list of 3D points stored in a single contiguous array of floats.
+
+    Args:
+        coordinates: An array of floats with the x, y, z values of each point
+            following one another.
+    """
+
+    __slots__ = ("coordinates",)
+
+    _ITEMS = "points"
+
+    def __init__(self, coordinates):
+        self.coordinates = coordinates
+
+    @classmethod
+    def from_points(cls, points, min_count=0):
+        """Create PackedPoints from a list of (x, y, z) lists with bulk checks.
+
+        Args:
+            points: A list of lists with 3 numbers each.
+            min_count: The minimum number of points that must be in the list.
+        """
+        if not isinstance(points, (list, tuple)):
+            raise ValueError("Points must be a list of (x, y, z) lists.")
+        _check_count(len(points), min_count, None, cls._ITEMS)
+        message = "Points must be a list of (x, y, z) lists with numerical values."
+        try:
+            if set(map(len, points)) - {3}:
+                raise ValueError("Each point must have exactly 3 (x, y, z) values.")
+        except TypeError:
+            raise ValueError(message) from None
+        try:
+            return cls(array("d", chain.from_iterable(points)))
+        except (TypeError, OverflowError):
+            return cls(_coerced_array(
+                "d", chain.from_iterable(points), _FLOATS, message, points))
+
+    def to_list(self):
+        """Get the points as a list of [x, y, z] lists."""
+        values = self.coordinates.tolist()
+        return [values[i:i + 3] for i in range(0, len(values), 3)]
+
+    def __len__(self):
+        return len(self.coordinates) // 3
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PackedPoints index out of range.")
+        return self.coordinates[index * 3:index * 3 + 3].tolist()
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __eq__(self, other):
+        if isinstance(other, PackedPoints):
+            return self.coordinates == other.coordinates
+        return NotImplemented
+
+    def __repr__(self):
+        return "PackedPoints({} points)".format(len(self))
+
+
+class PackedFaces:
+    """A list of mesh faces stored in contiguous arrays of integers.
+
+    Args:
+        indices: An array of integers with the vertex indices of all faces
+            following one another.
+        sizes: An array with the number of vertices (3 or 4) of each face.
+    """
+
+    __slots__ = ("indices", "sizes")
+
+    _ITEMS = "faces"
+
+    def __init__(self, indices, sizes):
+        self.indices = indices
+        self.sizes = sizes
+
+    @classmethod
+    def from_faces(cls, faces, min_count=0):
+        """Create PackedFaces from a list of vertex index lists with bulk checks.
+
+        Args:
+            faces: A list of lists with 3 or 4 non-negative integers each.
+            min_count: The minimum number of faces that must be in the list.
+        """
+        if not isinstance(faces, (list, tuple)):
+            raise ValueError("Faces must be a list of lists of vertex indices.")
+        _check_count(len(faces), min_count, None, cls._ITEMS)
+        message = "Faces must be a list of lists with integer vertex indices."
+        try:
+            sizes = array("B", map(len, faces))
+        except (TypeError, OverflowError):
+            raise ValueError(message) from None
+        if set(sizes) - {3, 4}:
+            raise ValueError("Each face must have either 3 or 4 vertex indices.")
+        try:
+            indices = array("q", chain.from_iterable(faces))
+        except (TypeError, OverflowError):
+            indices = _coerced_array(
+                "q", chain.from_iterable(faces), _INTEGERS, message, faces)
+        if indices and min(indices) < 0:
+            raise ValueError("Face vertex indices must be greater or equal to 0.")
+        return cls(indices, sizes)
+
+    def to_list(self):
+        """Get the faces as a list of lists of vertex indices."""
+        values = self.indices.tolist()
+        faces, start = [], 0
+        for size in self.sizes:
+            faces.append(values[start:start + size])
+            start += size
+        return faces
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def __getitem__(self, index):
+        return self.to_list()[index]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __eq__(self, other):
+        if isinstance(other, PackedFaces):
+            return self.indices == other.indices and self.sizes == other.sizes
+        return NotImplemented
+
+    def __repr__(self):
+        return "PackedFaces({} faces)".format(len(self))
+
+
+class PackedSensors:
+    """A list of Radiance sensors stored as columns of positions and directions.
+
+    Args:
+        positions: PackedPoints for the (x, y, z) position of each sensor.
+        directions: PackedPoints for the (x, y, z) direction of each sensor.
+    """
+
+    __slots__ = ("positions", "directions")
+
+    _KEYS = frozenset(("type", "pos", "dir"))
+
+    def __init__(self, positions, directions):
+        assert len(positions) == len(directions), \
+            "The number of sensor positions and directions must match."
+        self.positions = positions
+        self.directions = directions
+
+    @classmethod
+    def from_sensors(cls, sensors):
+        """Create PackedSensors from a list of Sensor objects or dictionaries.
+
+        All sensors are checked together rather than one model at a time.
+
+        Args:
+            sensors: A list of Sensor objects or Sensor dictionaries.
+        """
+        if not isinstance(sensors, (list, tuple)):
+            raise ValueError("Sensors must be a list of Sensor objects.")
+        if all(isinstance(s, dict) for s in sensors):
+            if any(s.keys() - cls._KEYS for s in sensors):
+                raise ValueError("Sensors can only have type, pos and dir keys.")
+            if any(s.get("type", "Sensor") != "Sensor" for s in sensors):
+                raise ValueError("Sensors must be of type Sensor.")
+            try:
+                positions = [s["pos"] for s in sensors]
+                directions = [s["dir"] for s in sensors]
+            except KeyError as e:
+                raise ValueError("Sensors must have a {} value.".format(e)) from None
+        else:
+            try:
+                positions = [s.pos for s in sensors]
+                directions = [s.dir for s in sensors]
+            except AttributeError:
+                raise ValueError(
+                    "Sensors must all be Sensor objects or dictionaries."
+                ) from None
+        return cls(PackedPoints.from_points(positions),
+                   PackedPoints.from_points(directions))
+
+    def to_list(self):
+        """Get the sensors as a list of Sensor dictionaries."""
+        return [{"type": "Sensor", "pos": pos, "dir": dir_}
+                for pos, dir_ in zip(self.positions, self.directions)]
+
+    def to_sensors(self):
+        """Get the sensors as a list of Sensor objects."""
+        from .radiance.asset import Sensor
+        return [Sensor.model_construct(pos=pos, dir=dir_)
+                for pos, dir_ in zip(self.positions, self.directions)]
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        return self.to_list()[index]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __eq__(self, other):
+        if isinstance(other, PackedSensors):
+            return self.positions == other.positions and \
+                self.directions == other.directions
+        return NotImplemented
+
+    def __repr__(self):
+        return "PackedSensors({} sensors)".format(len(self))
+
+
+class PackedValues:
+    """A list of numerical values stored in a single contiguous array of floats.
+
+    Args:
+        values: An array of floats.
+    """
+
+    __slots__ = ("values",)
+
+    _ITEMS = "values"
+
+    def __init__(self, values):
+        self.values = values
+
+    @classmethod
+    def from_values(cls, values, min_count=0, max_count=None):
+        """Create PackedValues from a list of numbers with bulk checks.
+
+        Args:
+            values: A list of numbers.
+            min_count: The minimum number of values that must be in the list.
+            max_count: The maximum number of values that can be in the list.
+        """
+        if not isinstance(values, (list, tuple)):
+            raise ValueError("Values must be a list of numbers.")
+        _check_count(len(values), min_count, max_count, cls._ITEMS)
+        try:
+            return cls(array("d", values))
+        except (TypeError, OverflowError):
+            return cls(_coerced_array(
+                "d", values, _FLOATS, "Values must be a list of numbers."))
+
+    @classmethod
+    def from_base64(cls, data):
+        """Create PackedValues from the base64 text of little-endian 64-bit floats."""
+        values = array("d")
+        values.frombytes(base64.b64decode(data))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return cls(values)
+
+    def to_base64(self):
+        """Get the values as base64 text of little-endian 64-bit floats.
+
+        This is a lossless and compact alternative to the list of values for
+        storing the values outside of a Model JSON.
+        """
+        values = self.values
+        if sys.byteorder == "big":
+            values = array("d", values)
+            values.byteswap()
+        return base64.b64encode(values.tobytes()).decode("ascii")
+
+    def to_list(self):
+        """Get the values as a list of floats."""
+        return self.values.tolist()
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.values[index].tolist()
+        return self.values[index]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __eq__(self, other):
+        if isinstance(other, PackedValues):
+            return self.values == other.values
+        return NotImplemented
+
+    def __repr__(self):
+        return "PackedValues({} values)".format(len(self))
+
+
+def unpack(value):
+    """Convert packed values (possibly inside a list) back to regular lists.
+
+    Values that are not packed are returned unchanged.
+    """
+    if isinstance(value, (PackedPoints, PackedFaces, PackedSensors, PackedValues)):
+        return value.to_list()
+    if isinstance(value, list):
+        return [unpack(v) for v in value]
+    return value
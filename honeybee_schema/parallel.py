@@ -0,0 +1,127 @@
+"""Validate large Models across several processes by partitioning them into chunks."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .model import Model
+from .stream import (
+    MODEL_COLLECTIONS,
+    EXTENSION_PROPERTIES,
+    item_adapter,
+    validate_element,
+)
+from ._report import schema_error, validation_report
+
+CHUNK_SIZE = 100
+
+
+def partition_model(model_dict, chunk_size=CHUNK_SIZE):
+    """Split a Model dictionary into a header and chunks of elements to validate.
+
+    The input dictionary is not mutated.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        chunk_size: The maximum number of elements in each chunk.
+
+    Returns:
+        A tuple with two items.
+
+        -   header: A copy of the Model dictionary without any of the lists
+            of Rooms, orphaned objects or extension resources.
+
+        -   chunks: A list of tuples with three items each. The first item is the
+            path to the list from which the chunk was taken. The second is the
+            index of the first element of the chunk in the list and the third
+            is the list of elements.
+    """
+    chunks = []
+
+    def _add_chunks(path, items):
+        for start in range(0, len(items), chunk_size):
+            chunks.append((path, start, items[start:start + chunk_size]))
+
+    header = {}
+    for key, value in model_dict.items():
+        if key in MODEL_COLLECTIONS and isinstance(value, list):
+            _add_chunks((key,), value)
+        else:
+            header[key] = value
+
+    properties = header.get("properties")
+    if isinstance(properties, dict):
+        properties = header["properties"] = dict(properties)
+        for ext, properties_class in EXTENSION_PROPERTIES.items():
+            ext_properties = properties.get(ext)
+            if not isinstance(ext_properties, dict):
+                continue
+            ext_properties = properties[ext] = dict(ext_properties)
+            for field in list(ext_properties):
+                items = ext_properties[field]
+                if isinstance(items, list) and \
+                        item_adapter(properties_class, field) is not None:
+                    _add_chunks(("properties", ext, field), ext_properties.pop(field))
+    return header, chunks
+
+
+def chunk_validator(path):
+    """Get the function that validates the elements of a chunk from a partitioned Model.
+
+    Args:
+        path: Tuple of keys for the list from which the chunk was taken.
+    """
+    if len(path) == 1:
+        return MODEL_COLLECTIONS[path[0]].model_validate
+    return item_adapter(EXTENSION_PROPERTIES[path[1]], path[2]).validate_python
+
+
+def validate_chunk(path, start, items):
+    """Validate a chunk of elements from a partitioned Model.
+
+    Args:
+        path: Tuple of keys for the list from which the chunk was taken.
+        start: Index of the first element of the chunk in the list.
+        items: A list of element dictionaries.
+
+    Returns:
+        A list of ValidationErrors for the elements that are not valid.
+    """
+    validator = chunk_validator(path)
+    errors = []
+    for index, item in enumerate(items, start):
+        result = validate_element(path, index, item, validator)
+        if result.error is not None:
+            errors.append(schema_error(result))
+    return errors
+
+
+def validate_model_parallel(model_dict, processes=None, chunk_size=CHUNK_SIZE):
+    """Validate a Model dictionary with chunks of elements spread over several processes.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        processes: The number of worker processes to use. If None, it will be
+            the number of CPUs on the machine. If 1, all validation is done
+            in the current process.
+        chunk_size: The maximum number of Rooms or resources validated by
+            a worker in one task.
+
+    Returns:
+        A ValidationReport with a ValidationError for each invalid Room, orphaned
+        object or resource. Errors in the rest of the Model are reported as
+        the fatal_error of the report.
+    """
+    processes = processes or os.cpu_count() or 1
+    header, chunks = partition_model(model_dict, chunk_size)
+    if processes == 1 or len(chunks) <= 1:
+        chunk_errors = [validate_chunk(*chunk) for chunk in chunks]
+        header_result = validate_element((), None, header, Model.model_validate)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(validate_chunk, *chunk) for chunk in chunks]
+            header_result = validate_element((), None, header, Model.model_validate)
+            chunk_errors = [future.result() for future in futures]
+
+    errors = [error for errors in chunk_errors for error in errors]
+    fatal_error = "" if header_result.error is None else str(header_result.error)
+    return validation_report(errors, fatal_error)
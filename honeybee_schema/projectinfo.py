@@ -1,14 +1,15 @@
 """Schema for project information."""
 
-from pydantic import StringConstraints, BaseModel, Field, AnyUrl
+from pydantic import StringConstraints, Field, AnyUrl
 from typing import List, Union
 
+from ._base import DeferredBaseModel
 from .altnumber import Autocalculate
 from .energy.simulation import EfficiencyStandards, ClimateZones, BuildingTypes
 from typing_extensions import Annotated
 
 
-class Location(BaseModel):
+class Location(DeferredBaseModel):
     """A Ladybug Location."""
 
     type: Annotated[str, StringConstraints(pattern="^Location$")] = "Location"
@@ -44,7 +45,7 @@ class Location(BaseModel):
     source: str | None = Field(None, description="Source of data (e.g. TMY, TMY3).")
 
 
-class ProjectInfo(BaseModel):
+class ProjectInfo(DeferredBaseModel):
     """Project information."""
 
     type: Annotated[str, StringConstraints(pattern="^ProjectInfo$")] = "ProjectInfo"
@@ -1,10 +1,11 @@
 """SensorGrid and Sensor Schema"""
 
-from pydantic import StringConstraints, Field
+from pydantic import StringConstraints, Field, field_validator, field_serializer
 from typing import List
 from enum import Enum
 from ..geometry import Mesh3D, Face3D
 from .._base import NoExtraBaseModel
+from ..packed import PackedSensors, is_packed
 from ._base import IDdRadianceBaseModel
 from typing_extensions import Annotated
 
@@ -86,6 +87,22 @@ class SensorGrid(_RadianceAsset):
             'folder (default: None).",
     )
 
+    @field_validator("sensors", mode="wrap")
+    @classmethod
+    def pack_sensors(cls, v, handler, info):
+        """Store the sensors as PackedSensors when packed arrays are requested."""
+        if isinstance(v, PackedSensors):
+            return v
+        if is_packed(info):
+            return PackedSensors.from_sensors(v)
+        return handler(v)
+
+    @field_serializer("sensors", mode="wrap")
+    def unpack_sensors(self, v, handler):
+        if isinstance(v, PackedSensors):
+            return v.to_list()
+        return handler(v)
+
 
 class ViewType(str, Enum):
     """A single character for the view type (-vt)."""
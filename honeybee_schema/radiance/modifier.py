@@ -1,13 +1,14 @@
 """Modifier Schema"""
 
 from __future__ import annotations
-from pydantic import field_validator, StringConstraints, Field, BaseModel
+from pydantic import field_validator, StringConstraints, Field
 from typing import List, Union, Optional
 from ._base import IDdRadianceBaseModel
+from .._base import DeferredBaseModel, type_union
 from typing_extensions import Annotated
 
 
-class Void(BaseModel):
+class Void(DeferredBaseModel):
     """Void modifier"""
 
     type: Annotated[str, StringConstraints(pattern="^Void$")] = "Void"
@@ -356,27 +357,10 @@ class Glow(Light):
 
 
 # Union Modifier Schema objects defined for type reference
-_REFERENCE_UNION_MODIFIERS = Union[
+_REFERENCE_UNION_MODIFIERS = type_union(
     Plastic, Glass, BSDF, Glow, Light, Trans, Metal, Void, Mirror
-]
-
-# Required for self.referencing model
-# see https://pydantic-docs.helpmanual.io/#self-referencing-models
-# Mirror.update_forward_refs()
-# Plastic.update_forward_refs()
-# Glass.update_forward_refs()
-# BSDF.update_forward_refs()
-# Glow.update_forward_refs()
-# Light.update_forward_refs()
-# Trans.update_forward_refs()
-# Metal.update_forward_refs()
-# Void.update_forward_refs()
-Mirror.model_rebuild()
-Plastic.model_rebuild()
-Glass.model_rebuild()
-BSDF.model_rebuild()
-Glow.model_rebuild()
-Light.model_rebuild()
-Trans.model_rebuild()
-Metal.model_rebuild()
-Void.model_rebuild()
+)
+
+# The modifiers reference one another through _REFERENCE_UNION_MODIFIERS, which is
+# only defined at the end of this module. Their schemas are built lazily on first
+# use (defer_build) at which point the forward reference resolves from this module.
@@ -1,13 +1,13 @@
 """Properties Schema"""
 
 from pydantic import StringConstraints, Field
-from typing import List, Union
+from typing import List
 
 from .modifier import _REFERENCE_UNION_MODIFIERS
 from .modifierset import ModifierSet, ModifierSetAbridged
 from .global_modifierset import GlobalModifierSet
 from .asset import SensorGrid, View
-from .._base import NoExtraBaseModel
+from .._base import NoExtraBaseModel, type_union
 
 from honeybee_schema.radiance.state import (
     RadianceShadeStateAbridged,
@@ -142,7 +142,7 @@ class ModelRadianceProperties(NoExtraBaseModel):
         "Shades, Room ModifierSets, and the global_modifier_set.",
     )
 
-    modifier_sets: List[Union[ModifierSet, ModifierSetAbridged]] | None = Field(
+    modifier_sets: List[type_union(ModifierSet, ModifierSetAbridged)] | None = Field(
         default=None,
         description="A list of all unique Room-Assigned ModifierSets in the Model.",
     )
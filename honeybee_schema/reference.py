@@ -0,0 +1,396 @@
+"""Index the resources of a Model by identifier and check that all references resolve.
+
+Abridged objects refer to the resources of the Model (constructions, schedules,
+modifiers, etc.) with identifier strings that the schema cannot check on its
+own. The ReferenceIndex maps the identifiers of every resource list in the
+Model energy and radiance properties to their objects in one pass and can then
+report the duplicated identifiers and dangling references of a whole Model.
+"""
+
+from typing import NamedTuple
+
+from .validation import ExtensionTypes, ValidationError
+from ._report import ELEMENT_TYPES, element_id, validation_parents, validation_report
+from ._traverse import iter_objects
+
+# resource lists of each extension's Model properties that are indexed
+RESOURCE_LISTS = {
+    "energy": (
+        "materials",
+        "constructions",
+        "construction_sets",
+        "schedule_type_limits",
+        "schedules",
+        "program_types",
+        "hvacs",
+        "shws",
+    ),
+    "radiance": ("modifiers", "modifier_sets", "sensor_grids", "views"),
+}
+
+# lists of the global sets that can also be the target of a reference
+_GLOBAL_RESOURCES = (
+    ("energy", "global_construction_set", "materials"),
+    ("energy", "global_construction_set", "constructions"),
+    ("radiance", "global_modifier_set", "modifiers"),
+)
+
+# error codes for duplicated resource identifiers
+DUPLICATE_CODES = {
+    "materials": "020001",
+    "constructions": "020002",
+    "construction_sets": "020003",
+    "schedule_type_limits": "020004",
+    "schedules": "020005",
+    "program_types": "020006",
+    "hvacs": "020007",
+    "shws": "020008",
+    "modifiers": "010001",
+    "modifier_sets": "010002",
+    "sensor_grids": "010003",
+    "views": "010004",
+}
+
+# error codes for references to resources that are not in the Model
+MISSING_CODES = {
+    "materials": "020011",
+    "constructions": "020012",
+    "construction_sets": "020013",
+    "schedule_type_limits": "020014",
+    "schedules": "020015",
+    "program_types": "020016",
+    "hvacs": "020017",
+    "shws": "020018",
+    "modifiers": "010011",
+    "modifier_sets": "010012",
+}
+
+_FACE_SET_CONSTRUCTIONS = dict.fromkeys(
+    ("interior_construction", "exterior_construction", "ground_construction"),
+    "constructions",
+)
+_FACE_SET_MODIFIERS = dict.fromkeys(("exterior_modifier", "interior_modifier"), "modifiers")
+_PROPERTIES_MODIFIERS = dict.fromkeys(("modifier", "modifier_blk"), "modifiers")
+_STATE_MODIFIERS = dict.fromkeys(("modifier", "modifier_direct"), "modifiers")
+
+# fields of each object type that reference a resource and the list of the resource
+REFERENCE_FIELDS = {
+    # energy constructions and construction sets
+    "OpaqueConstructionAbridged": {"materials": "materials"},
+    "WindowConstructionAbridged": {"materials": "materials", "frame": "materials"},
+    "WindowConstructionShadeAbridged": {
+        "shade_material": "materials", "schedule": "schedules"
+    },
+    "WindowConstructionDynamicAbridged": {"schedule": "schedules"},
+    "AirBoundaryConstructionAbridged": {"air_mixing_schedule": "schedules"},
+    "ConstructionSetAbridged": {
+        "shade_construction": "constructions",
+        "air_boundary_construction": "constructions",
+    },
+    "WallConstructionSetAbridged": _FACE_SET_CONSTRUCTIONS,
+    "FloorConstructionSetAbridged": _FACE_SET_CONSTRUCTIONS,
+    "RoofCeilingConstructionSetAbridged": _FACE_SET_CONSTRUCTIONS,
+    "ApertureConstructionSetAbridged": dict.fromkeys(
+        ("interior_construction", "window_construction", "skylight_construction",
+         "operable_construction"), "constructions"),
+    "DoorConstructionSetAbridged": dict.fromkeys(
+        ("interior_construction", "exterior_construction", "overhead_construction",
+         "exterior_glass_construction", "interior_glass_construction"),
+        "constructions"),
+    "InternalMassAbridged": {"construction": "constructions"},
+    # energy schedules, loads and HVAC
+    "ScheduleRulesetAbridged": {"schedule_type_limit": "schedule_type_limits"},
+    "ScheduleFixedIntervalAbridged": {"schedule_type_limit": "schedule_type_limits"},
+    "PeopleAbridged": {
+        "occupancy_schedule": "schedules", "activity_schedule": "schedules"
+    },
+    "LightingAbridged": {"schedule": "schedules"},
+    "ElectricEquipmentAbridged": {"schedule": "schedules"},
+    "GasEquipmentAbridged": {"schedule": "schedules"},
+    "ProcessAbridged": {"schedule": "schedules"},
+    "InfiltrationAbridged": {"schedule": "schedules"},
+    "VentilationAbridged": {"schedule": "schedules"},
+    "ServiceHotWaterAbridged": {"schedule": "schedules"},
+    "VentilationControlAbridged": {"schedule": "schedules"},
+    "SetpointAbridged": dict.fromkeys(
+        ("cooling_schedule", "heating_schedule", "humidifying_schedule",
+         "dehumidifying_schedule"), "schedules"),
+    "IdealAirSystemAbridged": {
+        "heating_availability": "schedules", "cooling_availability": "schedules"
+    },
+    "FCUwithDOASAbridged": {"doas_availability_schedule": "schedules"},
+    "WSHPwithDOASAbridged": {"doas_availability_schedule": "schedules"},
+    "VRFwithDOASAbridged": {"doas_availability_schedule": "schedules"},
+    "RadiantwithDOASAbridged": {"doas_availability_schedule": "schedules"},
+    # energy properties of geometry objects
+    "RoomEnergyPropertiesAbridged": {
+        "construction_set": "construction_sets",
+        "program_type": "program_types",
+        "hvac": "hvacs",
+        "shw": "shws",
+    },
+    "FaceEnergyPropertiesAbridged": {"construction": "constructions"},
+    "ApertureEnergyPropertiesAbridged": {"construction": "constructions"},
+    "DoorEnergyPropertiesAbridged": {"construction": "constructions"},
+    "ShadeEnergyPropertiesAbridged": {
+        "construction": "constructions", "transmittance_schedule": "schedules"
+    },
+    "ShadeMeshEnergyPropertiesAbridged": {
+        "construction": "constructions", "transmittance_schedule": "schedules"
+    },
+    # radiance modifier sets
+    "ModifierSetAbridged": {"air_boundary_modifier": "modifiers"},
+    "WallModifierSetAbridged": _FACE_SET_MODIFIERS,
+    "FloorModifierSetAbridged": _FACE_SET_MODIFIERS,
+    "RoofCeilingModifierSetAbridged": _FACE_SET_MODIFIERS,
+    "ShadeModifierSetAbridged": _FACE_SET_MODIFIERS,
+    "ApertureModifierSetAbridged": dict.fromkeys(
+        ("window_modifier", "interior_modifier", "skylight_modifier",
+         "operable_modifier"), "modifiers"),
+    "DoorModifierSetAbridged": dict.fromkeys(
+        ("exterior_modifier", "interior_modifier", "interior_glass_modifier",
+         "exterior_glass_modifier", "overhead_modifier"), "modifiers"),
+    # radiance properties of geometry objects
+    "RoomRadiancePropertiesAbridged": {"modifier_set": "modifier_sets"},
+    "FaceRadiancePropertiesAbridged": _PROPERTIES_MODIFIERS,
+    "ApertureRadiancePropertiesAbridged": _PROPERTIES_MODIFIERS,
+    "DoorRadiancePropertiesAbridged": _PROPERTIES_MODIFIERS,
+    "ShadeRadiancePropertiesAbridged": _PROPERTIES_MODIFIERS,
+    "ShadeMeshRadiancePropertiesAbridged": _PROPERTIES_MODIFIERS,
+    "RadianceSubFaceStateAbridged": _STATE_MODIFIERS,
+    "RadianceShadeStateAbridged": _STATE_MODIFIERS,
+    "StateGeometryAbridged": _STATE_MODIFIERS,
+}
+
+# types of schedules with day schedule references that resolve within the schedule
+_RULESET_TYPES = ("ScheduleRulesetAbridged", "ScheduleRuleset")
+_RULESET_DAY_FIELDS = (
+    "default_day_schedule",
+    "holiday_schedule",
+    "summer_designday_schedule",
+    "winter_designday_schedule",
+)
+
+
+class Reference(NamedTuple):
+    """A reference from an object in a Model to a resource by identifier.
+
+    Properties:
+        key: The name of the resource list that the reference points to
+            (eg. schedules). This is day_schedules for the references of
+            a ScheduleRuleset to its own ScheduleDays.
+        identifier: The identifier of the referenced resource.
+        source_type: The type of the object that holds the reference
+            (eg. PeopleAbridged).
+        field: The name of the field that holds the reference.
+        resolved: Boolean to note whether the referenced resource exists.
+    """
+
+    key: str
+    identifier: str
+    source_type: str
+    field: str
+    resolved: bool
+
+
+class ReferenceIndex:
+    """An index from identifier to object for the resource lists of a Model dictionary.
+
+    The index is built in a single pass over the resource lists and can be
+    reused for any number of lookups. Resources of the global construction
+    and modifier sets are included such that references to them resolve but
+    they are never reported as duplicates.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+
+    Properties:
+        * model_dict
+        * resources
+        * duplicates
+    """
+
+    def __init__(self, model_dict):
+        self.model_dict = model_dict
+        self.resources = {}
+        self.duplicates = {}
+        properties = model_dict.get("properties") or {}
+        for extension, keys in RESOURCE_LISTS.items():
+            ext_properties = properties.get(extension) or {}
+            for key in keys:
+                index, duplicates = {}, []
+                for obj in _dicts(ext_properties.get(key)):
+                    identifier = obj.get("identifier")
+                    if identifier in index:
+                        duplicates.append(identifier)
+                    else:
+                        index[identifier] = obj
+                self.resources[key] = index
+                if duplicates:
+                    self.duplicates[key] = duplicates
+        for extension, global_set, key in _GLOBAL_RESOURCES:
+            ext_properties = properties.get(extension) or {}
+            index = self.resources[key]
+            for obj in _dicts((ext_properties.get(global_set) or {}).get(key)):
+                index.setdefault(obj.get("identifier"), obj)
+
+    def get(self, key, identifier, default=None):
+        """Get a resource dictionary from its identifier.
+
+        Args:
+            key: The name of the resource list (eg. schedules or modifiers).
+            identifier: Text for the identifier of the resource.
+            default: Value to return if the resource is not in the Model.
+        """
+        return self.resources[key].get(identifier, default)
+
+    def has(self, key, identifier):
+        """Check whether a resource with a given identifier is in the Model."""
+        return identifier in self.resources[key]
+
+    def references(self, obj):
+        """Iterate over the references of an object and all of its nested objects.
+
+        Args:
+            obj: A dictionary of any Model object (eg. a Construction or the
+                properties of a Room).
+
+        Yields:
+            A Reference for each identifier that refers to a resource.
+        """
+        stack = [obj]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, list):
+                stack.extend(v for v in value if isinstance(v, (dict, list)))
+                continue
+            obj_type = value.get("type")
+            fields = REFERENCE_FIELDS.get(obj_type)
+            if fields is not None:
+                for field, key in fields.items():
+                    index = self.resources[key]
+                    for identifier in _identifiers(value.get(field)):
+                        yield Reference(
+                            key, identifier, obj_type, field, identifier in index)
+            if obj_type in _RULESET_TYPES:
+                yield from _ruleset_references(value)
+            stack.extend(v for v in value.values() if isinstance(v, (dict, list)))
+
+    def check(self):
+        """Check the Model for duplicated resource identifiers and dangling references.
+
+        Returns:
+            A list of ValidationErrors with one error for each duplicated
+            identifier and one for each reference that does not resolve.
+        """
+        errors = []
+        for key, identifiers in self.duplicates.items():
+            element_type, extension_type = ELEMENT_TYPES[key]
+            for identifier in identifiers:
+                errors.append(ValidationError(
+                    code=DUPLICATE_CODES[key],
+                    error_type="Duplicate {} Identifier".format(element_type.value),
+                    extension_type=extension_type,
+                    element_type=element_type,
+                    element_id=[element_id(identifier, key, "?")],
+                    message='The {} identifier "{}" is used by more than one {} '
+                    "in the Model.".format(
+                        element_type.value, identifier, element_type.value),
+                ))
+
+        properties = self.model_dict.get("properties") or {}
+        for extension, keys in RESOURCE_LISTS.items():
+            ext_properties = properties.get(extension) or {}
+            for key in keys:
+                element_type = ELEMENT_TYPES[key][0]
+                for i, obj in enumerate(_dicts(ext_properties.get(key))):
+                    errors.extend(self._missing_errors(
+                        obj, element_type, element_id(obj.get("identifier"), key, i)))
+
+        for element_type, obj, parents in iter_objects(self.model_dict):
+            obj_properties = obj.get("properties")
+            if not isinstance(obj_properties, dict):
+                continue
+            obj_id = element_id(obj.get("identifier"), element_type.value, "?")
+            for extension in RESOURCE_LISTS:
+                ext_properties = obj_properties.get(extension)
+                if isinstance(ext_properties, dict):
+                    errors.extend(self._missing_errors(
+                        ext_properties, element_type, obj_id, obj, parents))
+        return errors
+
+    def _missing_errors(self, obj, element_type, obj_id, source=None, parents=()):
+        """Get ValidationErrors for the dangling references of an object."""
+        errors = []
+        for ref in self.references(obj):
+            if ref.resolved:
+                continue
+            if ref.key == "day_schedules":
+                code, extension_type = MISSING_CODES["schedules"], ExtensionTypes.energy
+                message = 'The ScheduleDay "{}" referenced by the {} of {} "{}" is ' \
+                    "not one of its day_schedules.".format(
+                        ref.identifier, ref.field, ref.source_type, obj_id)
+            else:
+                code = MISSING_CODES[ref.key]
+                resource_type, extension_type = ELEMENT_TYPES[ref.key]
+                message = 'The {} "{}" referenced by the {} of {} "{}" is not ' \
+                    "in the Model.".format(
+                        resource_type.value, ref.identifier, ref.field,
+                        ref.source_type, obj_id)
+            error = {
+                "code": code,
+                "error_type": "Missing Resource Reference",
+                "extension_type": extension_type,
+                "element_type": element_type,
+                "element_id": [obj_id],
+                "message": message,
+            }
+            if source is not None and source.get("display_name"):
+                error["element_name"] = [source["display_name"]]
+            if parents:
+                error["parents"] = [validation_parents(parents)]
+            errors.append(ValidationError(**error))
+        return errors
+
+
+def check_references(model_dict):
+    """Check that all resource identifiers of a Model are unique and all references resolve.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+
+    Returns:
+        A ValidationReport with a ValidationError for each duplicated resource
+        identifier and each reference to a resource that is not in the Model.
+    """
+    return validation_report(ReferenceIndex(model_dict).check())
+
+
+def _dicts(items):
+    """Get the dictionaries in a list, ignoring any other values."""
+    if not isinstance(items, list):
+        return []
+    return [item for item in items if isinstance(item, dict)]
+
+
+def _identifiers(value):
+    """Get the identifier strings of a reference field that is a string or a list."""
+    if isinstance(value, str):
+        return (value,)
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str)]
+    return ()
+
+
+def _ruleset_references(schedule):
+    """Get the references of a ScheduleRuleset to its own ScheduleDays."""
+    days = {day.get("identifier") for day in _dicts(schedule.get("day_schedules"))}
+    obj_type = schedule.get("type")
+    for field in _RULESET_DAY_FIELDS:
+        for identifier in _identifiers(schedule.get(field)):
+            yield Reference("day_schedules", identifier, obj_type, field, identifier in days)
+    for rule in _dicts(schedule.get("schedule_rules")):
+        for identifier in _identifiers(rule.get("schedule_day")):
+            yield Reference(
+                "day_schedules", identifier, "ScheduleRuleAbridged", "schedule_day",
+                identifier in days)
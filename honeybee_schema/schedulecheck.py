@@ -0,0 +1,131 @@
+"""Check the values of the schedules of a Model against their ScheduleTypeLimits.
+
+The schema only checks that each ScheduleTypeLimit is well formed and that
+schedules refer to one by identifier. It does not check the values of the
+schedules, so schedules with values outside of their limits only fail once the
+Model is simulated. The checks here resolve the ScheduleTypeLimit of every
+schedule and test all of its values in bulk.
+"""
+
+from array import array
+
+from .validation import ExtensionTypes, ObjectTypes, ValidationError
+from ._report import element_id, validation_report
+from .reference import ReferenceIndex
+
+# error codes for schedule values that are out of range or not discrete
+RANGE_CODE = "020401"
+DISCRETE_CODE = "020402"
+
+
+def schedule_value_errors(model_dict, index=None):
+    """Get ValidationErrors for the schedule values that do not fit their type limits.
+
+    Both ScheduleRulesets (all values of their day_schedules) and
+    ScheduleFixedIntervals are checked. Schedules without a ScheduleTypeLimit
+    or with one that is not in the Model are skipped since the latter is
+    reported by the reference check.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        index: An optional ReferenceIndex of the Model to look up the
+            ScheduleTypeLimits. If None, one will be created.
+
+    Returns:
+        A list of ValidationErrors with one error for each schedule that has
+        values outside of its limits and one for each schedule with values
+        that are not integers while its limits are Discrete.
+    """
+    index = index or ReferenceIndex(model_dict)
+    energy = (model_dict.get("properties") or {}).get("energy") or {}
+    schedules = energy.get("schedules")
+    errors = []
+    for i, schedule in enumerate(schedules if isinstance(schedules, list) else ()):
+        if not isinstance(schedule, dict):
+            continue
+        limit = schedule.get("schedule_type_limit")
+        if isinstance(limit, str):
+            limit = index.get("schedule_type_limits", limit)
+        if not isinstance(limit, dict):
+            continue
+        values = _schedule_values(schedule)
+        if values:
+            errors.extend(_limit_errors(
+                schedule, element_id(schedule.get("identifier"), "schedules", i),
+                values, limit))
+    return errors
+
+
+def check_schedule_values(model_dict):
+    """Check that the values of all schedules of a Model fit their ScheduleTypeLimits.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+
+    Returns:
+        A ValidationReport with a ValidationError for each schedule with
+        values outside of its limits or values that should be discrete.
+    """
+    return validation_report(schedule_value_errors(model_dict))
+
+
+def _schedule_values(schedule):
+    """Get an array of all values of a ScheduleRuleset or ScheduleFixedInterval."""
+    values = schedule.get("values")
+    try:
+        if isinstance(values, list):
+            return array("d", values)
+        day_values = array("d")
+        for day in schedule.get("day_schedules") or ():
+            day_values.extend(array("d", day.get("values") or ()))
+        return day_values
+    except (TypeError, AttributeError):
+        return None  # invalid schedules are reported by the schema validation
+
+
+def _limit(value):
+    """Get a numerical limit or None for NoLimit."""
+    return value if isinstance(value, (int, float)) else None
+
+
+def _limit_errors(schedule, schedule_id, values, limit):
+    """Get the ValidationErrors for the values of one schedule and its limits."""
+    errors = []
+    lower, upper = _limit(limit.get("lower_limit")), _limit(limit.get("upper_limit"))
+    low, high = min(values), max(values)
+    if (lower is not None and low < lower) or (upper is not None and high > upper):
+        outside = sum(
+            1 for v in values
+            if (lower is not None and v < lower) or (upper is not None and v > upper)
+        )
+        errors.append(_error(
+            schedule, schedule_id, RANGE_CODE, "Schedule Value Out Of Range",
+            '{} values of schedule "{}" are outside of the limits of its '
+            'ScheduleTypeLimit "{}" ({} to {}). The values range from {} to {}.'.format(
+                outside, schedule_id, limit.get("identifier"),
+                "no limit" if lower is None else lower,
+                "no limit" if upper is None else upper, low, high)))
+    if limit.get("numeric_type") == "Discrete":
+        fractional = len(values) - sum(map(float.is_integer, values))
+        if fractional:
+            errors.append(_error(
+                schedule, schedule_id, DISCRETE_CODE, "Schedule Value Not Discrete",
+                '{} values of schedule "{}" are not integers but its '
+                'ScheduleTypeLimit "{}" is Discrete.'.format(
+                    fractional, schedule_id, limit.get("identifier"))))
+    return errors
+
+
+def _error(schedule, schedule_id, code, error_type, message):
+    """Get a ValidationError for a schedule."""
+    error = {
+        "code": code,
+        "error_type": error_type,
+        "extension_type": ExtensionTypes.energy,
+        "element_type": ObjectTypes.schedule,
+        "element_id": [schedule_id],
+        "message": message,
+    }
+    if schedule.get("display_name"):
+        error["element_name"] = [schedule["display_name"]]
+    return ValidationError(**error)
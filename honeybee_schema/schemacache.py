@@ -0,0 +1,192 @@
+"""Cache the validators of the schema objects on disk for fast cold starts.
+
+Building the pydantic validators for a Model means generating the core schema of
+every class that can be reached from it, which dominates the first validation in
+a new process. The build_cache function generates these core schemas once and
+pickles them to a cache folder. In a new process, load_cache creates the
+validators and serializers directly from the pickled core schemas, skipping
+the schema generation.
+
+Cache files are keyed by the version of honeybee-schema, the versions of
+pydantic and pydantic-core, the Python version and a fingerprint of the package
+source files. A cache that does not match the running environment is never
+loaded. Note that the cache is a pickle file and it should only be loaded from a
+folder that is not writable by untrusted users.
+"""
+
+import os
+import sys
+import hashlib
+import importlib
+import pickle
+import tempfile
+
+from ._report import schema_version
+
+# classes for which validators are cached, as (module, class name) pairs
+CACHED_MODELS = (
+    ("honeybee_schema.model", "Model"),
+    ("honeybee_schema.model", "Room"),
+    ("honeybee_schema.model", "Face"),
+    ("honeybee_schema.model", "Aperture"),
+    ("honeybee_schema.model", "Door"),
+    ("honeybee_schema.model", "Shade"),
+    ("honeybee_schema.model", "ShadeMesh"),
+    ("honeybee_schema.energy.simulation", "SimulationParameter"),
+)
+
+CACHE_ENV_VAR = "HONEYBEE_SCHEMA_CACHE"
+
+
+def cache_folder():
+    """Get the default folder for schema cache files.
+
+    This is the folder in the HONEYBEE_SCHEMA_CACHE environment variable if it
+    is set. Otherwise, it is a honeybee_schema folder in the user cache
+    directory (eg. ~/.cache/honeybee_schema).
+    """
+    folder = os.environ.get(CACHE_ENV_VAR)
+    if folder:
+        return folder
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "honeybee_schema")
+
+
+def cache_key():
+    """Get a text key that identifies the cache for the running environment."""
+    import pydantic
+    import pydantic_core
+
+    fingerprint = hashlib.sha256()
+    for item in (
+        schema_version(),
+        pydantic.VERSION,
+        pydantic_core.__version__,
+        sys.version,
+        *_source_stats(),
+    ):
+        fingerprint.update(str(item).encode("utf-8"))
+    return "{}-pydantic-{}-{}".format(
+        schema_version(), pydantic.VERSION, fingerprint.hexdigest()[:16]
+    )
+
+
+def cache_path(folder=None):
+    """Get the path to the cache file for the running environment.
+
+    Args:
+        folder: The folder of the cache. If None, the cache_folder() is used.
+    """
+    folder = folder or cache_folder()
+    return os.path.join(folder, "schema-{}.pickle".format(cache_key()))
+
+
+def build_cache(folder=None):
+    """Build the validators of the CACHED_MODELS and write them to a cache file.
+
+    Args:
+        folder: The folder in which the cache is written. If None, the
+            cache_folder() is used.
+
+    Returns:
+        The path to the written cache file.
+    """
+    schemas = {}
+    for module_name, class_name in CACHED_MODELS:
+        model_class = _import_class(module_name, class_name)
+        model_class.model_rebuild()
+        # the validator reduces to its core schema and config when pickled
+        core_schema, core_config = model_class.__pydantic_validator__.__reduce__()[1][:2]
+        schemas[(module_name, class_name)] = (_strip_metadata(core_schema), core_config)
+    path = cache_path(folder)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # write to a temporary file first such that readers never see a partial cache
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as cache_file:
+            pickle.dump(schemas, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return path
+
+
+def load_cache(folder=None):
+    """Set the validators of the CACHED_MODELS from the cache file if it exists.
+
+    Classes that have already been built are left untouched. If the cache file
+    does not exist or cannot be read, nothing is changed and the validators are
+    built by pydantic on first use as usual.
+
+    Args:
+        folder: The folder of the cache. If None, the cache_folder() is used.
+
+    Returns:
+        True if the validators were loaded from the cache. False otherwise.
+    """
+    from pydantic_core import SchemaSerializer, SchemaValidator
+
+    try:
+        with open(cache_path(folder), "rb") as cache_file:
+            schemas = pickle.load(cache_file)
+        validators = {
+            key: (
+                SchemaValidator(core_schema, core_config),
+                SchemaSerializer(core_schema, core_config),
+            )
+            for key, (core_schema, core_config) in schemas.items()
+        }
+    except Exception:  # a missing, stale or corrupt cache is rebuilt on first use
+        return False
+    for (module_name, class_name), (validator, serializer) in validators.items():
+        model_class = _import_class(module_name, class_name)
+        if model_class.__pydantic_complete__:
+            continue
+        # the core schema itself is regenerated only if requested (eg. for JSON schema)
+        model_class.__pydantic_validator__ = validator
+        model_class.__pydantic_serializer__ = serializer
+    return True
+
+
+def _import_class(module_name, class_name):
+    """Import a class from a module."""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _source_stats():
+    """Get the relative path, size and modification time of each package source file."""
+    package = os.path.dirname(os.path.abspath(__file__))
+    stats = []
+    for folder, _, files in os.walk(package):
+        for file_name in files:
+            if file_name.endswith(".py"):
+                path = os.path.join(folder, file_name)
+                stat = os.stat(path)
+                stats.append(
+                    (os.path.relpath(path, package), stat.st_size, stat.st_mtime_ns)
+                )
+    return sorted(stats)
+
+
+def _strip_metadata(core_schema):
+    """Remove the metadata of a core schema, which is only used for JSON schemas.
+
+    The metadata can hold local functions that cannot be pickled.
+    """
+    if isinstance(core_schema, dict):
+        # only schema nodes have a text type (eg. a dict of fields does not)
+        is_node = isinstance(core_schema.get("type"), str)
+        return {
+            key: _strip_metadata(value)
+            for key, value in core_schema.items()
+            if not (is_node and key == "metadata")
+        }
+    if isinstance(core_schema, list):
+        return [_strip_metadata(value) for value in core_schema]
+    if isinstance(core_schema, tuple):
+        return tuple(_strip_metadata(value) for value in core_schema)
+    return core_schema
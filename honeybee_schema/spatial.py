@@ -0,0 +1,379 @@
+"""A spatial index over the Face3D and Mesh3D geometry of a Model.
+
+The SpatialIndex holds the bounding box of every Face, Aperture, Door, Shade
+and ShadeMesh of a Model in flat arrays and organizes them in a bounding volume
+hierarchy (BVH). Queries for the objects within a box, the objects coplanar
+with a face and the first object hit by a ray only test the boxes along the
+branches of the hierarchy that can contain a result, which replaces the
+pairwise comparison of all objects. An index is built once per Model and can be
+passed to solve_adjacency and adjacency_errors, which then find adjacent Faces
+and read their areas from the index instead of computing them again.
+"""
+
+import math
+from array import array
+from operator import mul
+from typing import Any, NamedTuple
+
+from ._geometry import face_area, face_loops, face_normal, magnitude, model_tolerances
+from ._traverse import iter_objects
+
+# maximum number of objects in a leaf of the hierarchy
+LEAF_SIZE = 8
+
+
+class SpatialEntry(NamedTuple):
+    """An object with geometry in a SpatialIndex.
+
+    Properties:
+        element_type: The ObjectTypes of the object.
+        obj: The dictionary of the object.
+        parents: The parents of the object as yielded by iter_objects.
+        normal: A tuple for the unit normal of the plane of a Face3D. None for
+            a Mesh3D or a Face3D without area.
+        offset: The distance of the plane of a Face3D from the origin along
+            its normal. None for a Mesh3D or a Face3D without area.
+        area: The area of a Face3D without its holes. None for a Mesh3D or a
+            Face3D without area.
+    """
+
+    element_type: Any
+    obj: dict
+    parents: tuple
+    normal: tuple | None
+    offset: float | None
+    area: float | None
+
+
+class SpatialIndex:
+    """A bounding volume hierarchy over the Face3D and Mesh3D geometry of a Model.
+
+    The index assumes that the geometry of the Model is not edited after it
+    is built. It should be built again after any edit.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        tolerance: The distance by which bounding boxes are expanded and within
+            which planes are considered coplanar. If None, the tolerance of
+            the Model is used.
+        angle_tolerance: The angle in degrees within which the normals of
+            coplanar planes can deviate. If None, the angle_tolerance of the
+            Model is used.
+
+    Properties:
+        * entries
+        * tolerance
+        * angle_tolerance
+    """
+
+    def __init__(self, model_dict, tolerance=None, angle_tolerance=None):
+        self.tolerance, self.angle_tolerance = \
+            model_tolerances(model_dict, tolerance, angle_tolerance)
+        self.entries = []
+        # six values for each entry: min x, y, z and max x, y, z
+        self._boxes = array("d")
+        for element_type, obj, parents in iter_objects(model_dict):
+            self._add(element_type, obj, parents)
+        self._positions = {id(entry.obj): i for i, entry in enumerate(self.entries)}
+        self._build()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def index_of(self, obj):
+        """Get the position of an object dictionary in the entries or None."""
+        return self._positions.get(id(obj))
+
+    def box(self, i):
+        """Get the bounding box of an entry as a tuple of its min and max points."""
+        b = self._boxes[6 * i:6 * i + 6]
+        return (b[0], b[1], b[2]), (b[3], b[4], b[5])
+
+    def query_box(self, min_point, max_point):
+        """Get the entries with a bounding box that overlaps a box.
+
+        Args:
+            min_point: A list of the minimum x, y and z of the box.
+            max_point: A list of the maximum x, y and z of the box.
+
+        Returns:
+            A list with the positions of the overlapping entries.
+        """
+        tol = self.tolerance
+        x0, y0, z0 = (c - tol for c in min_point)
+        x1, y1, z1 = (c + tol for c in max_point)
+        nodes, boxes, found = self._nodes, self._boxes, []
+        stack = [0] if self.entries else []
+        while stack:
+            node = stack.pop()
+            n = 6 * node
+            if nodes[n] > x1 or nodes[n + 3] < x0 or nodes[n + 1] > y1 or \
+                    nodes[n + 4] < y0 or nodes[n + 2] > z1 or nodes[n + 5] < z0:
+                continue
+            left = self._left[node]
+            if left >= 0:
+                stack.append(left)
+                stack.append(left + 1)
+                continue
+            start = self._start[node]
+            for i in self._order[start:start + self._count[node]]:
+                b = 6 * i
+                if boxes[b] <= x1 and boxes[b + 3] >= x0 and boxes[b + 1] <= y1 and \
+                        boxes[b + 4] >= y0 and boxes[b + 2] <= z1 and boxes[b + 5] >= z0:
+                    found.append(i)
+        return found
+
+    def query_boxes(self, boxes):
+        """Get the entries that overlap each of several boxes.
+
+        Args:
+            boxes: A list of (min_point, max_point) tuples.
+
+        Returns:
+            A list with a list of entry positions for each box.
+        """
+        return [self.query_box(min_point, max_point) for min_point, max_point in boxes]
+
+    def coplanar(self, i, opposite=False):
+        """Get the Face3D entries that overlap and are coplanar with an entry.
+
+        Args:
+            i: The position of an entry with a Face3D.
+            opposite: Boolean to only include entries with a normal that points
+                in the opposite direction, such as the matching Face of an
+                adjacent Room. (Default: False).
+
+        Returns:
+            A list with the positions of the coplanar entries, sorted from the
+            one with the nearest bounding box center to the farthest. The entry
+            itself is not included.
+        """
+        entry = self.entries[i]
+        if entry.normal is None:
+            return []
+        min_cos = math.cos(math.radians(self.angle_tolerance))
+        center = self._center(i)
+        found = []
+        for j in self.query_box(*self.box(i)):
+            other = self.entries[j]
+            if j == i or other.normal is None:
+                continue
+            cos = sum(map(mul, entry.normal, other.normal))
+            if cos >= min_cos and not opposite:
+                distance = abs(other.offset - entry.offset)
+            elif cos <= -min_cos:
+                distance = abs(other.offset + entry.offset)
+            else:
+                continue
+            if distance <= self.tolerance:
+                found.append((math.dist(center, self._center(j)), j))
+        found.sort()
+        return [j for _, j in found]
+
+    def ray(self, origin, direction, max_distance=math.inf):
+        """Get the first entry hit by a ray.
+
+        Args:
+            origin: A list of the x, y and z of the start of the ray.
+            direction: A list of the x, y and z of the direction of the ray.
+            max_distance: The maximum distance along the ray for a hit, in
+                multiples of the length of the direction.
+
+        Returns:
+            A tuple with the position of the entry that was hit and the distance
+            to the hit in multiples of the length of the direction. None if
+            nothing was hit.
+        """
+        inverse = [1 / d if d else math.inf for d in direction]
+        nodes, best = self._nodes, None
+        stack = [0] if self.entries else []
+        while stack:
+            node = stack.pop()
+            near = _slab(nodes, 6 * node, origin, inverse, max_distance)
+            if near is None:
+                continue
+            left = self._left[node]
+            if left >= 0:
+                stack.append(left)
+                stack.append(left + 1)
+                continue
+            start = self._start[node]
+            for i in self._order[start:start + self._count[node]]:
+                if _slab(self._boxes, 6 * i, origin, inverse, max_distance) is None:
+                    continue
+                t = self._hit(i, origin, direction)
+                if t is not None and t <= max_distance:
+                    max_distance, best = t, (i, t)
+        return best
+
+    def rays(self, rays, max_distance=math.inf):
+        """Get the first entry hit by each of several rays.
+
+        Args:
+            rays: A list of (origin, direction) tuples.
+            max_distance: The maximum distance along each ray for a hit.
+
+        Returns:
+            A list with the result of the ray method for each ray.
+        """
+        return [self.ray(origin, direction, max_distance) for origin, direction in rays]
+
+    def _add(self, element_type, obj, parents):
+        """Add an object to the entries if it has Face3D or Mesh3D geometry."""
+        geometry = obj.get("geometry")
+        loops = face_loops(geometry)
+        normal = offset = area = None
+        if loops is not None:
+            xs, ys, zs = loops[0]
+            vector = face_normal(geometry, loops[0])
+            length = magnitude(vector)
+            if length > 0:
+                normal = tuple(v / length for v in vector)
+                offset = normal[0] * xs[0] + normal[1] * ys[0] + normal[2] * zs[0]
+                area = face_area(loops)
+        elif isinstance(geometry, dict) and geometry.get("type") == "Mesh3D":
+            try:
+                xs, ys, zs = map(list, zip(*geometry["vertices"]))
+            except (TypeError, KeyError, ValueError):
+                return  # invalid geometry is reported by the schema validation
+        else:
+            return
+        self.entries.append(
+            SpatialEntry(element_type, obj, parents, normal, offset, area))
+        self._boxes.extend((min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)))
+
+    def _center(self, i):
+        """Get the center of the bounding box of an entry."""
+        b = self._boxes[6 * i:6 * i + 6]
+        return ((b[0] + b[3]) / 2, (b[1] + b[4]) / 2, (b[2] + b[5]) / 2)
+
+    def _build(self):
+        """Build the hierarchy by splitting the entries at the median of their centers."""
+        count = len(self.entries)
+        centers = [self._center(i) for i in range(count)]
+        order = list(range(count))
+        nodes, left, starts, counts = array("d"), array("l"), array("l"), array("l")
+
+        def new_node(start, end):
+            boxes = self._boxes
+            items = order[start:end]
+            nodes.extend(
+                min(boxes[6 * i + k] for i in items) for k in range(3))
+            nodes.extend(
+                max(boxes[6 * i + k] for i in items) for k in range(3, 6))
+            left.append(-1)
+            starts.append(start)
+            counts.append(end - start)
+            return len(left) - 1
+
+        stack = [(new_node(0, count), 0, count)] if count else []
+        while stack:
+            node, start, end = stack.pop()
+            if end - start <= LEAF_SIZE:
+                continue
+            items = order[start:end]
+            spans = [
+                max(centers[i][axis] for i in items) -
+                min(centers[i][axis] for i in items)
+                for axis in range(3)
+            ]
+            axis = spans.index(max(spans))
+            order[start:end] = sorted(items, key=lambda i: centers[i][axis])
+            middle = (start + end) // 2
+            left[node] = new_node(start, middle)
+            new_node(middle, end)  # the right child always follows the left one
+            stack.append((left[node], start, middle))
+            stack.append((left[node] + 1, middle, end))
+
+        self._order = array("l", order)
+        self._nodes, self._left, self._start, self._count = nodes, left, starts, counts
+
+    def _hit(self, i, origin, direction):
+        """Get the distance along a ray to the geometry of an entry or None."""
+        entry = self.entries[i]
+        geometry = entry.obj["geometry"]
+        if geometry.get("type") == "Face3D":
+            if entry.normal is None:
+                return None
+            return _face_hit(entry, face_loops(geometry), origin, direction)
+        vertices = geometry["vertices"]
+        best = None
+        for face in geometry.get("faces") or ():
+            for k in range(1, len(face) - 1):
+                t = _triangle_hit(
+                    vertices[face[0]], vertices[face[k]], vertices[face[k + 1]],
+                    origin, direction)
+                if t is not None and (best is None or t < best):
+                    best = t
+        return best
+
+
+def _slab(boxes, b, origin, inverse, max_distance):
+    """Get the distance at which a ray enters a box or None if it misses the box."""
+    near, far = 0.0, max_distance
+    for axis in range(3):
+        inv = inverse[axis]
+        low, high = boxes[b + axis], boxes[b + axis + 3]
+        if inv == math.inf:
+            if origin[axis] < low or origin[axis] > high:
+                return None
+            continue
+        t0, t1 = (low - origin[axis]) * inv, (high - origin[axis]) * inv
+        if t0 > t1:
+            t0, t1 = t1, t0
+        near, far = max(near, t0), min(far, t1)
+        if near > far:
+            return None
+    return near
+
+
+def _face_hit(entry, loops, origin, direction):
+    """Get the distance along a ray to a Face3D or None if the ray misses it."""
+    normal = entry.normal
+    denominator = sum(map(mul, normal, direction))
+    if abs(denominator) < 1e-12:
+        return None
+    t = (entry.offset - sum(map(mul, normal, origin))) / denominator
+    if t < 0:
+        return None
+    point = [o + t * d for o, d in zip(origin, direction)]
+    drop = max(range(3), key=lambda k: abs(normal[k]))
+    u, v = [k for k in range(3) if k != drop]
+    px, py = point[u], point[v]
+    inside = False
+    for loop in loops:
+        xs, ys = loop[u], loop[v]
+        for x0, y0, x1, y1 in zip(xs, ys, xs[-1:] + xs[:-1], ys[-1:] + ys[:-1]):
+            if (y0 > py) != (y1 > py) and px < (x1 - x0) * (py - y0) / (y1 - y0) + x0:
+                inside = not inside
+    return t if inside else None
+
+
+def _triangle_hit(a, b, c, origin, direction):
+    """Get the distance along a ray to a triangle or None if the ray misses it."""
+    e1 = [q - p for p, q in zip(a, b)]
+    e2 = [q - p for p, q in zip(a, c)]
+    p = _cross(direction, e2)
+    determinant = sum(map(mul, e1, p))
+    if abs(determinant) < 1e-12:
+        return None
+    inverse = 1 / determinant
+    s = [o - q for o, q in zip(origin, a)]
+    u = sum(map(mul, s, p)) * inverse
+    if u < 0 or u > 1:
+        return None
+    q = _cross(s, e1)
+    v = sum(map(mul, direction, q)) * inverse
+    if v < 0 or u + v > 1:
+        return None
+    t = sum(map(mul, e2, q)) * inverse
+    return t if t >= 0 else None
+
+
+def _cross(a, b):
+    """Get the cross product of two vectors."""
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
@@ -0,0 +1,160 @@
+"""Validate Model JSON files one element at a time with bounded memory."""
+
+from functools import lru_cache
+from typing import Any, NamedTuple, get_args, get_origin
+
+from pydantic import TypeAdapter, ValidationError
+
+from ._jsonstream import JsonStream, CHUNK_SIZE
+from .model import (
+    Model,
+    ModelProperties,
+    Room,
+    Face,
+    Shade,
+    Aperture,
+    Door,
+    ShadeMesh,
+)
+from .energy.properties import ModelEnergyProperties
+from .radiance.properties import ModelRadianceProperties
+
+# top-level Model keys holding lists of geometry objects and the class of each item
+MODEL_COLLECTIONS = {
+    "rooms": Room,
+    "orphaned_faces": Face,
+    "orphaned_shades": Shade,
+    "orphaned_apertures": Aperture,
+    "orphaned_doors": Door,
+    "shade_meshes": ShadeMesh,
+}
+
+# Model properties keys with lists of resources that are validated item by item
+EXTENSION_PROPERTIES = {
+    "energy": ModelEnergyProperties,
+    "radiance": ModelRadianceProperties,
+}
+
+
+class ElementResult(NamedTuple):
+    """The outcome of validating a single element of a Model.
+
+    Properties:
+        path: Tuple of keys locating the element in the Model JSON (eg.
+            ('properties', 'energy', 'schedules')). This is an empty tuple for
+            the Model header, which contains all keys of the Model that are
+            not validated as separate elements.
+        index: Index of the element within its parent list or None if the
+            element is not a list item.
+        identifier: The identifier of the element if it has one.
+        value: The validated pydantic object or None if validation failed.
+        error: The pydantic ValidationError if validation failed. Otherwise None.
+    """
+
+    path: tuple
+    index: int | None
+    identifier: str | None
+    value: Any
+    error: ValidationError | None
+
+
+@lru_cache(maxsize=None)
+def item_adapter(model_class, field_name):
+    """Get a TypeAdapter for the items of a list field of a pydantic model class.
+
+    Args:
+        model_class: A pydantic model class.
+        field_name: The name of a field on the model_class.
+
+    Returns:
+        A TypeAdapter for one item of the field or None if the field is
+        not a list.
+    """
+    field = model_class.model_fields.get(field_name)
+    if field is None:
+        return None
+    annotations = [field.annotation, *get_args(field.annotation)]
+    for annotation in annotations:
+        if get_origin(annotation) is list:
+            return TypeAdapter(get_args(annotation)[0])
+    return None
+
+
+def validate_model_stream(model_json, chunk_size=CHUNK_SIZE):
+    """Validate a Model JSON file one Room, orphaned object and resource at a time.
+
+    The JSON file is read incrementally such that only the element being
+    validated is held in memory. Every Room, orphaned object, ShadeMesh and
+    every item of the lists under properties.energy and properties.radiance
+    is validated on its own. All remaining keys are validated together with
+    their parent object once the parent has been read.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        chunk_size: Number of bytes to read from the file at a time.
+
+    Yields:
+        An ElementResult for each element of the Model. The result for the
+        Model header (identifier, units, tolerance, etc.) is yielded last.
+    """
+    with open(model_json, "rb") as json_file:
+        stream = JsonStream(json_file, chunk_size)
+        header = {}
+        for key in stream.iter_object():
+            if key in MODEL_COLLECTIONS and stream.peek() == "[":
+                validator = MODEL_COLLECTIONS[key].model_validate
+                yield from _validate_items(stream, (key,), validator)
+            elif key == "properties" and stream.peek() == "{":
+                # keep a stub so that the header reports missing properties correctly
+                header[key] = {"type": "ModelProperties"}
+                yield from _validate_properties(stream)
+            else:
+                header[key] = stream.read_value()
+        yield validate_element((), None, header, Model.model_validate)
+
+
+def validate_element(path, index, element, validator):
+    """Validate a single decoded JSON element and package it as an ElementResult.
+
+    Args:
+        path: Tuple of keys locating the element in the Model JSON.
+        index: Index of the element within its parent list or None.
+        element: The decoded JSON of the element.
+        validator: A function that validates the element (eg. Room.model_validate).
+    """
+    identifier = element.get("identifier") if isinstance(element, dict) else None
+    try:
+        return ElementResult(path, index, identifier, validator(element), None)
+    except ValidationError as e:
+        return ElementResult(path, index, identifier, None, e)
+
+
+def _validate_items(stream, path, validator):
+    """Validate each item of the JSON array at the stream position."""
+    for index in stream.iter_array():
+        yield validate_element(path, index, stream.read_value(), validator)
+
+
+def _validate_properties(stream):
+    """Validate the Model properties with the extension resources item by item."""
+    properties = {}
+    for key in stream.iter_object():
+        if key in EXTENSION_PROPERTIES and stream.peek() == "{":
+            yield from _validate_extension(stream, key, EXTENSION_PROPERTIES[key])
+        else:
+            properties[key] = stream.read_value()
+    path = ("properties",)
+    yield validate_element(path, None, properties, ModelProperties.model_validate)
+
+
+def _validate_extension(stream, key, properties_class):
+    """Validate the properties of one extension with each list item on its own."""
+    properties = {}
+    path = ("properties", key)
+    for field in stream.iter_object():
+        adapter = item_adapter(properties_class, field)
+        if adapter is not None and stream.peek() == "[":
+            yield from _validate_items(stream, path + (field,), adapter.validate_python)
+        else:
+            properties[field] = stream.read_value()
+    yield validate_element(path, None, properties, properties_class.model_validate)
@@ -0,0 +1,247 @@
+"""Apply SyncInstructions to merge the edits of an updated Model into a base Model.
+
+Only the top-level objects named by the instructions are touched. They are
+found through dictionaries from identifier to position that are built for
+the lists of the base Model with instructions, such that the rest of the base
+Model is neither copied nor rewritten. The energy and radiance resources
+referenced by the added and changed objects are copied from the updated Model
+when the base Model does not have them yet.
+"""
+
+import copy
+
+from .comparison import SyncInstructions
+from .reference import RESOURCE_LISTS, ReferenceIndex
+from ._jsonstream import load_json
+from ._traverse import iter_tree
+
+# top-level lists of the Model where each type of object of the instructions can be
+SYNCED_LISTS = {
+    "Room": ("rooms",),
+    "Face": ("orphaned_faces",),
+    "Aperture": ("orphaned_apertures",),
+    "Door": ("orphaned_doors",),
+    "Shade": ("orphaned_shades", "shade_meshes"),
+}
+
+# extensions of the object properties and the ChangedInstruction field for each
+_EXTENSIONS = (("energy", "update_energy"), ("radiance", "update_radiance"))
+
+# type of the Model properties of each extension
+_PROPERTY_TYPES = {
+    "energy": "ModelEnergyProperties",
+    "radiance": "ModelRadianceProperties",
+}
+
+
+def sync_model(base_model, new_model, sync_instructions):
+    """Apply SyncInstructions to a base Model using the objects of a new Model.
+
+    Changed objects get the geometry and each extension's properties from
+    either the new or the base Model as the instruction requests. Properties
+    of child objects (eg. the construction of a Face) are matched between the
+    two Models by the identifier of the child. Resources that are referenced
+    by the added and changed objects and are missing in the base Model are
+    copied from the new Model along with the resources they reference in
+    turn. Resources that are already in the base Model are kept as they are.
+
+    Args:
+        base_model: A dictionary of the base Honeybee Model or the path to its
+            JSON file. A dictionary is edited in place.
+        new_model: A dictionary of the new Honeybee Model or the path to its
+            JSON file. It is not edited.
+        sync_instructions: A SyncInstructions object, its dictionary or the path
+            to its JSON file.
+
+    Returns:
+        The dictionary of the synced base Model.
+    """
+    base_model, new_model = load_json(base_model), load_json(new_model)
+    instructions = sync_instructions
+    if not isinstance(instructions, SyncInstructions):
+        instructions = SyncInstructions.model_validate(load_json(instructions))
+    base_lists = _ListIndex(base_model, "base")
+    new_lists = _ListIndex(new_model, "new")
+    synced = []
+
+    for instruction in instructions.changed_objects or ():
+        base_key, base_position = base_lists.locate(instruction)
+        new_key, new_position = new_lists.locate(instruction)
+        obj = _changed_object(
+            base_model[base_key][base_position], new_model[new_key][new_position],
+            instruction)
+        base_model[base_key][base_position] = obj
+        synced.append(obj)
+
+    deleted = {}
+    for instruction in instructions.deleted_objects or ():
+        key, position = base_lists.find(instruction)
+        if position is not None:
+            deleted.setdefault(key, set()).add(position)
+    for key, positions in deleted.items():
+        base_model[key] = [
+            obj for i, obj in enumerate(base_model[key]) if i not in positions
+        ]
+        base_lists.forget(key)
+
+    for instruction in instructions.added_objects or ():
+        new_key, new_position = new_lists.locate(instruction)
+        obj = copy.deepcopy(new_model[new_key][new_position])
+        base_key, position = base_lists.find(instruction)
+        if position is None:
+            objects = base_model.setdefault(new_key, [])
+            base_lists.add(new_key, obj.get("identifier"), len(objects))
+            objects.append(obj)
+        else:
+            base_model[base_key][position] = obj
+        synced.append(obj)
+
+    if synced:
+        add_resources(base_model, new_model, synced)
+    return base_model
+
+
+def add_resources(base_model, new_model, objects):
+    """Copy the resources referenced by objects from a new Model to a base Model.
+
+    Args:
+        base_model: A dictionary of the Model that receives the resources,
+            which is edited in place.
+        new_model: A dictionary of the Model with the resources.
+        objects: A list of geometry object dictionaries (eg. Rooms) whose
+            references should all resolve in the base Model.
+
+    Returns:
+        A dictionary with the names of the resource lists that changed
+        (eg. constructions) as keys and lists of the added identifiers as values.
+    """
+    base_index, new_index = ReferenceIndex(base_model), ReferenceIndex(new_model)
+    stack = []
+    for obj in objects:
+        for child in iter_tree(obj):
+            properties = child.get("properties")
+            if isinstance(properties, dict):
+                for extension, _ in _EXTENSIONS:
+                    if isinstance(properties.get(extension), dict):
+                        stack.append(properties[extension])
+
+    added = {}
+    while stack:
+        for ref in new_index.references(stack.pop()):
+            if ref.key == "day_schedules" or base_index.has(ref.key, ref.identifier):
+                continue
+            resource = new_index.get(ref.key, ref.identifier)
+            if resource is None:
+                continue  # dangling references are reported by the reference check
+            resource = copy.deepcopy(resource)
+            _resource_list(base_model, ref.key).append(resource)
+            base_index.resources[ref.key][ref.identifier] = resource
+            added.setdefault(ref.key, []).append(ref.identifier)
+            stack.append(resource)
+    return added
+
+
+class _ListIndex:
+    """Dictionaries from identifier to position for the top-level lists of a Model.
+
+    The dictionary of a list is only built when an object of the list is first
+    looked up.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model.
+        name: Text for the name of the Model in error messages (eg. base).
+    """
+
+    def __init__(self, model_dict, name):
+        self.model_dict = model_dict
+        self.name = name
+        self._positions = {}
+
+    def positions(self, key):
+        """Get the dictionary from identifier to position for a top-level list."""
+        try:
+            return self._positions[key]
+        except KeyError:
+            pass
+        objects = self.model_dict.get(key)
+        positions = self._positions[key] = {}
+        if isinstance(objects, list):
+            for i, obj in enumerate(objects):
+                if isinstance(obj, dict):
+                    positions.setdefault(obj.get("identifier"), i)
+        return positions
+
+    def find(self, instruction):
+        """Get the list key and position of the object of an instruction.
+
+        The position is None if the object is not in the Model.
+        """
+        keys = SYNCED_LISTS[instruction.element_type.value]
+        for key in keys:
+            position = self.positions(key).get(instruction.element_id)
+            if position is not None:
+                return key, position
+        return keys[0], None
+
+    def locate(self, instruction):
+        """Get the list key and position of the object of an instruction.
+
+        A ValueError is raised if the object is not in the Model.
+        """
+        key, position = self.find(instruction)
+        if position is None:
+            raise ValueError('The {} "{}" of the {} is not in the {} Model.'.format(
+                instruction.element_type.value, instruction.element_id,
+                instruction.type, self.name))
+        return key, position
+
+    def add(self, key, identifier, position):
+        """Record the position of an object appended to a top-level list."""
+        self.positions(key)[identifier] = position
+
+    def forget(self, key):
+        """Discard the dictionary of a list after its objects were moved."""
+        self._positions.pop(key, None)
+
+
+def _changed_object(base_obj, new_obj, instruction):
+    """Get a copy of an object with its geometry and properties from either Model."""
+    if instruction.update_geometry:
+        obj, other = copy.deepcopy(new_obj), base_obj
+    else:
+        obj, other = copy.deepcopy(base_obj), new_obj
+    for extension, field in _EXTENSIONS:
+        if getattr(instruction, field) != instruction.update_geometry:
+            _transfer_properties(obj, other, extension)
+    return obj
+
+
+def _transfer_properties(target, source, extension):
+    """Copy the extension properties of source objects to the matching target objects.
+
+    Objects are matched by type and identifier. Targets without a matching
+    source object keep their own properties.
+    """
+    properties = {}
+    for obj in iter_tree(source):
+        obj_properties = obj.get("properties")
+        if isinstance(obj_properties, dict) and extension in obj_properties:
+            properties[(obj.get("type"), obj.get("identifier"))] = \
+                obj_properties[extension]
+    for obj in iter_tree(target):
+        ext_properties = properties.get((obj.get("type"), obj.get("identifier")))
+        if ext_properties is not None and isinstance(obj.get("properties"), dict):
+            obj["properties"][extension] = copy.deepcopy(ext_properties)
+
+
+def _resource_list(model_dict, key):
+    """Get the list of the Model properties for a resource, creating it if necessary."""
+    extension = next(ext for ext, keys in RESOURCE_LISTS.items() if key in keys)
+    properties = model_dict.setdefault("properties", {"type": "ModelProperties"})
+    ext_properties = properties.get(extension)
+    if not isinstance(ext_properties, dict):
+        ext_properties = properties[extension] = {"type": _PROPERTY_TYPES[extension]}
+    resources = ext_properties.get(key)
+    if not isinstance(resources, list):
+        resources = ext_properties[key] = []
+    return resources
@@ -0,0 +1,142 @@
+"""Convert the geometry of a Model dictionary to other units.
+
+All objects of a Model dictionary are visited once without validating it. The
+coordinates of each object are scaled according to its type, such that the
+geometry of Rooms, Faces, Apertures, Doors, Shades and ShadeMeshes is scaled
+along with that of sensor grids, views, daylighting controls, DOE-2 space
+polygons and Radiance state geometry, wherever these appear in the Model.
+Objects without a type key are scaled only where their parent implies it (eg.
+the sensors of a SensorGrid). Geometry is scaled about the origin.
+"""
+
+from ._geometry import DEFAULT_TOLERANCE
+from .model import Units
+from .radiance.asset import ViewType
+
+# number of meters in one of each of the Units
+UNIT_FACTORS = {
+    Units.meters: 1.0,
+    Units.millimeters: 0.001,
+    Units.feet: 0.3048,
+    Units.inches: 0.0254,
+    Units.centimeters: 0.01,
+}
+
+
+def conversion_factor(from_units, to_units):
+    """Get the factor by which lengths in some Units are multiplied to get other Units.
+
+    Args:
+        from_units: Text or Units for the units of the lengths.
+        to_units: Text or Units for the units to which the lengths are converted.
+    """
+    return UNIT_FACTORS[Units(from_units)] / UNIT_FACTORS[Units(to_units)]
+
+
+def convert_units(model_dict, units=Units.meters):
+    """Convert a Model dictionary to other units by scaling all of its geometry.
+
+    The tolerance of the Model is scaled along with the geometry and the units
+    of the Model are set to the new units. A Model without a tolerance gets
+    the scaled default tolerance, which is in the units of the Model.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model, which is edited in place.
+        units: Text or Units for the units to which the Model is converted.
+            (Default: Meters).
+
+    Returns:
+        The dictionary of the converted Model.
+    """
+    units = Units(units)
+    factor = conversion_factor(model_dict.get("units", Units.meters), units)
+    if factor != 1:
+        model_dict.setdefault("tolerance", DEFAULT_TOLERANCE)
+        scale_model(model_dict, factor)
+    model_dict["units"] = units.value
+    return model_dict
+
+
+def scale_model(model_dict, factor):
+    """Scale all geometry of a Model dictionary about the origin.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model, which is edited in place.
+            The tolerance of the Model is scaled with it but the units are
+            left unchanged.
+        factor: A number for the factor by which the geometry is scaled.
+
+    Returns:
+        The dictionary of the scaled Model.
+    """
+    stack = [model_dict]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, list):
+            # lists of the schema are homogeneous and lists of numbers are skipped
+            if obj and isinstance(obj[0], (dict, list)):
+                stack.extend(obj)
+            continue
+        if not isinstance(obj, dict):
+            continue
+        fields = _SCALED_FIELDS.get(obj.get("type"), {})
+        if fields is _SCALED_FIELDS["View"] and \
+                obj.get("view_type") == ViewType.parallel.value:
+            fields = _PARALLEL_VIEW_FIELDS
+        for key, value in obj.items():
+            scale = fields.get(key)
+            if scale is None:
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+            elif value is not None:
+                obj[key] = scale(value, factor)
+    return model_dict
+
+
+def _length(value, factor):
+    """Scale a single length."""
+    return value * factor
+
+
+def _point(value, factor):
+    """Scale a point or vector as a list of coordinates."""
+    return [c * factor for c in value]
+
+
+def _points(value, factor):
+    """Scale a list of points."""
+    return [[c * factor for c in point] for point in value]
+
+
+def _loops(value, factor):
+    """Scale a list of lists of points."""
+    return [[[c * factor for c in point] for point in loop] for loop in value]
+
+
+def _sensors(value, factor):
+    """Scale the positions of a list of sensors, which may not have a type key."""
+    for sensor in value:
+        if isinstance(sensor, dict) and sensor.get("pos") is not None:
+            sensor["pos"] = _point(sensor["pos"], factor)
+    return value
+
+
+# fields of each type of object that hold lengths or coordinates and the function
+# to scale them. Nested objects with a type of their own (eg. the Plane of a
+# Face3D or the Mesh3D of a SensorGrid) are scaled on their own and directions
+# that only need to keep their orientation are left unchanged.
+_SCALED_FIELDS = {
+    "Model": {"tolerance": _length},
+    "Point3D": {"x": _length, "y": _length, "z": _length},
+    "LineSegment3D": {"p": _point, "v": _point},
+    "Plane": {"o": _point},
+    "Face3D": {"boundary": _points, "holes": _loops},
+    "Mesh3D": {"vertices": _points},
+    "Sensor": {"pos": _point},
+    "SensorGrid": {"sensors": _sensors},
+    "View": {"position": _point, "fore_clip": _length, "aft_clip": _length},
+    "DaylightingControl": {"sensor_position": _point},
+}
+
+# the sizes of parallel views are lengths while those of other views are angles
+_PARALLEL_VIEW_FIELDS = dict(_SCALED_FIELDS["View"], h_size=_length, v_size=_length)
@@ -0,0 +1,98 @@
+"""Updaters that migrate Model dictionaries to newer versions of honeybee-schema.
+
+The migration of every version_* module is registered in MIGRATIONS, sorted by
+version, such that the migrations that apply between two versions can be
+selected with a binary search instead of importing and inspecting every module.
+New updater modules must be added to this registry.
+"""
+from bisect import bisect_right
+
+from .migration import migrate
+from . import (
+    version_1_39_12,
+    version_1_40_1,
+    version_1_43_1,
+    version_1_43_2,
+    version_1_43_5,
+)
+
+# all migrations sorted by the version to which they update a Model
+MIGRATIONS = tuple(sorted((
+    version_1_39_12.MIGRATION,
+    version_1_40_1.MIGRATION,
+    version_1_43_1.MIGRATION,
+    version_1_43_2.MIGRATION,
+    version_1_43_5.MIGRATION,
+), key=lambda m: m.version))
+
+VERSIONS = tuple(m.version for m in MIGRATIONS)
+
+
+def parse_version(version):
+    """Get a tuple of three integers from a version string (eg. '1.41.2').
+
+    Tuples are returned unchanged.
+    """
+    if isinstance(version, tuple):
+        return version
+    try:
+        major, minor, patch = (int(v) for v in version.split('.'))
+    except (AttributeError, ValueError):
+        raise ValueError(
+            'Version "{}" must consist of three integers separated by '
+            'periods.'.format(version)
+        ) from None
+    return major, minor, patch
+
+
+def select_migrations(model_version, target_version=None):
+    """Get the migrations needed to update a Model from one version to another.
+
+    Args:
+        model_version: The version of the Model as a string or tuple. Only
+            migrations for later versions are selected.
+        target_version: The version to which the Model will be updated as a
+            string or tuple. If None, all migrations after the model_version
+            are selected.
+
+    Returns:
+        A tuple of Migrations sorted by version.
+    """
+    start = bisect_right(VERSIONS, parse_version(model_version))
+    if target_version is None:
+        return MIGRATIONS[start:]
+    end = bisect_right(VERSIONS, parse_version(target_version))
+    return MIGRATIONS[start:end]
+
+
+def upgrade(model_dict, to=None):
+    """Update a Model dictionary to a newer version of honeybee-schema.
+
+    All applicable migrations are fused into a single traversal of the Model.
+    Models with a version that is equal to or higher than the target are
+    returned unchanged.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model with a version key. The
+            dictionary is edited in place.
+        to: Text for the version to which the Model will be updated (eg.
+            '1.41.2'). If None, the Model will be updated to the last release
+            that included a breaking change.
+
+    Returns:
+        The input model_dict with its version updated.
+    """
+    if 'version' not in model_dict:
+        raise ValueError(
+            'No version was found in the input model JSON. Update process '
+            'cannot be run.')
+    model_version = parse_version(model_dict['version'])
+    if to is not None and model_version >= parse_version(to):
+        return model_dict
+    migrations = select_migrations(model_version, to)
+    migrate(model_dict, migrations)
+    if to is not None:
+        model_dict['version'] = '.'.join(map(str, parse_version(to)))
+    elif migrations:
+        model_dict['version'] = '.'.join(map(str, migrations[-1].version))
+    return model_dict
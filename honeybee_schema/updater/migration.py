@@ -0,0 +1,92 @@
+"""Engine that applies the changes of several schema versions in a single traversal.
+
+Each updater module declares a Migration with the version it updates to and a
+handler for each JSON path it touches. A path is a tuple of keys that leads to
+a list in the Model dictionary (eg. ('properties', 'energy', 'hvacs')) and its
+handler is called once for each item of that list, editing the item in place.
+
+Because handlers only ever edit the item they are given, the handlers of any
+number of migrations can be fused together: every list is visited once and each
+of its items passes through the handlers of all migrations in version order.
+This produces the same result as running the migrations one after another,
+which would visit the same lists once per migration.
+"""
+
+from typing import Callable, Dict, NamedTuple, Tuple
+
+
+class Migration(NamedTuple):
+    """The changes to a Model dictionary for one version of honeybee-schema.
+
+    Properties:
+        version: A tuple of three integers for the version to which the
+            migration updates a Model (eg. (1, 40, 1)).
+        handlers: A dictionary that maps each JSON path touched by the migration
+            to a function that updates a single item of the list at that path.
+            Each function receives the item dictionary and edits it in place.
+    """
+
+    version: Tuple[int, int, int]
+    handlers: Dict[Tuple[str, ...], Callable[[dict], None]]
+
+    def apply(self, model_dict):
+        """Apply this migration alone to a Model dictionary, editing it in place.
+
+        Returns:
+            The input model_dict.
+        """
+        return migrate(model_dict, (self,))
+
+
+def fuse(migrations):
+    """Fuse the handlers of several migrations into a single handler list per path.
+
+    Args:
+        migrations: An iterable of Migration objects.
+
+    Returns:
+        A dictionary that maps each JSON path to a list of item handlers, which
+        are sorted by the version of their migration.
+    """
+    fused = {}
+    for migration in sorted(migrations, key=lambda m: m.version):
+        for path, handler in migration.handlers.items():
+            fused.setdefault(path, []).append(handler)
+    return fused
+
+
+def migrate(model_dict, migrations):
+    """Apply several migrations to a Model dictionary in a single traversal.
+
+    Each list touched by any of the migrations is visited only once and each
+    of its items is passed through all relevant handlers in version order.
+    Paths that do not exist in the Model dictionary are skipped.
+
+    Args:
+        model_dict: A dictionary of a Honeybee Model, which is edited in place.
+        migrations: An iterable of Migration objects.
+
+    Returns:
+        The input model_dict.
+    """
+    for path, handlers in fuse(migrations).items():
+        items = _list_at(model_dict, path)
+        if len(handlers) == 1:
+            handler = handlers[0]
+            for item in items:
+                handler(item)
+        else:
+            for item in items:
+                for handler in handlers:
+                    handler(item)
+    return model_dict
+
+
+def _list_at(model_dict, path):
+    """Get the list at a JSON path of a Model dictionary or an empty list."""
+    value = model_dict
+    for key in path:
+        if not isinstance(value, dict):
+            return ()
+        value = value.get(key)
+    return value if isinstance(value, list) else ()
@@ -1,14 +1,20 @@
 """Changes associated with version Honeybee schema version 1.39.12."""
+from .migration import Migration
+
+REMOVED_EQUIP = 'PSZ-AC district chilled water with baseboard district hot water'
+REPLACED_EQUIP = 'PSZ-AC district chilled water with district hot water'
+
+
+def update_hvac(hvac):
+    """Replace the removed PSZ equipment type of a HVAC dict."""
+    if hvac['type'] != 'IdealAirSystemAbridged' and \
+            hvac['equipment_type'] == REMOVED_EQUIP:
+        hvac['equipment_type'] = REPLACED_EQUIP
+
+
+MIGRATION = Migration((1, 39, 12), {('properties', 'energy', 'hvacs'): update_hvac})
 
 
 def version_1_39_12(model_dict):
     """Implement changes in a Model dict to make it compatible with version 1.39.12."""
-    removed_equip = 'PSZ-AC district chilled water with baseboard district hot water'
-    replaced_equip = 'PSZ-AC district chilled water with district hot water'
-    if 'energy' in model_dict['properties']:
-        if 'hvacs' in model_dict['properties']['energy']:
-            for hvac in model_dict['properties']['energy']['hvacs']:
-                if hvac['type'] != 'IdealAirSystemAbridged' and \
-                        hvac['equipment_type'] == removed_equip:
-                    hvac['equipment_type'] = replaced_equip
-    return model_dict
+    return MIGRATION.apply(model_dict)
@@ -1,15 +1,17 @@
 """Changes associated with version Honeybee schema version 1.40.1."""
+from .migration import Migration
+
+
+def update_hvac(hvac):
+    """Map the vintage and equipment type of a detailed HVAC dict to the new enumerations."""
+    if hvac['type'] != 'IdealAirSystemAbridged':  # it's detailed
+        hvac['vintage'] = VINTAGE_MAPPER[hvac['vintage']]
+        hvac['equipment_type'] = EQUIPMENT_MAPPER[hvac['equipment_type']]
 
 
 def version_1_40_1(model_dict):
     """Implement changes in a Model dict to make it compatible with version 1.40.1."""
-    if 'energy' in model_dict['properties']:
-        if 'hvacs' in model_dict['properties']['energy']:
-            for hvac in model_dict['properties']['energy']['hvacs']:
-                if hvac['type'] != 'IdealAirSystemAbridged':  # it's detailed
-                    hvac['vintage'] = VINTAGE_MAPPER[hvac['vintage']]
-                    hvac['equipment_type'] = EQUIPMENT_MAPPER[hvac['equipment_type']]
-    return model_dict
+    return MIGRATION.apply(model_dict)
 
 
 # dictionary to map between old and new vintages
@@ -151,3 +153,5 @@ EQUIPMENT_MAPPER = {
     'Window AC with unit heaters': 'WindowAC_GasHeaters',
     'Window AC with no heat': 'WindowAC'
 }
+
+MIGRATION = Migration((1, 40, 1), {('properties', 'energy', 'hvacs'): update_hvac})
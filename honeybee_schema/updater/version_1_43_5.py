@@ -1,11 +1,16 @@
 """Changes associated with version Honeybee schema version 1.43.5."""
+from .migration import Migration
+
+
+def update_modifier(mod):
+    """Capitalize the type of a modifier dict."""
+    if mod['type'] != 'BSDF':
+        mod['type'] = mod['type'].capitalize()
+
+
+MIGRATION = Migration((1, 43, 5), {('properties', 'radiance', 'modifiers'): update_modifier})
 
 
 def version_1_43_5(model_dict):
     """Implement changes in a Model dict to make it compatible with version 1.43.5."""
-    if 'radiance' in model_dict['properties']:
-        if 'modifiers' in model_dict['properties']['radiance']:
-            for mod in model_dict['properties']['radiance']['modifiers']:
-                if mod['type'] != 'BSDF':
-                    mod['type'] = mod['type'].capitalize()
-    return model_dict
+    return MIGRATION.apply(model_dict)
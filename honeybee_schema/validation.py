@@ -1,9 +1,10 @@
 """Schema for the error objects returned by the validation command"""
 
-from pydantic import StringConstraints, BaseModel, Field
+from pydantic import StringConstraints, Field
 from typing import List, Union
 from enum import Enum
 
+from ._base import DeferredBaseModel
 from .geometry import Point3D, LineSegment3D
 from typing_extensions import Annotated
 
@@ -54,7 +55,7 @@ class ParentTypes(str, Enum):
     building = "Building"
 
 
-class ValidationParent(BaseModel):
+class ValidationParent(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^ValidationParent$")] = "ValidationParent"
 
     parent_type: ParentTypes = Field(
@@ -72,7 +73,7 @@ class ValidationParent(BaseModel):
     name: str = Field(default=None, description="Display name of the parent object.")
 
 
-class ValidationError(BaseModel):
+class ValidationError(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^ValidationError$")] = "ValidationError"
 
     code: str = Field(
@@ -161,7 +162,7 @@ class ValidationError(BaseModel):
     )
 
 
-class ValidationReport(BaseModel):
+class ValidationReport(DeferredBaseModel):
     type: Annotated[str, StringConstraints(pattern="^ValidationReport$")] = "ValidationReport"
 
     app_name: str = Field(
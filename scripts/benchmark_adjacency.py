@@ -0,0 +1,28 @@
+"""Time the solving of Surface adjacencies for Models of increasing size.
+
+Models are synthesized by copying the lab building sample onto a grid and
+replacing all of their Surface boundary conditions with Outdoors. The time to
+solve the adjacencies is printed for each size to show how it scales.
+
+Usage:
+    python ./scripts/benchmark_adjacency.py [copies ...]
+"""
+import sys
+import time
+
+from honeybee_schema.adjacency import solve_adjacency
+
+from scripts.synthetic import grid_model, strip_surfaces
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 30, 100]
+    for copies in sizes:
+        model_dict = grid_model(copies)
+        strip_surfaces(model_dict)
+        face_count = sum(len(room['faces']) for room in model_dict['rooms'])
+        start = time.perf_counter()
+        result = solve_adjacency(model_dict)
+        elapsed = time.perf_counter() - start
+        print('{} faces: {} adjacent pairs in {:.2f} s ({:.1f} us per face)'.format(
+            face_count, len(result.adjacent_faces), elapsed, 1e6 * elapsed / face_count))
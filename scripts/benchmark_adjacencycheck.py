@@ -0,0 +1,42 @@
+"""Time the check of Surface boundary conditions for Models of increasing size.
+
+Models are synthesized by copying the lab building sample onto a grid, giving
+every Face, Aperture and Door of each copy a unique identifier and solving the
+adjacencies of the copies. The time to check the resulting Surface boundary
+conditions is printed for each size to show how it scales.
+
+Usage:
+    python ./scripts/benchmark_adjacencycheck.py [copies ...]
+"""
+import sys
+import time
+
+from honeybee_schema.adjacency import solve_adjacency
+from honeybee_schema.adjacencycheck import adjacency_errors
+
+from scripts.synthetic import grid_model, strip_surfaces
+
+
+def _adjacent_model(copies):
+    """Get a grid Model with unique identifiers and solved adjacencies."""
+    model_dict = grid_model(copies)
+    for room in model_dict['rooms']:
+        suffix = room['identifier'].rsplit('_', 1)[-1]
+        for face in room['faces']:
+            for obj in [face] + face.get('apertures', []) + face.get('doors', []):
+                obj['identifier'] = '{}_{}'.format(obj['identifier'], suffix)
+    strip_surfaces(model_dict)
+    solve_adjacency(model_dict)
+    return model_dict
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 30, 100]
+    for copies in sizes:
+        model_dict = _adjacent_model(copies)
+        face_count = sum(len(room['faces']) for room in model_dict['rooms'])
+        start = time.perf_counter()
+        errors = adjacency_errors(model_dict)
+        elapsed = time.perf_counter() - start
+        print('{} faces: {} errors in {:.2f} s ({:.1f} us per face)'.format(
+            face_count, len(errors), elapsed, 1e6 * elapsed / face_count))
@@ -0,0 +1,44 @@
+"""Time the comparison of two revisions of a large Model.
+
+A Model with many Rooms is synthesized by copying the Rooms of the lab building
+sample. A second revision moves a vertex of 1% of the Rooms, edits the energy
+properties of another 1% and replaces 1% with new Rooms. Both revisions are
+then compared into a ComparisonReport.
+
+Usage:
+    python ./scripts/benchmark_diff.py [room_count]
+"""
+import sys
+import json
+import time
+
+from honeybee_schema.diff import compare_models
+
+from scripts.synthetic import large_model
+
+
+def _revise(model_dict):
+    """Get a revision of a Model with a few percent of its Rooms edited."""
+    revised = json.loads(json.dumps(model_dict))
+    rooms = revised['rooms']
+    step = 100
+    for room in rooms[::step]:
+        room['faces'][0]['geometry']['boundary'][0][2] += 0.5
+    for room in rooms[1::step]:
+        room['properties']['energy']['program_type'] = 'Edited Program'
+    for room in rooms[2::step]:
+        room['identifier'] = 'New_' + room['identifier']
+    return revised
+
+
+if __name__ == '__main__':
+    room_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    base = large_model(room_count)
+    new = _revise(base)
+    start = time.perf_counter()
+    report = compare_models(base, new)
+    elapsed = time.perf_counter() - start
+    print('{} rooms compared in {:.2f} seconds'.format(room_count, elapsed))
+    print('{} changed, {} added, {} deleted'.format(
+        len(report.changed_objects), len(report.added_objects),
+        len(report.deleted_objects)))
@@ -0,0 +1,68 @@
+"""Measure the start-up cost of honeybee-schema in fresh interpreters.
+
+Each measurement runs in a new Python process so that nothing is cached from a
+previous import. The following are timed:
+
+* cli-help: ``python -m honeybee_schema --help``, which must not import pydantic.
+* import-model: ``import honeybee_schema.model``.
+* first-validate: importing the Model and validating a sample Model, which
+  includes building the validators that are deferred until first use.
+
+The script exits with a non-zero code if the median time of the CLI help
+exceeds the budget in milliseconds.
+
+Usage:
+    python ./scripts/benchmark_import_time.py [budget_ms] [repeat]
+"""
+import os
+import sys
+import time
+import statistics
+import subprocess
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sample = os.path.join(
+    root, 'samples', 'model', 'model_complete_single_zone_office.hbjson')
+
+VALIDATE = (
+    'import json; from honeybee_schema.model import Model; '
+    'Model.model_validate(json.load(open({!r})))'.format(sample)
+)
+COMMANDS = {
+    'cli-help': ['-m', 'honeybee_schema', '--help'],
+    'import-model': ['-c', 'import honeybee_schema.model'],
+    'first-validate': ['-c', VALIDATE],
+}
+
+
+def _time_command(args, repeat):
+    """Get the run times in milliseconds of a Python command in new processes."""
+    env = dict(os.environ, PYTHONPATH=root)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable] + args, env=env, check=True, stdout=subprocess.DEVNULL
+        )
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def _baseline(repeat):
+    """Get the median run time in milliseconds of an empty interpreter."""
+    return statistics.median(_time_command(['-c', 'pass'], repeat))
+
+
+if __name__ == '__main__':
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else 150
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    baseline = _baseline(repeat)
+    print('empty interpreter: {:.0f} ms'.format(baseline))
+    medians = {}
+    for name, args in COMMANDS.items():
+        medians[name] = statistics.median(_time_command(args, repeat))
+        print('{}: {:.0f} ms ({:.0f} ms over the interpreter)'.format(
+            name, medians[name], medians[name] - baseline))
+    if medians['cli-help'] > budget:
+        print('cli-help exceeds the budget of {:.0f} ms.'.format(budget))
+        sys.exit(1)
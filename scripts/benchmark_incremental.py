@@ -0,0 +1,46 @@
+"""Time the validation of a large Model after one of its Rooms was edited.
+
+A Model with many Rooms is synthesized from the lab building sample and
+validated once to fill a ValidationCache. One Room is then edited and the
+Model is validated again from scratch with Model.model_validate_json and
+incrementally with the cache.
+
+Usage:
+    python ./scripts/benchmark_incremental.py [room_count]
+"""
+import sys
+import json
+import time
+
+from honeybee_schema.model import Model
+from honeybee_schema.incremental import ValidationCache, validate_model_incremental
+
+from scripts.synthetic import large_model
+
+
+if __name__ == '__main__':
+    room_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    model_dict = large_model(room_count)
+    cache = ValidationCache()
+
+    start = time.perf_counter()
+    validate_model_incremental(model_dict, cache)
+    first_time = time.perf_counter() - start
+
+    model_dict['rooms'][room_count // 2]['faces'][0]['geometry']['boundary'][0][2] += 0.5
+    model_json = json.dumps(model_dict)
+
+    start = time.perf_counter()
+    Model.model_validate_json(model_json)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report = validate_model_incremental(model_dict, cache)
+    incremental_time = time.perf_counter() - start
+
+    assert report.valid
+    print('{} rooms with 1 edited'.format(room_count))
+    print('first run (fills the cache): {:.3f} s'.format(first_time))
+    print('model_validate_json:         {:.3f} s'.format(full_time))
+    print('incremental:                 {:.3f} s ({:.1f}x)'.format(
+        incremental_time, full_time / incremental_time))
@@ -0,0 +1,103 @@
+"""Compare upgrading a 1.39 Model with fused migrations against chained updaters.
+
+A large 1.39.11 Model is synthesized from tests/json/model_old.hbjson with many
+HVACs, layered constructions and lowercase modifier types such that every
+updater has work to do. The Model is then upgraded to the latest version by
+calling each version_* function in sequence (one traversal per version) and by
+the migration engine that fuses all versions into one traversal.
+
+Usage:
+    python ./scripts/benchmark_migration.py [count] [repeat]
+"""
+import os
+import sys
+import copy
+import json
+import timeit
+import importlib
+import pkgutil
+from inspect import getmembers, isfunction
+
+from honeybee_schema import updater
+from honeybee_schema.updater.migration import migrate
+from honeybee_schema.updater.version_1_40_1 import EQUIPMENT_MAPPER
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+old_model = os.path.join(root, 'tests', 'json', 'model_old.hbjson')
+
+
+def _updaters():
+    """Get the (version, function, migration) of each updater module sorted by version."""
+    updaters = []
+    for sub_module in pkgutil.walk_packages(updater.__path__):
+        if not sub_module.name.startswith('version_'):
+            continue
+        module = importlib.import_module(f'honeybee_schema.updater.{sub_module.name}')
+        for name, func in getmembers(module, isfunction):
+            if name.startswith('version_'):
+                updaters.append((module.MIGRATION.version, func, module.MIGRATION))
+    return sorted(updaters, key=lambda x: x[0])
+
+
+def _old_model(count):
+    """Synthesize a 1.39.11 Model dictionary with count HVACs and resources."""
+    with open(old_model) as json_file:
+        model_dict = json.load(json_file)
+    equipment = [e for e in EQUIPMENT_MAPPER if not e.startswith('DOAS')]
+    doas_equipment = [e for e in EQUIPMENT_MAPPER if e.startswith('DOAS with fan coil')]
+    hvac = model_dict['properties']['energy']['hvacs'][0]
+    hvacs, constructions, modifiers = [], [], []
+    for i in range(count):
+        new_hvac = dict(hvac, identifier='HVAC_{}'.format(i))
+        if i % 4 == 0:
+            new_hvac.update(type='FCUwithDOAS', economizer_type='Inferred',
+                            equipment_type=doas_equipment[i % len(doas_equipment)])
+        else:
+            new_hvac['equipment_type'] = equipment[i % len(equipment)]
+        hvacs.append(new_hvac)
+        constructions.append({
+            'type': 'OpaqueConstructionAbridged',
+            'identifier': 'Construction_{}'.format(i),
+            'layers': ['Material_{}'.format(i)]
+        })
+        modifiers.append({
+            'type': 'plastic', 'identifier': 'Modifier_{}'.format(i),
+            'r_reflectance': 0.5, 'g_reflectance': 0.5, 'b_reflectance': 0.5,
+            'specularity': 0, 'roughness': 0
+        })
+    model_dict['properties']['energy']['hvacs'] = hvacs
+    model_dict['properties']['energy']['constructions'] = constructions
+    model_dict['properties']['radiance'] = {
+        'type': 'ModelRadianceProperties', 'modifiers': modifiers
+    }
+    return model_dict
+
+
+def main(count=20000, repeat=5):
+    updaters = _updaters()
+    model_dict = _old_model(count)
+
+    def chained(model):
+        for _, func, _ in updaters:
+            model = func(model)
+        return model
+
+    def fused(model):
+        return migrate(model, [migration for _, _, migration in updaters])
+
+    assert chained(copy.deepcopy(model_dict)) == fused(copy.deepcopy(model_dict))
+
+    results = {}
+    for name, func in (('chained', chained), ('fused', fused)):
+        copies = [copy.deepcopy(model_dict) for _ in range(repeat)]
+        results[name] = min(timeit.repeat(
+            lambda: func(copies.pop()), number=1, repeat=repeat))
+    print('{} HVACs, constructions and modifiers upgraded through {} versions'.format(
+        count, len(updaters)))
+    print('chained: {:.2f} ms'.format(results['chained'] * 1000))
+    print('fused:   {:.2f} ms'.format(results['fused'] * 1000))
+    print('speedup: {:.2f}x'.format(results['chained'] / results['fused']))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
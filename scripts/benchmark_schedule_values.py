@@ -0,0 +1,97 @@
+"""Compare the annual evaluation of ScheduleRulesets with a day-by-day loop.
+
+Many distinct rulesets are synthesized from the primary school occupancy sample
+by scaling its day values. Their annual values at the timestep are computed by
+looping over every day of the year in Python and by compiling each ruleset into
+day indices that are joined into the series. A second pass with the compiled
+rulesets shows the cost once the compilation is cached.
+
+Usage:
+    python ./scripts/benchmark_schedule_values.py [count] [timestep]
+"""
+import os
+import sys
+import copy
+import json
+import time
+import datetime
+
+from honeybee_schema.energy.schedulevalues import annual_values
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sample = os.path.join(
+    root, 'samples', 'schedule', 'schedule_primary_school_occupancy.json')
+
+
+def _rulesets(count):
+    """Synthesize count rulesets with different values."""
+    with open(sample) as json_file:
+        base = json.load(json_file)
+    rulesets = []
+    for i in range(count):
+        ruleset = copy.deepcopy(base)
+        ruleset['identifier'] = 'School Occupancy {}'.format(i)
+        for day in ruleset['day_schedules']:
+            day['values'] = [v * (1 + i / count) for v in day['values']]
+        rulesets.append(ruleset)
+    return rulesets
+
+
+def _day_values_loop(day, timestep):
+    """Evaluate a ScheduleDay one timestep at a time."""
+    minutes = [h * 60 + m for h, m in day['times']]
+    values = []
+    for step in range(24 * timestep):
+        t = step * 60 // timestep
+        value = day['values'][0]
+        for start, v in zip(minutes, day['values']):
+            if start <= t:
+                value = v
+        values.append(value)
+    return values
+
+
+def _day_by_day(ruleset, timestep):
+    """Evaluate a ruleset by looping over every day of a year starting on Sunday."""
+    days = {day['identifier']: day for day in ruleset['day_schedules']}
+    date, values = datetime.date(2017, 1, 1), []
+    while date.year == 2017:
+        day_id = ruleset['default_day_schedule']
+        for rule in ruleset.get('schedule_rules') or ():
+            start = datetime.date(2017, *rule['start_date'][:2])
+            end = datetime.date(2017, *rule['end_date'][:2])
+            day_key = 'apply_{}'.format(date.strftime('%A').lower())
+            if start <= date <= end and rule.get(day_key):
+                day_id = rule['schedule_day']
+                break
+        values.extend(_day_values_loop(days[day_id], timestep))
+        date += datetime.timedelta(days=1)
+    return values
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    timestep = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    rulesets = _rulesets(count)
+
+    start = time.perf_counter()
+    compiled = [annual_values(r, timestep) for r in rulesets]
+    compiled_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for r in rulesets:
+        annual_values(r, timestep)
+    cached_time = time.perf_counter() - start
+
+    # the loop runs last since its lists of floats slow down garbage collection
+    start = time.perf_counter()
+    looped = [_day_by_day(r, timestep) for r in rulesets]
+    loop_time = time.perf_counter() - start
+
+    assert all(list(c) == v for c, v in zip(compiled, looped))
+    print('{} rulesets at timestep {}'.format(count, timestep))
+    print('day-by-day loop: {:.3f} s'.format(loop_time))
+    print('compiled:        {:.3f} s ({:.1f}x)'.format(
+        compiled_time, loop_time / compiled_time))
+    print('cached:          {:.3f} s ({:.1f}x)'.format(
+        cached_time, loop_time / cached_time))
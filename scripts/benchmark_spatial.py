@@ -0,0 +1,59 @@
+"""Time the SpatialIndex against pairwise comparisons of all faces of a large Model.
+
+A Model with many Rooms is synthesized by copying the lab building sample onto
+a grid such that the copies do not overlap. The index is built and queried
+for the coplanar faces with opposite normals of every Face, which is the query
+of adjacency solving. The pairwise comparison is timed for a sample of the
+Faces and extrapolated to all of them.
+
+Usage:
+    python ./scripts/benchmark_spatial.py [copies]
+"""
+import sys
+import math
+import time
+from operator import mul
+
+from honeybee_schema.spatial import SpatialIndex
+
+from scripts.synthetic import grid_model
+
+
+def _pairwise(index, i, min_cos):
+    """Find the coplanar entries with opposite normals by testing all entries."""
+    entry, found = index.entries[i], []
+    for j, other in enumerate(index.entries):
+        if j == i or other.normal is None:
+            continue
+        if sum(map(mul, entry.normal, other.normal)) <= -min_cos and \
+                abs(other.offset + entry.offset) <= index.tolerance:
+            found.append(j)
+    return found
+
+
+if __name__ == '__main__':
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    model_dict = grid_model(copies)
+
+    start = time.perf_counter()
+    index = SpatialIndex(model_dict)
+    build_time = time.perf_counter() - start
+
+    faces = [i for i, e in enumerate(index.entries) if e.element_type.value == 'Face']
+    start = time.perf_counter()
+    for i in faces:
+        index.coplanar(i, opposite=True)
+    query_time = time.perf_counter() - start
+
+    sample_faces = faces[::max(1, len(faces) // 100)]
+    min_cos = math.cos(math.radians(index.angle_tolerance))
+    start = time.perf_counter()
+    for i in sample_faces:
+        _pairwise(index, i, min_cos)
+    pairwise_time = (time.perf_counter() - start) * len(faces) / len(sample_faces)
+
+    print('{} rooms, {} entries, {} faces'.format(
+        len(model_dict['rooms']), len(index), len(faces)))
+    print('index build:              {:.2f} s'.format(build_time))
+    print('coplanar queries:         {:.2f} s'.format(query_time))
+    print('pairwise (extrapolated):  {:.2f} s'.format(pairwise_time))
@@ -0,0 +1,42 @@
+"""Time the application of SyncInstructions for a few edited Rooms of a large Model.
+
+A Model with many Rooms is synthesized from the lab building sample and an
+updated Model edits three of its Rooms. The SyncInstructions for these Rooms
+are applied to the base Model and the time is compared with that of copying
+the whole updated Model, which is what a full rewrite of the Model costs.
+
+Usage:
+    python ./scripts/benchmark_sync.py [room_count]
+"""
+import sys
+import json
+import time
+
+from honeybee_schema.comparison import SyncInstructions
+from honeybee_schema.sync import sync_model
+
+from scripts.synthetic import large_model
+
+
+if __name__ == '__main__':
+    room_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    base = large_model(room_count)
+    new = json.loads(json.dumps(base))
+    edited = [new['rooms'][i] for i in (0, room_count // 2, room_count - 1)]
+    for room in edited:
+        room['faces'][0]['geometry']['boundary'][0][2] += 0.5
+    instructions = SyncInstructions(changed_objects=[
+        {'element_type': 'Room', 'element_id': room['identifier']} for room in edited])
+
+    start = time.perf_counter()
+    json.loads(json.dumps(new))
+    rewrite_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sync_model(base, new, instructions)
+    sync_time = time.perf_counter() - start
+
+    assert base['rooms'] == new['rooms']
+    print('{} rooms with {} edited'.format(room_count, len(edited)))
+    print('full rewrite: {:.3f} s'.format(rewrite_time))
+    print('sync:         {:.3f} s ({:.0f}x)'.format(sync_time, rewrite_time / sync_time))
@@ -0,0 +1,92 @@
+"""Compare validation of type-dispatched Unions against plain Unions.
+
+The polymorphic lists of the sample models (constructions, materials, hvacs,
+schedules, modifiers, etc.) and the Face boundary conditions are validated
+with the type_union annotations used by the schema and with the equivalent
+plain Union that makes pydantic try the members one after another.
+
+Usage:
+    python ./scripts/benchmark_type_union.py [repeat]
+"""
+import os
+import sys
+import glob
+import json
+import timeit
+from typing import List, Annotated, get_args
+
+from pydantic import TypeAdapter
+
+from honeybee_schema.model import Face
+from honeybee_schema.energy.properties import ModelEnergyProperties
+from honeybee_schema.radiance.properties import ModelRadianceProperties
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sample_files = glob.glob(os.path.join(root, 'samples', 'model*', '*.hbjson'))
+
+
+def _plain_union(tagged):
+    """Get the plain Union of the classes of a type_union."""
+    return get_args(tagged)[0]
+
+
+def _list_item(annotation):
+    """Get the item type of a List[...] | None annotation."""
+    list_type = get_args(annotation)[0]
+    return get_args(list_type)[0]
+
+
+def _collect_items():
+    """Gather the polymorphic items of all sample models grouped by field."""
+    bc_field = Face.model_fields['boundary_condition']
+    fields = {
+        'boundary_condition': Annotated[(bc_field.annotation, *bc_field.metadata)]
+    }
+    items = {'boundary_condition': []}
+    for properties_class, ext in (
+            (ModelEnergyProperties, 'energy'), (ModelRadianceProperties, 'radiance')):
+        for name in ('construction_sets', 'constructions', 'materials', 'hvacs',
+                     'program_types', 'schedules', 'modifiers', 'modifier_sets'):
+            if name in properties_class.model_fields:
+                fields[name] = _list_item(properties_class.model_fields[name].annotation)
+                items[name] = []
+    for sample_file in sample_files:
+        with open(sample_file) as json_file:
+            model_dict = json.load(json_file)
+        for ext in ('energy', 'radiance'):
+            ext_properties = model_dict['properties'].get(ext, {})
+            for name, values in ext_properties.items():
+                if name in items and isinstance(values, list):
+                    items[name].extend(values)
+        for room in model_dict.get('rooms', []):
+            for face in room['faces']:
+                items['boundary_condition'].append(face['boundary_condition'])
+    return fields, items
+
+
+def main(repeat=5):
+    fields, items = _collect_items()
+    print('{:<20}{:>8}{:>14}{:>14}{:>10}'.format(
+        'field', 'items', 'union (ms)', 'tagged (ms)', 'speedup'))
+    total_plain = total_tagged = 0
+    for name, tagged in fields.items():
+        values = items[name]
+        if not values:
+            continue
+        plain_adapter = TypeAdapter(List[_plain_union(tagged)])
+        tagged_adapter = TypeAdapter(List[tagged])
+        plain = min(timeit.repeat(
+            lambda: plain_adapter.validate_python(values), number=1, repeat=repeat))
+        tagged_time = min(timeit.repeat(
+            lambda: tagged_adapter.validate_python(values), number=1, repeat=repeat))
+        total_plain += plain
+        total_tagged += tagged_time
+        print('{:<20}{:>8}{:>14.2f}{:>14.2f}{:>9.1f}x'.format(
+            name, len(values), plain * 1000, tagged_time * 1000, plain / tagged_time))
+    print('{:<20}{:>8}{:>14.2f}{:>14.2f}{:>9.1f}x'.format(
+        'total', '', total_plain * 1000, total_tagged * 1000,
+        total_plain / total_tagged))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,31 @@
+"""Time the conversion of Models of increasing size to other units.
+
+Models are synthesized by copying the lab building sample onto a grid. The time
+to convert each Model dictionary from Meters to Feet is printed along with the
+time to load it as a Model, which is the least that a conversion through the
+pydantic objects would take.
+
+Usage:
+    python ./scripts/benchmark_units.py [copies ...]
+"""
+import sys
+import time
+
+from honeybee_schema.model import Model
+from honeybee_schema.units import convert_units
+
+from scripts.synthetic import grid_model
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 30, 100]
+    for copies in sizes:
+        model_dict = grid_model(copies)
+        start = time.perf_counter()
+        Model.model_validate(model_dict)
+        validated = time.perf_counter() - start
+        start = time.perf_counter()
+        convert_units(model_dict, 'Feet')
+        elapsed = time.perf_counter() - start
+        print('{} rooms: converted in {:.2f} s (loading the Model takes {:.2f} s)'.format(
+            len(model_dict['rooms']), elapsed, validated))
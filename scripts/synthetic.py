@@ -0,0 +1,59 @@
+"""Synthesize large Models for the benchmark scripts from the lab building sample."""
+import os
+import copy
+import json
+import math
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sample = os.path.join(root, 'samples', 'model_large', 'lab_building.hbjson')
+
+
+def large_model(room_count):
+    """Synthesize a Model with room_count Rooms from the lab building.
+
+    The Rooms are copies of those of the lab building in the same place, each
+    with a unique identifier.
+    """
+    with open(sample) as json_file:
+        model_dict = json.load(json_file)
+    base_rooms = model_dict['rooms']
+    rooms = []
+    for i in range(room_count):
+        room = copy.deepcopy(base_rooms[i % len(base_rooms)])
+        room['identifier'] = 'Room_{}'.format(i)
+        rooms.append(room)
+    model_dict['rooms'] = rooms
+    return model_dict
+
+
+def grid_model(copies):
+    """Synthesize a Model with copies of the lab building side by side on a grid.
+
+    The Rooms of each copy get a unique identifier. Their Faces keep the
+    identifiers and Surface boundary conditions of the lab building.
+    """
+    with open(sample) as json_file:
+        model_dict = json.load(json_file)
+    text = json.dumps(model_dict['rooms'])
+    side = math.ceil(math.sqrt(copies))
+    rooms = []
+    for k in range(copies):
+        dx, dy = 200 * (k % side), 200 * (k // side)
+        for room in json.loads(text):
+            room['identifier'] = '{}_{}'.format(room['identifier'], k)
+            for face in room['faces']:
+                for obj in [face] + face.get('apertures', []) + face.get('doors', []):
+                    obj['geometry']['boundary'] = [
+                        [x + dx, y + dy, z] for x, y, z in obj['geometry']['boundary']]
+            rooms.append(room)
+    model_dict['rooms'] = rooms
+    model_dict.pop('orphaned_shades', None)
+    return model_dict
+
+
+def strip_surfaces(model_dict):
+    """Replace all Surface boundary conditions of the Faces with Outdoors."""
+    for room in model_dict['rooms']:
+        for face in room['faces']:
+            if face['boundary_condition']['type'] == 'Surface':
+                face['boundary_condition'] = {'type': 'Outdoors'}
@@ -0,0 +1,92 @@
+"""Test the solving of Surface boundary conditions between adjacent Rooms."""
+import os
+import json
+
+import pytest
+
+from honeybee_schema.adjacency import solve_adjacency
+from honeybee_schema.spatial import SpatialIndex
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+
+
+def _load(file_name, folder=target_folder):
+    with open(os.path.join(folder, file_name)) as json_file:
+        return json.load(json_file)
+
+
+def _strip_surfaces(model_dict):
+    """Replace all Surface boundary conditions with Outdoors and return the originals."""
+    surfaces = {}
+    for room in model_dict["rooms"]:
+        for face in room["faces"]:
+            for obj in [face] + face.get("apertures", []) + face.get("doors", []):
+                if obj["boundary_condition"]["type"] == "Surface":
+                    surfaces[obj["identifier"]] = obj["boundary_condition"]
+                    obj["boundary_condition"] = {"type": "Outdoors"}
+    return surfaces
+
+
+def _boundary_conditions(model_dict):
+    return {
+        obj["identifier"]: obj["boundary_condition"]
+        for room in model_dict["rooms"] for face in room["faces"]
+        for obj in [face] + face.get("apertures", []) + face.get("doors", [])
+    }
+
+
+def test_solve_adjacency():
+    for file_name, folder in (
+        ("lab_building.hbjson", os.path.join(root, "samples", "model_large")),
+        ("model_5vertex_sub_faces_interior.hbjson", target_folder),
+        ("model_complete_office_floor.hbjson", target_folder),
+    ):
+        model_dict = _load(file_name, folder)
+        surfaces = _strip_surfaces(model_dict)
+        result = solve_adjacency(model_dict)
+        assert result.mismatched_faces == []
+        solved = _boundary_conditions(model_dict)
+        assert {k: v for k, v in solved.items() if v["type"] == "Surface"} == surfaces
+
+
+def test_solve_adjacency_index():
+    model_dict = _load("model_complete_office_floor.hbjson")
+    surfaces = _strip_surfaces(model_dict)
+    index = SpatialIndex(model_dict)
+    result = solve_adjacency(model_dict, index=index)
+    assert len(result.adjacent_faces) * 2 == \
+        sum(1 for v in surfaces.values() if len(v["boundary_condition_objects"]) == 2)
+    solved = _boundary_conditions(model_dict)
+    assert {k: v for k, v in solved.items() if v["type"] == "Surface"} == surfaces
+
+    other = _load("model_5vertex_sub_faces_interior.hbjson")
+    _strip_surfaces(other)
+    with pytest.raises(ValueError):
+        solve_adjacency(other, index=index)
+
+
+def test_solve_adjacency_keeps_surfaces():
+    model_dict = _load("model_5vertex_sub_faces_interior.hbjson")
+    original = _boundary_conditions(model_dict)
+    result = solve_adjacency(model_dict)
+    assert result.adjacent_faces == [] and result.mismatched_faces == []
+    assert _boundary_conditions(model_dict) == original
+
+    result = solve_adjacency(model_dict, overwrite=True)
+    assert len(result.adjacent_faces) == 1
+    assert _boundary_conditions(model_dict) == original
+
+
+def test_solve_adjacency_mismatched_sub_faces():
+    model_dict = _load("model_5vertex_sub_faces_interior.hbjson")
+    _strip_surfaces(model_dict)
+    face = next(
+        f for r in model_dict["rooms"] for f in r["faces"] if f.get("apertures"))
+    face["apertures"].pop()
+    original = _boundary_conditions(model_dict)
+    result = solve_adjacency(model_dict)
+    assert result.adjacent_faces == []
+    assert len(result.mismatched_faces) == 1
+    assert _boundary_conditions(model_dict) == original
@@ -0,0 +1,122 @@
+"""Test the checks of the reciprocity of Surface boundary conditions."""
+import os
+import copy
+import json
+
+from honeybee_schema.adjacencycheck import adjacency_errors, check_adjacency, \
+    MISSING_CODE, AREA_CODE, RECIPROCAL_CODE, SUB_FACE_CODE, DUPLICATE_CODE, \
+    ORPHANED_CODE
+from honeybee_schema.spatial import SpatialIndex
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+
+
+def _load(file_name, folder=target_folder):
+    with open(os.path.join(folder, file_name)) as json_file:
+        return json.load(json_file)
+
+
+def _faces(model_dict):
+    """Get the two adjacent Faces of the interior sub-faces sample."""
+    front = model_dict["rooms"][0]["faces"]
+    back = model_dict["rooms"][1]["faces"]
+    return next(f for f in front if f["identifier"] == "TinyHouseZone1_Front"), \
+        next(f for f in back if f["identifier"] == "TinyHouseZone2_Back")
+
+
+def test_adjacency_samples():
+    for file_name, folder in (
+        ("lab_building.hbjson", os.path.join(root, "samples", "model_large")),
+        ("model_5vertex_sub_faces_interior.hbjson", target_folder),
+    ):
+        report = check_adjacency(_load(file_name, folder))
+        assert report.valid, file_name
+        assert report.errors == []
+
+
+def test_adjacency_missing():
+    model_dict = _load("model_5vertex_sub_faces_interior.hbjson")
+    front, back = _faces(model_dict)
+    front["boundary_condition"]["boundary_condition_objects"] = ["Unknown", "TinyHouseZone2"]
+    back["apertures"][0]["boundary_condition"]["boundary_condition_objects"].pop()
+    back["doors"][0]["boundary_condition"]["boundary_condition_objects"][2] = \
+        "TinyHouseZone2"
+    errors = adjacency_errors(model_dict)
+    missing = [e for e in errors if e.code == MISSING_CODE]
+    assert sorted(e.element_id[0] for e in missing) == [
+        back["apertures"][0]["identifier"], back["doors"][0]["identifier"],
+        "TinyHouseZone1_Front"]
+    assert all(len(e.element_id) == 1 for e in missing)
+    # the Face of the Room that still points at the broken one is not reciprocated
+    reciprocal = [e for e in errors if e.code == RECIPROCAL_CODE]
+    faces = [e for e in reciprocal if e.element_type.value == "Face"]
+    assert [e.element_id for e in faces] == \
+        [["TinyHouseZone2_Back", "TinyHouseZone1_Front"]]
+    assert faces[0].parents[0][0].id == "TinyHouseZone2"
+    assert faces[0].parents[1][0].id == "TinyHouseZone1"
+
+
+def test_adjacency_reciprocity():
+    model_dict = _load("model_5vertex_sub_faces_interior.hbjson")
+    front, back = _faces(model_dict)
+    back["boundary_condition"] = {"type": "Outdoors"}
+    errors = adjacency_errors(model_dict)
+    assert [(e.code, e.element_id) for e in errors] == [
+        (RECIPROCAL_CODE, ["TinyHouseZone1_Front", "TinyHouseZone2_Back"])]
+
+
+def test_adjacency_area_and_sub_faces():
+    model_dict = _load("model_5vertex_sub_faces_interior.hbjson")
+    front, back = _faces(model_dict)
+    back["geometry"]["boundary"] = [
+        [x, y, z * 2] for x, y, z in back["geometry"]["boundary"]]
+    door = front.pop("doors")[0]
+    model_dict["rooms"][1]["faces"].remove(back)
+    model_dict["rooms"][1]["faces"].append(back)
+    errors = adjacency_errors(model_dict)
+    codes = sorted(e.code for e in errors)
+    assert codes == [MISSING_CODE, AREA_CODE, SUB_FACE_CODE]
+    # the areas read from a SpatialIndex give the same errors
+    indexed = adjacency_errors(model_dict, index=SpatialIndex(model_dict))
+    assert [e.model_dump() for e in indexed] == [e.model_dump() for e in errors]
+    # each pair is reported once
+    sub_face = next(e for e in errors if e.code == SUB_FACE_CODE)
+    assert sorted(sub_face.element_id) == ["TinyHouseZone1_Front", "TinyHouseZone2_Back"]
+    # the Door without its adjacent Door is reported as missing
+    missing = next(e for e in errors if e.code == MISSING_CODE)
+    assert missing.element_id == [back["doors"][0]["identifier"]]
+    assert door["identifier"] in missing.message
+
+
+def test_adjacency_duplicates():
+    model_dict = _load("model_5vertex_sub_faces_interior.hbjson")
+    front, back = _faces(model_dict)
+    faces = model_dict["rooms"][0]["faces"]
+    faces.append(copy.deepcopy(front))
+    # duplicates without a Surface boundary condition are left to other checks
+    faces.append(copy.deepcopy(faces[2]))
+    errors = adjacency_errors(model_dict)
+    duplicates = [e for e in errors if e.code == DUPLICATE_CODE]
+    assert sorted(e.element_id[0] for e in duplicates) == sorted([
+        "TinyHouseZone1_Front", front["apertures"][0]["identifier"],
+        front["doors"][0]["identifier"]])
+    assert all(len(e.element_id) == 2 for e in duplicates)
+    # every copy is checked against the adjacent Face
+    assert [e.code for e in errors if e.code != DUPLICATE_CODE] == []
+
+
+def test_adjacency_orphaned():
+    model_dict = _load("model_5vertex_sub_faces_interior.hbjson")
+    front, back = _faces(model_dict)
+    orphan = copy.deepcopy(back)
+    orphan["identifier"] = "Orphaned_Back"
+    model_dict["orphaned_faces"] = [orphan]
+    errors = adjacency_errors(model_dict)
+    assert [(e.code, e.element_id) for e in errors] == [
+        (ORPHANED_CODE, ["Orphaned_Back"]),
+        (ORPHANED_CODE, [orphan["apertures"][0]["identifier"]]),
+        (ORPHANED_CODE, [orphan["doors"][0]["identifier"]]),
+    ]
+    assert errors[1].parents[0][0].id == "Orphaned_Back"
@@ -1,9 +1,14 @@
 """Test the CLI updater commands."""
+import os
+import sys
 import json
+import stat
+import shutil
 import pathlib
+import subprocess
 
 from click.testing import CliRunner
-from honeybee_schema.cli import update_model
+from honeybee_schema.cli import update_model, update_models, validate_model
 
 
 def test_update_model():
@@ -25,3 +30,86 @@ def test_update_model():
     assert updated_hvac['equipment_type'] == 'PSZAC_DCW_DHW'
 
     output_model.unlink()
+
+
+def test_validate_model():
+    input_model = './samples/model_large/lab_building.hbjson'
+    runner = CliRunner()
+    result = runner.invoke(validate_model, [input_model, '-p', '2', '-c', '20'])
+    assert result.exit_code == 0
+
+    report = json.loads(result.output)
+    assert report['type'] == 'ValidationReport'
+    assert report['valid']
+
+
+def test_update_models(tmp_path):
+    input_folder = tmp_path / 'archive'
+    (input_folder / 'sub').mkdir(parents=True)
+    for name in ('model_1.hbjson', 'model_2.hbjson', 'sub/model_3.hbjson'):
+        shutil.copy('./tests/json/model_old.hbjson', input_folder / name)
+    (input_folder / 'broken.hbjson').write_text('{"version": "1.39.11"')
+    output_folder = tmp_path / 'updated'
+
+    runner = CliRunner()
+    result = runner.invoke(update_models, [
+        input_folder.as_posix(), '-o', output_folder.as_posix(), '-p', '2'])
+    assert result.exit_code == 1
+    assert 'Processed 4 model files' in result.output
+    assert '3 updated, 0 already up to date, 1 failed.' in result.output
+
+    model_dict = json.loads((output_folder / 'sub' / 'model_3.hbjson').read_bytes())
+    assert tuple(int(v) for v in model_dict['version'].split('.')) >= (1, 40, 1)
+    assert model_dict['properties']['energy']['hvacs'][0]['vintage'] == 'ASHRAE_2010'
+    assert not list(output_folder.rglob('*.tmp'))
+
+    assert stat.S_IMODE(os.stat(output_folder / 'sub' / 'model_3.hbjson').st_mode) \
+        == 0o644
+
+    # update in place with a glob pattern, keeping the permissions of the files
+    os.chmod(input_folder / 'model_1.hbjson', 0o664)
+    pattern = (input_folder / 'model_*.hbjson').as_posix()
+    result = runner.invoke(update_models, [pattern, '-p', '1', '-v', '1.40.1'])
+    assert result.exit_code == 0
+    assert '2 updated, 0 already up to date, 0 failed.' in result.output
+    model_dict = json.loads((input_folder / 'model_1.hbjson').read_bytes())
+    assert model_dict['version'] == '1.40.1'
+    assert stat.S_IMODE(os.stat(input_folder / 'model_1.hbjson').st_mode) == 0o664
+
+
+def test_update_models_no_common_root(tmp_path, monkeypatch):
+    model_file = tmp_path / 'model.hbjson'
+    shutil.copy('./tests/json/model_old.hbjson', model_file)
+
+    def commonpath(paths):
+        raise ValueError("Paths don't have the same drive")
+
+    # files on different drives of Windows have no common path
+    monkeypatch.setattr(os.path, 'commonpath', commonpath)
+    result = CliRunner().invoke(update_models, [
+        model_file.as_posix(), '-o', (tmp_path / 'updated').as_posix()])
+    assert result.exit_code == 2
+    assert 'do not share a root folder' in result.output
+    assert not (tmp_path / 'updated').exists()
+
+
+def test_cli_import_is_lazy():
+    """The CLI entry point must not import pydantic or the schema objects."""
+    code = 'import sys, honeybee_schema.cli; ' \
+        'print("pydantic" in sys.modules, "honeybee_schema.model" in sys.modules)'
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+        cwd=pathlib.Path(__file__).parent.parent
+    )
+    assert result.stdout.split() == ['False', 'False']
+
+
+def test_package_submodules():
+    """Every public submodule is reachable as an attribute of the package."""
+    import honeybee_schema
+    folder = pathlib.Path(honeybee_schema.__file__).parent
+    names = {path.stem for path in folder.glob('*.py')} | \
+        {path.name for path in folder.iterdir() if (path / '__init__.py').is_file()}
+    names = {name for name in names if not name.startswith('_')}
+    assert names <= set(dir(honeybee_schema))
+    assert honeybee_schema.units.__name__ == 'honeybee_schema.units'
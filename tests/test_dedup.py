@@ -0,0 +1,92 @@
+"""Test the deduplication of Model resources by content hash."""
+import os
+import copy
+import json
+
+from honeybee_schema.model import Model
+from honeybee_schema.dedup import deduplicate_resources
+from honeybee_schema.hashing import content_hash
+from honeybee_schema.reference import check_references
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+
+
+def _copy_resource(energy, key, identifier, new_identifier):
+    resource = next(r for r in energy[key] if r["identifier"] == identifier)
+    resource = dict(copy.deepcopy(resource), identifier=new_identifier)
+    resource["display_name"] = "Copy of {}".format(identifier)
+    energy[key].append(resource)
+    return resource
+
+
+def test_content_hash():
+    obj = {"identifier": "a", "type": "X", "values": [1, 2]}
+    same = {"values": [1, 2], "type": "X", "identifier": "b", "display_name": "B"}
+    assert content_hash(obj) == content_hash(same)
+    assert content_hash(obj) != content_hash(dict(obj, values=[2, 1]))
+    assert content_hash(obj, exclude=()) != content_hash(same, exclude=())
+
+
+def test_deduplicate_resources():
+    with open(os.path.join(target_folder, "model_complete_multi_zone_office.hbjson")) as f:
+        model_dict = json.load(f)
+    original = copy.deepcopy(model_dict)
+    energy = model_dict["properties"]["energy"]
+    construction = energy["constructions"][0]
+    material_id = construction["materials"][0]
+    # a copied material makes a copied construction that only differs in names
+    _copy_resource(energy, "materials", material_id, "Material Copy")
+    copied = _copy_resource(
+        energy, "constructions", construction["identifier"], "Construction Copy")
+    copied["materials"][0] = "Material Copy"
+    _copy_resource(energy, "schedules", "Generic Office Occupancy", "Occupancy Copy")
+    energy["schedules"].append(copy.deepcopy(energy["schedules"][0]))
+    program = energy["program_types"][0]
+    program["people"]["occupancy_schedule"] = "Occupancy Copy"
+    room_properties = model_dict["rooms"][0]["faces"][0]["properties"]["energy"]
+    room_properties["construction"] = "Construction Copy"
+
+    result = deduplicate_resources(model_dict)
+    assert result.renamed == {
+        "materials": {"Material Copy": material_id},
+        "constructions": {"Construction Copy": construction["identifier"]},
+        "schedules": {"Occupancy Copy": "Generic Office Occupancy"},
+    }
+    assert result.removed_count == 4
+    assert result.bytes_saved > 0
+    for key in ("materials", "constructions", "schedules"):
+        assert len(energy[key]) == len(original["properties"]["energy"][key])
+    assert program["people"]["occupancy_schedule"] == "Generic Office Occupancy"
+    assert room_properties["construction"] == construction["identifier"]
+    assert check_references(model_dict).valid
+    Model.model_validate(model_dict)
+
+    assert deduplicate_resources(model_dict).removed_count == 0
+
+
+def test_deduplicate_resources_schedules_before_constructions():
+    with open(os.path.join(target_folder, "model_complete_multi_zone_office.hbjson")) as f:
+        model_dict = json.load(f)
+    energy = model_dict["properties"]["energy"]
+    _copy_resource(energy, "schedules", "Generic Office Occupancy", "Occupancy Copy")
+    for identifier, schedule in (("Mixing 1", "Generic Office Occupancy"),
+                                 ("Mixing 2", "Occupancy Copy")):
+        energy["constructions"].append({
+            "type": "AirBoundaryConstructionAbridged",
+            "identifier": identifier,
+            "air_mixing_per_area": 0.1,
+            "air_mixing_schedule": schedule,
+        })
+
+    # the constructions only differ by the names of their duplicated schedules
+    result = deduplicate_resources(model_dict, keys=("constructions", "schedules"))
+    assert result.renamed == {
+        "schedules": {"Occupancy Copy": "Generic Office Occupancy"},
+        "constructions": {"Mixing 2": "Mixing 1"},
+    }
+    identifiers = [c["identifier"] for c in energy["constructions"]]
+    assert "Mixing 1" in identifiers and "Mixing 2" not in identifiers
+    assert check_references(model_dict).valid
+    Model.model_validate(model_dict)
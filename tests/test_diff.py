@@ -0,0 +1,72 @@
+"""Test the comparison of two Models into a ComparisonReport."""
+import os
+import copy
+import json
+
+from honeybee_schema.comparison import ComparisonReport
+from honeybee_schema.diff import compare_models
+from honeybee_schema.hashing import ModelHashes
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+model_file = os.path.join(target_folder, "model_complete_office_floor.hbjson")
+
+
+def _load():
+    with open(model_file) as json_file:
+        return json.load(json_file)
+
+
+def test_compare_identical_models():
+    report = compare_models(model_file, _load())
+    assert isinstance(report, ComparisonReport)
+    assert report.changed_objects == []
+    assert report.added_objects == [] and report.deleted_objects == []
+
+
+def test_compare_models():
+    base = _load()
+    new = copy.deepcopy(base)
+    rooms = new["rooms"]
+    # a vertex moved within the tolerance and a property change
+    rooms[0]["faces"][0]["geometry"]["boundary"][0][0] += 0.001
+    del rooms[0]["properties"]["energy"]["hvac"]
+    # a vertex moved beyond the tolerance
+    rooms[1]["faces"][0]["geometry"]["boundary"][0][0] += 0.5
+    # a change that is neither geometry nor extension properties
+    rooms[2]["display_name"] = "Renamed Room"
+    deleted = rooms.pop(3)
+    added = dict(copy.deepcopy(rooms[0]), identifier="New_Room")
+    rooms.append(added)
+
+    report = compare_models(base, new)
+    changes = {c.element_id: c for c in report.changed_objects}
+    assert set(changes) == {rooms[0]["identifier"], rooms[1]["identifier"]}
+    first, second = changes[rooms[0]["identifier"]], changes[rooms[1]["identifier"]]
+    assert not first.geometry_changed and first.energy_changed
+    assert not first.radiance_changed and first.existing_geometry is None
+    assert second.geometry_changed and not second.energy_changed
+    assert len(second.existing_geometry) == len(second.geometry) > 0
+    assert [d.element_id for d in report.deleted_objects] == [deleted["identifier"]]
+    assert [a.element_id for a in report.added_objects] == ["New_Room"]
+    assert report.added_objects[0].element_type.value == "Room"
+    ComparisonReport.model_validate_json(report.model_dump_json(exclude_none=True))
+
+    hashed = compare_models(base, new, ModelHashes(base), ModelHashes(new))
+    assert hashed == report
+
+
+def test_compare_models_units():
+    base = _load()
+    new = copy.deepcopy(base)
+    new["units"] = "Millimeters"
+    for room in new["rooms"]:
+        for face in room["faces"]:
+            face["geometry"]["boundary"] = [
+                [c * 1000 for c in pt] for pt in face["geometry"]["boundary"]]
+            for aperture in face.get("apertures") or ():
+                aperture["geometry"]["boundary"] = [
+                    [c * 1000 for c in pt] for pt in aperture["geometry"]["boundary"]]
+    report = compare_models(base, new)
+    assert report.changed_objects == []
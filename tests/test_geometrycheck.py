@@ -0,0 +1,96 @@
+"""Test the checks of the Face3D and Room geometry of Models."""
+import os
+import copy
+import json
+
+import pytest
+
+from honeybee_schema.geometrycheck import (
+    DEGENERATE_CODE, NON_PLANAR_CODE, NON_SOLID_CODE, SELF_INTERSECTING_CODE,
+    check_geometry, geometry_errors)
+from honeybee_schema.validation import ValidationReport
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+
+
+def _load(file_name):
+    with open(os.path.join(target_folder, file_name)) as json_file:
+        return json.load(json_file)
+
+
+def _face(identifier, boundary):
+    return {
+        "type": "Face", "identifier": identifier, "face_type": "Wall",
+        "boundary_condition": {"type": "Outdoors"},
+        "geometry": {"type": "Face3D", "boundary": boundary},
+        "properties": {"type": "FacePropertiesAbridged"},
+    }
+
+
+def _box_model():
+    """Get a Model with a 2 x 1 x 1 box Room whose south wall is split in two."""
+    faces = [
+        _face("Floor", [[0, 0, 0], [0, 1, 0], [2, 1, 0], [2, 0, 0]]),
+        _face("Roof", [[0, 0, 1], [2, 0, 1], [2, 1, 1], [0, 1, 1]]),
+        _face("South_1", [[0, 0, 0], [1, 0, 0], [1, 0, 1], [0, 0, 1]]),
+        _face("South_2", [[1, 0, 0], [2, 0, 0], [2, 0, 1], [1, 0, 1]]),
+        _face("East", [[2, 0, 0], [2, 1, 0], [2, 1, 1], [2, 0, 1]]),
+        _face("North", [[2, 1, 0], [0, 1, 0], [0, 1, 1], [2, 1, 1]]),
+        _face("West", [[0, 1, 0], [0, 0, 0], [0, 0, 1], [0, 1, 1]]),
+    ]
+    room = {
+        "type": "Room", "identifier": "Box", "faces": faces,
+        "properties": {"type": "RoomPropertiesAbridged"},
+    }
+    return {
+        "type": "Model", "identifier": "Box_Model", "tolerance": 0.01,
+        "rooms": [room], "properties": {"type": "ModelProperties"},
+    }
+
+
+def test_check_geometry_valid():
+    report = check_geometry(_load("model_complete_office_floor.hbjson"))
+    assert isinstance(report, ValidationReport)
+    assert report.valid and report.errors == []
+    # the roof spans both parts of the split wall, which must still be closed
+    assert geometry_errors(_box_model()) == []
+
+
+def test_check_geometry_faces():
+    model = _box_model()
+    faces = {f["identifier"]: f for f in model["rooms"][0]["faces"]}
+    faces["Roof"]["geometry"]["boundary"][2] = [2, 1, 1.5]
+    faces["Floor"]["geometry"]["boundary"].insert(1, [0, 1.001, 0])
+    faces["East"]["geometry"]["boundary"] = [
+        [2, 0, 0], [2, 1, 0], [2, 1, 1], [2, 0.5, -0.5], [2, 0, 1]]
+
+    errors = {e.element_id[0]: e for e in geometry_errors(model)}
+    assert errors["Roof"].code == NON_PLANAR_CODE
+    assert all(p.type == "Point3D" for p in errors["Roof"].helper_geometry)
+    assert errors["Roof"].parents[0][0].id == "Box"
+    assert errors["Floor"].code == DEGENERATE_CODE
+    assert len(errors["Floor"].helper_geometry) == 1
+    assert errors["East"].code == SELF_INTERSECTING_CODE
+    points = sorted((p.x, p.y, p.z) for p in errors["East"].helper_geometry)
+    assert points == [pytest.approx((2, 1 / 3, 0)), pytest.approx((2, 2 / 3, 0))]
+    assert errors["Box"].code == NON_SOLID_CODE
+    ValidationReport.model_validate_json(
+        check_geometry(model).model_dump_json(exclude_none=True))
+
+
+def test_check_geometry_room():
+    model = _box_model()
+    faces = model["rooms"][0]["faces"]
+    faces.pop()
+    errors = geometry_errors(model)
+    assert [e.code for e in errors] == [NON_SOLID_CODE]
+    assert len(errors[0].helper_geometry) == 4  # the edges of the removed wall
+    assert all(s.type == "LineSegment3D" for s in errors[0].helper_geometry)
+
+    # edges shared by more than two faces are non-manifold
+    faces.append(copy.deepcopy(faces[-1]))
+    faces.append(copy.deepcopy(faces[-1]))
+    errors = geometry_errors(model)
+    assert "3 naked edges and 4 non-manifold edges" in errors[0].message
@@ -0,0 +1,63 @@
+"""Test the Merkle-style content hashes of Model objects."""
+import os
+import copy
+import json
+
+from honeybee_schema.hashing import ModelHashes, content_hash
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+
+
+def _load():
+    file_path = os.path.join(target_folder, "model_complete_multi_zone_office.hbjson")
+    with open(file_path) as json_file:
+        return json.load(json_file)
+
+
+def test_room_hash_composition():
+    model_dict = _load()
+    hashes = ModelHashes(model_dict)
+    room = model_dict["rooms"][0]
+    face_hashes = [hashes.object_hash(face) for face in room["faces"]]
+    assert hashes.object_hash(room) == content_hash(
+        dict(room, faces=face_hashes), exclude=())
+    assert hashes.object_hash(room) is hashes.object_hash(room)
+
+    # key order and formatting do not affect the hashes
+    reordered = json.loads(json.dumps(model_dict, sort_keys=True, indent=2))
+    assert ModelHashes(reordered).rooms() == hashes.rooms()
+    assert ModelHashes(reordered).model_hash() == hashes.model_hash()
+
+
+def test_changed_objects():
+    model_dict = _load()
+    hashes = ModelHashes(model_dict)
+    edited = copy.deepcopy(model_dict)
+    room = next(r for r in edited["rooms"]
+                if any(f.get("apertures") for f in r["faces"]))
+    face = next(f for f in room["faces"] if f.get("apertures"))
+    face["apertures"][0]["geometry"]["boundary"][0][2] += 0.1
+    edited_hashes = ModelHashes(edited)
+
+    changed = {
+        identifier for identifier, digest in edited_hashes.rooms().items()
+        if hashes.rooms()[identifier] != digest
+    }
+    assert changed == {room["identifier"]}
+    original_room = next(
+        r for r in model_dict["rooms"] if r["identifier"] == room["identifier"])
+    original_face = next(
+        f for f in original_room["faces"] if f["identifier"] == face["identifier"])
+    assert edited_hashes.object_hash(face) != hashes.object_hash(original_face)
+    assert edited_hashes.model_hash() != hashes.model_hash()
+    assert edited_hashes.resources("energy", "schedules") == \
+        hashes.resources("energy", "schedules")
+
+    # the cache must be cleared after editing an object in place
+    digest = edited_hashes.object_hash(room)
+    room["display_name"] = "Renamed Room"
+    assert edited_hashes.object_hash(room) == digest
+    edited_hashes.clear()
+    assert edited_hashes.object_hash(room) != digest
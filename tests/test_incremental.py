@@ -0,0 +1,77 @@
+"""Test the incremental validation of Models with cached element outcomes."""
+import os
+import copy
+import json
+
+from click.testing import CliRunner
+from honeybee_schema.cli import validate_model
+from honeybee_schema.incremental import (
+    ValidationCache, element_digest, validate_model_incremental)
+from honeybee_schema.parallel import validate_model_parallel
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+model_file = os.path.join(target_folder, "model_complete_office_floor.hbjson")
+
+
+def _load():
+    with open(model_file) as json_file:
+        return json.load(json_file)
+
+
+def test_validate_model_incremental():
+    model_dict = _load()
+    cache = ValidationCache()
+    report = validate_model_incremental(model_dict, cache)
+    assert report.valid
+    element_count = len(cache)
+    assert cache.misses == element_count and cache.hits == 0
+
+    edited = copy.deepcopy(model_dict)
+    edited["rooms"][1]["faces"][0]["geometry"]["boundary"] = [[0, 0, 0]]
+    report = validate_model_incremental(edited, cache)
+    assert cache.misses == element_count + 1
+    assert cache.hits == element_count - 1
+    assert not report.valid
+    assert [e.element_id[0] for e in report.errors] == [edited["rooms"][1]["identifier"]]
+    assert report == validate_model_parallel(edited, processes=1)
+
+    # a cached failure is spliced into the report without validating again
+    report = validate_model_incremental(copy.deepcopy(edited), cache)
+    assert cache.misses == element_count + 1
+    assert report == validate_model_parallel(edited, processes=1)
+
+
+def test_validation_cache_eviction():
+    cache = ValidationCache(maxsize=2)
+    digests = [element_digest("rooms", {"identifier": str(i)}) for i in range(3)]
+    cache.put(digests[0], None)
+    cache.put(digests[1], "invalid")
+    assert cache.get(digests[0]) is None
+    cache.put(digests[2], None)
+    assert len(cache) == 2
+    assert digests[1] not in cache
+    assert digests[0] in cache and digests[2] in cache
+
+
+def test_validation_cache_folder(tmp_path):
+    cache = ValidationCache(folder=str(tmp_path))
+    validate_model_incremental(_load(), cache)
+    path = cache.save()
+    assert os.path.isfile(path)
+
+    loaded = ValidationCache(folder=str(tmp_path))
+    assert len(loaded) == len(cache)
+    validate_model_incremental(_load(), loaded)
+    assert loaded.misses == 0
+
+
+def test_validate_model_cli_incremental(tmp_path, monkeypatch):
+    monkeypatch.setenv("HONEYBEE_SCHEMA_CACHE", str(tmp_path))
+    runner = CliRunner()
+    for _ in range(2):
+        result = runner.invoke(validate_model, [model_file, "--incremental"])
+        assert result.exit_code == 0
+        assert json.loads(result.output)["valid"]
+    assert any(name.startswith("validation-") for name in os.listdir(tmp_path))
@@ -0,0 +1,59 @@
+from honeybee_schema.lazy import LazyModel
+from honeybee_schema.model import Model
+
+import os
+import json
+import pytest
+from pydantic import ValidationError
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model_large')
+
+
+def test_lazy_model_lab_building():
+    file_path = os.path.join(target_folder, 'lab_building.hbjson')
+    lazy_model = LazyModel(file_path)
+    model = Model.model_validate_json(open(file_path).read())
+
+    assert lazy_model.identifier == model.identifier
+    assert lazy_model.header.units == model.units
+    assert lazy_model.header.rooms is None
+    assert len(lazy_model.rooms) == len(model.rooms)
+    assert not lazy_model.rooms.is_loaded(5)
+    assert lazy_model.rooms[5] == model.rooms[5]
+    assert lazy_model.rooms.is_loaded(5)
+    assert lazy_model.rooms[5] is lazy_model.rooms[5]
+    assert lazy_model.rooms[-1] == model.rooms[-1]
+    assert lazy_model.rooms.get(model.rooms[7].identifier) == model.rooms[7]
+    assert lazy_model.rooms.get('not_a_room') is None
+    assert len(lazy_model.orphaned_doors) == 0
+
+    schedules = lazy_model.resources('energy', 'schedules')
+    energy = model.properties.energy
+    assert schedules.identifiers == [sch.identifier for sch in energy.schedules]
+    assert schedules[3] == energy.schedules[3]
+    con_sets = lazy_model.resources('energy', 'construction_sets')
+    assert con_sets[0] == energy.construction_sets[0]
+    assert json.loads(con_sets.raw_json(0))['identifier'] == con_sets.identifiers[0]
+
+    with pytest.raises(ValueError):
+        lazy_model.resources('energy', 'identifier')
+    with pytest.raises(ValueError):
+        lazy_model.collection('properties')
+
+
+def test_lazy_model_invalid_room(tmp_path):
+    file_path = os.path.join(target_folder, 'lab_building.hbjson')
+    with open(file_path) as json_file:
+        model_dict = json.load(json_file)
+    model_dict['rooms'][1]['faces'] = 'not a list of faces'
+    invalid_path = tmp_path / 'invalid_room.hbjson'
+    invalid_path.write_text(json.dumps(model_dict))
+
+    lazy_model = LazyModel(str(invalid_path), chunk_size=1000)
+    assert lazy_model.rooms[0].identifier == model_dict['rooms'][0]['identifier']
+    with pytest.raises(ValidationError):
+        lazy_model.rooms[1]
+    with pytest.raises(ValidationError):
+        lazy_model.to_model()
@@ -0,0 +1,72 @@
+"""Test the fused migration engine of the updater."""
+import copy
+import json
+
+from honeybee_schema.updater.migration import Migration, fuse, migrate
+from honeybee_schema.updater import version_1_39_12, version_1_40_1, version_1_43_1, \
+    version_1_43_2, version_1_43_5
+
+MODULES = (version_1_39_12, version_1_40_1, version_1_43_1, version_1_43_2,
+           version_1_43_5)
+
+
+def test_migrate_matches_chained_updaters():
+    with open('./tests/json/model_old.hbjson') as json_file:
+        model_dict = json.load(json_file)
+    model_dict['properties']['energy']['constructions'] = [{
+        'type': 'OpaqueConstructionAbridged', 'identifier': 'Wall', 'layers': ['Brick']
+    }]
+    model_dict['properties']['radiance'] = {
+        'type': 'ModelRadianceProperties',
+        'modifiers': [{'type': 'plastic', 'identifier': 'Generic Wall'}]
+    }
+
+    chained = copy.deepcopy(model_dict)
+    for module in MODULES:
+        name = 'version_{}'.format('_'.join(map(str, module.MIGRATION.version)))
+        chained = getattr(module, name)(chained)
+    fused = migrate(model_dict, [module.MIGRATION for module in reversed(MODULES)])
+
+    assert fused == chained
+    assert fused['properties']['energy']['hvacs'][0]['equipment_type'] == \
+        'PSZAC_DCW_DHW'
+    assert fused['properties']['energy']['constructions'][0]['materials'] == ['Brick']
+    assert fused['properties']['radiance']['modifiers'][0]['type'] == 'Plastic'
+
+
+def test_fuse_orders_handlers_by_version():
+    calls = []
+    path = ('properties', 'energy', 'hvacs')
+    first = Migration((1, 0, 0), {path: lambda hvac: calls.append(1)})
+    second = Migration((1, 1, 0), {path: lambda hvac: calls.append(2)})
+    assert len(fuse([second, first])[path]) == 2
+
+    model_dict = {'properties': {'energy': {'hvacs': [{}, {}]}}}
+    migrate(model_dict, [second, first])
+    assert calls == [1, 2, 1, 2]
+    assert migrate({'properties': {}}, [first]) == {'properties': {}}
+
+
+def test_registry_contains_all_updaters():
+    import pkgutil
+    from honeybee_schema import updater
+    modules = [m.name for m in pkgutil.walk_packages(updater.__path__)
+               if m.name.startswith('version_')]
+    assert len(updater.MIGRATIONS) == len(modules)
+    assert list(updater.VERSIONS) == sorted(updater.VERSIONS)
+
+
+def test_upgrade():
+    from honeybee_schema.updater import select_migrations, upgrade
+    assert [m.version for m in select_migrations('1.40.0', '1.43.2')] == \
+        [(1, 40, 1), (1, 43, 1), (1, 43, 2)]
+    assert select_migrations((1, 43, 6)) == ()
+
+    with open('./tests/json/model_old.hbjson') as json_file:
+        model_dict = json.load(json_file)
+    upgrade(model_dict, to='1.40.1')
+    assert model_dict['version'] == '1.40.1'
+    assert model_dict['properties']['energy']['hvacs'][0]['vintage'] == 'ASHRAE_2010'
+    upgrade(model_dict)
+    assert model_dict['version'] == '1.43.5'
+    assert upgrade(model_dict, to='1.40.1')['version'] == '1.43.5'
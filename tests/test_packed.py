@@ -0,0 +1,161 @@
+from honeybee_schema.model import Model
+from honeybee_schema.geometry import Face3D, Mesh3D
+from honeybee_schema.radiance.asset import SensorGrid
+from honeybee_schema.energy.schedule import ScheduleFixedIntervalAbridged
+from honeybee_schema.packed import PACKED_ARRAYS, PackedPoints, PackedFaces, \
+    PackedSensors, PackedValues
+
+import os
+import pytest
+from pydantic import ValidationError
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+packed = {PACKED_ARRAYS: True}
+
+
+@pytest.mark.parametrize('file_path', [
+    os.path.join(target_folder, 'model_with_shade_mesh.hbjson'),
+    os.path.join(root, 'samples', 'model_large', 'lab_building.hbjson'),
+])
+def test_packed_model_round_trip(file_path):
+    with open(file_path) as json_file:
+        json_data = json_file.read()
+    model = Model.model_validate_json(json_data)
+    packed_model = Model.model_validate_json(json_data, context=packed)
+    assert isinstance(packed_model.rooms[0].faces[0].geometry.boundary, PackedPoints)
+    assert packed_model.model_dump_json(exclude_unset=True) == \
+        model.model_dump_json(exclude_unset=True)
+    assert packed_model.model_dump(exclude_unset=True) == \
+        model.model_dump(exclude_unset=True)
+
+
+def test_packed_face3d():
+    face = {
+        'type': 'Face3D',
+        'boundary': [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0]],
+        'holes': [[[2, 2, 0], [4, 2, 0], [4, 4, 0]]]
+    }
+    geo = Face3D.model_validate(face, context=packed)
+    assert len(geo.boundary) == 4
+    assert geo.boundary[-1] == [0.0, 10.0, 0.0]
+    assert isinstance(geo.holes[0], PackedPoints)
+    assert geo.model_dump(exclude_unset=True) == \
+        Face3D.model_validate(face).model_dump(exclude_unset=True)
+
+    for boundary in ([[0, 0, 0], [10, 0, 0]], [[0, 0], [10, 0], [10, 10]],
+                     [[0, 0, 0], [10, 0, 0], [10, 'ten', 0]]):
+        with pytest.raises(ValidationError):
+            Face3D.model_validate({'boundary': boundary}, context=packed)
+
+
+def test_packed_coercion():
+    # packed input is coerced and rejected the same way as the default lists
+    face = {'boundary': [[0, 0, '0'], [10, 0, 0], ['10', 10.0, True]]}
+    geo = Face3D.model_validate(face, context=packed)
+    assert geo.boundary.to_list() == Face3D.model_validate(face).boundary
+    mesh = {'vertices': face['boundary'], 'faces': [['0', 1.0, 2]]}
+    assert Mesh3D.model_validate(mesh, context=packed).faces.to_list() == \
+        Mesh3D.model_validate(mesh).faces
+
+    for boundary in ([[0, 0, 0], [10, 0, 0], [10, 10 ** 400, 0]],
+                     [[0, 0, 0], [10, 0, 0], '123']):
+        with pytest.raises(ValidationError):
+            Face3D.model_validate({'boundary': boundary})
+        with pytest.raises(ValidationError):
+            Face3D.model_validate({'boundary': boundary}, context=packed)
+    json_data = '{"boundary": [[0, 0, 0], [10, 0, 0], [10, 1%s, 0]]}' % ('0' * 400)
+    with pytest.raises(ValidationError):
+        Face3D.model_validate_json(json_data, context=packed)
+    for faces in ([[0, 1, 2 ** 70]], [[0, 1, 1.5]], ['012']):
+        with pytest.raises(ValidationError):
+            Mesh3D.model_validate(dict(mesh, faces=faces), context=packed)
+
+
+def test_packed_instances_lengths():
+    # packed objects passed in directly get the length checks of their field
+    two_points = PackedPoints.from_points([[0, 0, 0], [10, 0, 0]])
+    for context in (None, packed):
+        with pytest.raises(ValidationError):
+            Face3D.model_validate({'boundary': two_points}, context=context)
+        with pytest.raises(ValidationError):
+            Mesh3D.model_validate(
+                {'vertices': two_points, 'faces': [[0, 1, 1]]}, context=context)
+        with pytest.raises(ValidationError):
+            Mesh3D.model_validate(
+                {'vertices': [[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+                 'faces': PackedFaces.from_faces([])}, context=context)
+    boundary = [[0, 0, 0], [10, 0, 0], [10, 10, 0]]
+    with pytest.raises(ValidationError):
+        Face3D.model_validate({'boundary': boundary, 'holes': [two_points]},
+                              context=packed)
+
+
+def test_packed_mesh3d():
+    mesh = {
+        'type': 'Mesh3D',
+        'vertices': [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0]],
+        'faces': [[0, 1, 2, 3], [0, 1, 2]]
+    }
+    geo = Mesh3D.model_validate(mesh, context=packed)
+    assert isinstance(geo.faces, PackedFaces)
+    assert geo.faces[1] == [0, 1, 2]
+    assert geo.model_dump(exclude_unset=True) == \
+        Mesh3D.model_validate(mesh).model_dump(exclude_unset=True)
+
+    for faces in ([], [[0, 1]], [[0, 1, -2]], [[0, 1, 2.5]]):
+        with pytest.raises(ValidationError):
+            Mesh3D.model_validate(dict(mesh, faces=faces), context=packed)
+
+
+def test_packed_sensor_grid():
+    file_path = os.path.join(target_folder, 'model_radiance_grid_views.hbjson')
+    with open(file_path) as json_file:
+        json_data = json_file.read()
+    model = Model.model_validate_json(json_data)
+    packed_model = Model.model_validate_json(json_data, context=packed)
+    grid = packed_model.properties.radiance.sensor_grids[0]
+    assert isinstance(grid.sensors, PackedSensors)
+    assert grid.sensors.to_sensors() == model.properties.radiance.sensor_grids[0].sensors
+    assert packed_model.model_dump_json() == model.model_dump_json()
+
+    sensors = PackedSensors.from_sensors(grid.sensors.to_sensors())
+    assert sensors == grid.sensors
+    assert SensorGrid.model_validate(
+        {'identifier': 'grid', 'sensors': sensors}).sensors is sensors
+
+    for sensor in ({'pos': [0, 0, 0]}, {'pos': [0, 0, 0], 'dir': [0, 0]},
+                   {'pos': [0, 0, 0], 'dir': [0, 0, 1], 'up': [0, 1, 0]}):
+        with pytest.raises(ValidationError):
+            SensorGrid.model_validate(
+                {'identifier': 'grid', 'sensors': [sensor]}, context=packed)
+
+
+def test_packed_schedule_fixed_interval():
+    file_path = os.path.join(target_folder, 'model_energy_fixed_interval.hbjson')
+    with open(file_path) as json_file:
+        json_data = json_file.read()
+    model = Model.model_validate_json(json_data)
+    packed_model = Model.model_validate_json(json_data, context=packed)
+    schedules = [s for s in packed_model.properties.energy.schedules
+                 if s.type == 'ScheduleFixedIntervalAbridged']
+    assert schedules and all(isinstance(s.values, PackedValues) for s in schedules)
+    assert packed_model.model_dump_json() == model.model_dump_json()
+
+    schedule = schedules[0]
+    values = PackedValues.from_base64(schedule.values.to_base64())
+    assert values == schedule.values
+    assert values.to_list() == schedule.values.to_list()
+    schedule_dict = dict(schedule.model_dump(), values=values)
+    assert ScheduleFixedIntervalAbridged.model_validate(
+        schedule_dict).values is values
+
+    coerced = ScheduleFixedIntervalAbridged.model_validate(
+        dict(schedule_dict, values=['1'] * 12 + [True] * 12), context=packed)
+    assert coerced.values.to_list() == [1.0] * 24
+    for bad_values in ([1] * 23, [1] * 25, ['a'] * 24, [10 ** 400] * 24, 1,
+                       PackedValues.from_values([1] * 23)):
+        with pytest.raises(ValidationError):
+            ScheduleFixedIntervalAbridged.model_validate(
+                dict(schedule_dict, values=bad_values), context=packed)
@@ -0,0 +1,49 @@
+from honeybee_schema.parallel import partition_model, validate_model_parallel
+import os
+import json
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder_large = os.path.join(root, "samples", "model_large")
+
+
+def _load_lab_building():
+    file_path = os.path.join(target_folder_large, "lab_building.hbjson")
+    with open(file_path) as json_file:
+        return json.load(json_file)
+
+
+def test_partition_model():
+    model_dict = _load_lab_building()
+    header, chunks = partition_model(model_dict, chunk_size=30)
+    assert "rooms" not in header
+    assert "rooms" in model_dict
+    assert "constructions" not in header["properties"]["energy"]
+    room_chunks = [chunk for chunk in chunks if chunk[0] == ("rooms",)]
+    assert [chunk[1] for chunk in room_chunks] == [0, 30, 60, 90]
+    assert sum(len(chunk[2]) for chunk in room_chunks) == 100
+
+
+def test_validate_model_parallel():
+    model_dict = _load_lab_building()
+    report = validate_model_parallel(model_dict, processes=2, chunk_size=20)
+    assert report.valid
+    assert report.errors == []
+
+
+def test_validate_model_parallel_invalid():
+    model_dict = _load_lab_building()
+    model_dict["rooms"][3]["faces"] = []
+    model_dict["properties"]["energy"]["materials"][0]["thickness"] = "thick"
+    report = validate_model_parallel(model_dict, processes=2, chunk_size=20)
+    assert not report.valid
+    assert not report.fatal_error
+    assert [error.element_id for error in report.errors] == [
+        [model_dict["rooms"][3]["identifier"]],
+        [model_dict["properties"]["energy"]["materials"][0]["identifier"]],
+    ]
+    assert [error.code for error in report.errors] == ["000000", "020000"]
+
+    model_dict["units"] = "Parsecs"
+    report = validate_model_parallel(model_dict, processes=1)
+    assert "units" in report.fatal_error
@@ -4,9 +4,12 @@ from honeybee_schema.radiance.properties import (
     ModelRadianceProperties,
 )
 from honeybee_schema.energy.properties import ModelEnergyProperties
+from honeybee_schema.model import Face
 
 import os
 import json
+import pytest
+from pydantic import ValidationError
 
 # target folder where all of the samples live
 root = os.path.dirname(os.path.dirname(__file__))
@@ -40,3 +43,30 @@ def test_model_energy_properties_office():
     with open(file_path) as file:
         json_data = file.read()
     ModelEnergyProperties.model_validate_json(json_data)
+
+
+def test_model_energy_properties_type_dispatch():
+    file_path = os.path.join(root, "samples", "model_large", "lab_building.hbjson")
+    with open(file_path) as json_file:
+        model_energy_props = json.load(json_file)["properties"]["energy"]
+    glazing = [m for m in model_energy_props["materials"]
+               if m["type"] == "EnergyWindowMaterialGlazing"][0]
+    glazing["thickness"] = "thick"
+    with pytest.raises(ValidationError) as exc_info:
+        ModelEnergyProperties.model_validate(model_energy_props)
+    errors = exc_info.value.errors()
+    assert len(errors) == 1
+    assert errors[0]["loc"][2:] == ("EnergyWindowMaterialGlazing", "thickness")
+
+
+def test_type_dispatch_json_schema():
+    # dispatched Unions publish the same flat anyOf as a plain Union
+    bc_schema = Face.model_json_schema()["properties"]["boundary_condition"]
+    assert [m["$ref"].split("/")[-1] for m in bc_schema["anyOf"]] == [
+        "Ground", "Outdoors", "Adiabatic", "Surface", "OtherSideTemperature"]
+    materials = ModelEnergyProperties.model_json_schema()["properties"]["materials"]
+    items = materials["anyOf"][0]["items"]
+    assert list(items) == ["anyOf"]
+    assert [m["$ref"].split("/")[-1] for m in items["anyOf"]][:3] == [
+        "EnergyMaterial", "EnergyMaterialNoMass", "EnergyMaterialVegetation"]
+    assert all(list(m) == ["$ref"] for m in items["anyOf"])
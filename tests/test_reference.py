@@ -0,0 +1,60 @@
+from honeybee_schema.reference import ReferenceIndex, check_references
+
+import os
+import json
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+
+def _load(file_name, folder=target_folder):
+    with open(os.path.join(folder, file_name)) as json_file:
+        return json.load(json_file)
+
+
+def test_reference_index_lookup():
+    model_dict = _load('lab_building.hbjson', os.path.join(root, 'samples', 'model_large'))
+    index = ReferenceIndex(model_dict)
+    schedule = model_dict['properties']['energy']['schedules'][0]
+    assert index.get('schedules', schedule['identifier']) is schedule
+    assert index.get('schedules', 'not_a_schedule') is None
+    assert not index.duplicates
+
+    room_props = model_dict['rooms'][0]['properties']['energy']
+    references = list(index.references(room_props))
+    assert any(ref.key == 'program_types' for ref in references)
+    assert all(ref.resolved for ref in references)
+
+    report = check_references(model_dict)
+    assert report.valid
+
+
+def test_reference_duplicates():
+    model_dict = _load('model_complete_patient_room.hbjson')
+    errors = ReferenceIndex(model_dict).check()
+    assert len(errors) == 1
+    assert errors[0].code == '020005'
+    assert errors[0].element_id == ['Humidity Controlled PatRm Setpt_DeHumidSetp']
+
+
+def test_reference_dangling():
+    model_dict = _load('model_complete_multi_zone_office.hbjson')
+    energy = model_dict['properties']['energy']
+    room = [r for r in model_dict['rooms']
+            if any(face.get('apertures') for face in r['faces'])][0]
+    room['properties']['energy']['program_type'] = 'Missing Program'
+    aperture = [face for face in room['faces'] if face.get('apertures')][0]['apertures'][0]
+    aperture['properties']['energy']['construction'] = 'Missing Construction'
+    schedule = [sch for sch in energy['schedules']
+                if sch['type'] == 'ScheduleRulesetAbridged'][0]
+    schedule['default_day_schedule'] = 'Missing Day'
+
+    report = check_references(model_dict)
+    assert not report.valid
+    errors = {error.code: error for error in report.errors}
+    assert len(report.errors) == 3
+    assert errors['020016'].element_id == [room['identifier']]
+    assert errors['020012'].element_type == 'Aperture'
+    assert [p.parent_type for p in errors['020012'].parents[0]] == ['Face', 'Room']
+    assert errors['020015'].element_id == [schedule['identifier']]
@@ -0,0 +1,115 @@
+"""Test the evaluation of ScheduleRulesets into annual values."""
+import os
+import json
+import datetime
+
+import pytest
+
+from honeybee_schema.energy.schedule import ScheduleDay, ScheduleRulesetAbridged
+from honeybee_schema.energy.schedulevalues import (
+    DAYS_OF_WEEK,
+    annual_values,
+    compile_ruleset,
+    schedule_day_values,
+)
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "schedule")
+
+
+def _load(file_name):
+    with open(os.path.join(target_folder, file_name)) as json_file:
+        return json.load(json_file)
+
+
+def _day_by_day(ruleset, timestep, leap_year, holidays=()):
+    """Evaluate a ruleset one day at a time as a reference."""
+    days = {day["identifier"]: day for day in ruleset["day_schedules"]}
+    year = 2016 if leap_year else 2017
+    date, values = datetime.date(year, 1, 1), []
+    while date.year == year:
+        day_id = ruleset["default_day_schedule"]
+        if (date.month, date.day) in holidays:
+            day_id = ruleset.get("holiday_schedule") or day_id
+        else:
+            # the year starts on a Sunday as it does by default in annual_values
+            day_name = DAYS_OF_WEEK[(date.timetuple().tm_yday - 1) % 7]
+            for rule in ruleset.get("schedule_rules") or ():
+                start = datetime.date(year, *rule["start_date"][:2])
+                end = datetime.date(year, *rule["end_date"][:2])
+                in_period = start <= date <= end if start <= end \
+                    else date >= start or date <= end
+                day_key = "apply_{}".format(day_name.lower())
+                if in_period and rule.get(day_key):
+                    day_id = rule["schedule_day"]
+                    break
+        values.extend(schedule_day_values(days[day_id], timestep))
+        date += datetime.timedelta(days=1)
+    return values
+
+
+@pytest.mark.parametrize("file_name", [
+    "schedule_primary_school_occupancy.json",
+    "schedule_ruleset_office_occupancy.json",
+    "schedule_ruleset_simple_repeating.json",
+])
+@pytest.mark.parametrize("timestep, leap_year", [(1, False), (4, True)])
+def test_annual_values(file_name, timestep, leap_year):
+    ruleset = _load(file_name)
+    values = annual_values(ruleset, timestep, leap_year)
+    assert len(values) == (8784 if leap_year else 8760) * timestep
+    assert list(values) == _day_by_day(ruleset, timestep, leap_year)
+
+
+def test_annual_values_holidays():
+    ruleset = _load("schedule_primary_school_occupancy.json")
+    holidays = [(1, 2), (12, 25)]
+    values = annual_values(ruleset, holidays=holidays)
+    assert list(values) == _day_by_day(ruleset, 1, False, set(holidays))
+    # January 2nd 2017 is a Monday, which uses the holiday schedule of zeros
+    assert max(values[24:48]) == 0
+    assert max(annual_values(ruleset)[24:48]) == 1
+
+
+def test_annual_values_feb_29():
+    ruleset = _load("schedule_primary_school_occupancy.json")
+    rule = dict(ruleset["schedule_rules"][0], start_date=[2, 1], end_date=[2, 29])
+    rule.update({key: True for key in rule if key.startswith("apply_")})
+    ruleset["schedule_rules"] = [rule]
+    compiled = compile_ruleset(ruleset)
+    rule_index = compiled.day_indices()[31]
+    # Feb 29 is clamped to Feb 28 in a year that is not a leap year
+    indices = compiled.day_indices()
+    assert indices[58] == rule_index and indices[59] != rule_index
+    indices = compiled.day_indices(leap_year=True)
+    assert indices[59] == rule_index and indices[60] != rule_index
+    rule["start_date"] = [2, 29]
+    indices = compile_ruleset(ruleset).day_indices()
+    assert [i for i, index in enumerate(indices) if index == rule_index] == [58]
+
+
+def test_compile_ruleset_cache():
+    ruleset = _load("schedule_primary_school_occupancy.json")
+    copied = dict(ruleset, identifier="Copy of School Occupancy")
+    compiled = compile_ruleset(ruleset)
+    assert compile_ruleset(copied) is compiled
+    schedule = ScheduleRulesetAbridged.model_validate(ruleset)
+    assert list(annual_values(schedule)) == list(compiled.values())
+    assert list(compiled.design_day_values("summer"))[6:18] == [1.0] * 12
+    assert list(compiled.design_day_values("winter")) == [0.0] * 24
+
+
+def test_schedule_day_values():
+    day = ScheduleDay(
+        identifier="Ramp", values=[0, 1, 0], times=[[0, 0], [6, 0], [12, 30]]
+    )
+    values = schedule_day_values(day, 2)
+    assert len(values) == 48
+    assert values[11] == 0 and values[12] == 1 and values[24] == 1
+    assert values[25] == 0
+    day.interpolate = True
+    values = schedule_day_values(day, 2)
+    assert values[3] == 0.25 and values[12] == 1
+    assert values[24] == pytest.approx(1 / 13)
+    assert values[25] == 0 and values[-1] == 0
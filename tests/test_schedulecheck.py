@@ -0,0 +1,71 @@
+"""Test the check of schedule values against their ScheduleTypeLimits."""
+import os
+import json
+
+from honeybee_schema.schedulecheck import (
+    DISCRETE_CODE,
+    RANGE_CODE,
+    check_schedule_values,
+)
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+
+
+def _load(file_name):
+    with open(os.path.join(target_folder, file_name)) as json_file:
+        return json.load(json_file)
+
+
+def _schedule(model_dict, identifier):
+    for schedule in model_dict["properties"]["energy"]["schedules"]:
+        if schedule["identifier"] == identifier:
+            return schedule
+
+
+def test_valid_schedule_values():
+    for file_name in ("model_complete_office_floor.hbjson",
+                      "model_energy_fixed_interval.hbjson"):
+        report = check_schedule_values(_load(file_name))
+        assert report.valid, report.errors
+
+
+def test_schedule_values_out_of_range():
+    model_dict = _load("model_complete_office_floor.hbjson")
+    lighting = _schedule(model_dict, "Generic Office Lighting")
+    lighting["day_schedules"][0]["values"][1] = 1.5
+    lighting["day_schedules"][-1]["values"][0] = -0.5
+    heating = _schedule(model_dict, "Generic Office Heating")
+    heating["day_schedules"][0]["values"][0] = -300
+    report = check_schedule_values(model_dict)
+    assert not report.valid
+    assert [(e.code, e.element_id[0]) for e in report.errors] == [
+        (RANGE_CODE, "Generic Office Lighting"),
+        (RANGE_CODE, "Generic Office Heating"),
+    ]
+    assert report.errors[0].message.startswith("2 values")
+
+
+def test_discrete_schedule_values():
+    model_dict = _load("model_energy_fixed_interval.hbjson")
+    energy = model_dict["properties"]["energy"]
+    energy.setdefault("schedule_type_limits", []).append({
+        "type": "ScheduleTypeLimit",
+        "identifier": "On-Off",
+        "lower_limit": 0,
+        "upper_limit": 1,
+        "numeric_type": "Discrete",
+    })
+    schedule = next(s for s in energy["schedules"]
+                    if s["type"] == "ScheduleFixedIntervalAbridged")
+    schedule["schedule_type_limit"] = "On-Off"
+    schedule["values"] = [0, 1] * (len(schedule["values"]) // 2)
+    assert check_schedule_values(model_dict).valid
+
+    schedule["values"][3] = 0.5
+    errors = check_schedule_values(model_dict).errors
+    assert [e.code for e in errors] == [DISCRETE_CODE]
+
+    schedule["schedule_type_limit"] = "Missing Limit"
+    assert check_schedule_values(model_dict).valid
@@ -0,0 +1,57 @@
+"""Test the on-disk cache of the schema validators."""
+import os
+import sys
+import subprocess
+
+from click.testing import CliRunner
+from honeybee_schema.cli import build_schema_cache
+from honeybee_schema.schemacache import build_cache, cache_path, load_cache
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sample = os.path.join(
+    root, 'samples', 'model', 'model_complete_single_zone_office.hbjson')
+
+LOAD_AND_VALIDATE = """
+import sys
+from honeybee_schema.schemacache import load_cache
+from honeybee_schema.model import Model
+loaded = load_cache(sys.argv[1])
+with open(sys.argv[2]) as json_file:
+    model = Model.model_validate_json(json_file.read())
+print(loaded)
+print(model.model_dump_json())
+"""
+
+
+def _validate_in_new_process(folder):
+    result = subprocess.run(
+        [sys.executable, '-c', LOAD_AND_VALIDATE, folder, sample],
+        capture_output=True, text=True, check=True, cwd=root
+    )
+    return result.stdout.splitlines()
+
+
+def test_build_and_load_cache(tmp_path):
+    path = build_cache(str(tmp_path))
+    assert path == cache_path(str(tmp_path))
+    assert os.path.isfile(path)
+
+    loaded, cached_dump = _validate_in_new_process(str(tmp_path))
+    assert loaded == 'True'
+    not_loaded, dump = _validate_in_new_process(str(tmp_path / 'empty'))
+    assert not_loaded == 'False'
+    assert cached_dump == dump
+
+
+def test_load_missing_or_corrupt_cache(tmp_path):
+    assert not load_cache(str(tmp_path))
+    with open(cache_path(str(tmp_path)), 'wb') as cache_file:
+        cache_file.write(b'not a pickle')
+    assert not load_cache(str(tmp_path))
+
+
+def test_build_schema_cache_cli(tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(build_schema_cache, ['--folder', str(tmp_path)])
+    assert result.exit_code == 0
+    assert os.path.isfile(result.output.strip())
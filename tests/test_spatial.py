@@ -0,0 +1,72 @@
+"""Test the spatial index over the geometry of Models."""
+import os
+import json
+
+from honeybee_schema.spatial import SpatialIndex
+from honeybee_schema.validation import ObjectTypes
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+
+
+def _load(file_name, folder=target_folder):
+    with open(os.path.join(folder, file_name)) as json_file:
+        return json.load(json_file)
+
+
+def test_query_box():
+    model_dict = _load("lab_building.hbjson", os.path.join(root, "samples", "model_large"))
+    index = SpatialIndex(model_dict)
+    assert len(index) > 1000
+    query = ((10, 10, 0), (20, 20, 4))
+    expected = []
+    for i in range(len(index)):
+        low, high = index.box(i)
+        if all(l <= q + 0.01 for l, q in zip(low, query[1])) and \
+                all(h >= q - 0.01 for h, q in zip(high, query[0])):
+            expected.append(i)
+    assert sorted(index.query_box(*query)) == expected
+    assert index.query_boxes([query, ((1e6,) * 3, (1e6 + 1,) * 3)])[1] == []
+
+
+def test_coplanar_surface_faces():
+    model_dict = _load("model_complete_office_floor.hbjson")
+    index = SpatialIndex(model_dict)
+    faces = {
+        f["identifier"]: f for room in model_dict["rooms"] for f in room["faces"]}
+    checked = 0
+    for face in faces.values():
+        bc = face["boundary_condition"]
+        if bc["type"] != "Surface":
+            continue
+        matches = index.coplanar(index.index_of(face), opposite=True)
+        match_ids = [index.entries[j].obj["identifier"] for j in matches]
+        assert bc["boundary_condition_objects"][0] in match_ids
+        assert all(index.entries[j].element_type is ObjectTypes.face for j in matches)
+        checked += 1
+    assert checked > 0
+
+
+def test_entry_area():
+    model_dict = _load("model_complete_holes.hbjson")
+    index = SpatialIndex(model_dict)
+    face = next(
+        f for r in model_dict["rooms"] for f in r["faces"] if f["geometry"].get("holes"))
+    entry = index.entries[index.index_of(face)]
+    # a 9 x 9 boundary with a 3 x 3 hole
+    assert abs(entry.area - 72) < 1e-9
+    assert entry.normal is not None and entry.offset is not None
+
+
+def test_ray():
+    model_dict = _load("model_with_shade_mesh.hbjson")
+    index = SpatialIndex(model_dict)
+    hit = index.ray((3, 0.5, 10), (0, 0, -1))
+    assert hit is not None
+    assert index.entries[hit[0]].obj["identifier"] == "Awning_1"
+    assert abs(hit[1] - 6) < 1e-9
+    assert index.ray((3, 0.5, 10), (0, 0, 1)) is None
+    assert index.ray((3, 0.5, 10), (0, 0, -1), max_distance=5) is None
+    hits = index.rays([((1, 1, 10), (0, 0, -1)), ((-5, -5, 10), (0, 0, -1))])
+    assert hits[0][0] == hit[0] and hits[1] is None
@@ -0,0 +1,45 @@
+from honeybee_schema.stream import validate_model_stream
+from honeybee_schema.model import Room
+import os
+import json
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+target_folder_large = os.path.join(root, "samples", "model_large")
+
+
+def test_stream_lab_building():
+    file_path = os.path.join(target_folder_large, "lab_building.hbjson")
+    results = list(validate_model_stream(file_path))
+    assert all(result.error is None for result in results)
+    rooms = [result for result in results if result.path == ("rooms",)]
+    assert len(rooms) == 100
+    assert all(isinstance(result.value, Room) for result in rooms)
+    assert results[-1].path == ()
+    assert results[-1].identifier == "Lab_Building"
+
+
+def test_stream_small_chunks():
+    file_path = os.path.join(target_folder, "model_radiance_dynamic_states.hbjson")
+    results = list(validate_model_stream(file_path))
+    small_results = list(validate_model_stream(file_path, chunk_size=7))
+    assert [(r.path, r.index, r.identifier) for r in results] == \
+        [(r.path, r.index, r.identifier) for r in small_results]
+    assert all(result.error is None for result in small_results)
+
+
+def test_stream_invalid_room(tmp_path):
+    file_path = os.path.join(target_folder, "model_complete_multi_zone_office.hbjson")
+    with open(file_path) as json_file:
+        model_dict = json.load(json_file)
+    model_dict["rooms"][1]["faces"] = model_dict["rooms"][1]["faces"][:2]
+    model_dict["properties"]["energy"]["schedules"][0]["type"] = "NotASchedule"
+    invalid_path = tmp_path / "invalid.hbjson"
+    invalid_path.write_text(json.dumps(model_dict))
+
+    errors = {r.path: r for r in validate_model_stream(invalid_path) if r.error}
+    assert len(errors) == 2
+    assert errors[("rooms",)].index == 1
+    assert errors[("rooms",)].identifier == model_dict["rooms"][1]["identifier"]
+    assert errors[("properties", "energy", "schedules")].index == 0
@@ -0,0 +1,103 @@
+"""Test the application of SyncInstructions to a base Model."""
+import os
+import copy
+import json
+
+import pytest
+
+from honeybee_schema.comparison import SyncInstructions
+from honeybee_schema.diff import compare_models
+from honeybee_schema.model import Model
+from honeybee_schema.reference import check_references
+from honeybee_schema.sync import sync_model
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+model_file = os.path.join(target_folder, "model_complete_office_floor.hbjson")
+
+
+def _load():
+    with open(model_file) as json_file:
+        return json.load(json_file)
+
+
+def _edited_model(base):
+    """Get a copy of a Model with a moved Room, a new program and an added Room."""
+    new = copy.deepcopy(base)
+    energy = new["properties"]["energy"]
+    schedule = next(
+        s for s in energy["schedules"] if s["identifier"] == "Generic Office Occupancy")
+    energy["schedules"].append(dict(copy.deepcopy(schedule), identifier="Edited Occupancy"))
+    program = copy.deepcopy(energy["program_types"][0])
+    program["identifier"] = "Edited Program"
+    program["people"]["occupancy_schedule"] = "Edited Occupancy"
+    energy["program_types"].append(program)
+
+    rooms = new["rooms"]
+    rooms[0]["faces"][0]["geometry"]["boundary"][0][2] += 0.5
+    rooms[0]["properties"]["energy"]["program_type"] = "Edited Program"
+    rooms.pop(1)
+    rooms.append(dict(copy.deepcopy(rooms[2]), identifier="New_Room"))
+    return new
+
+
+def _instructions(report, **changed):
+    """Get SyncInstructions that accept every object of a ComparisonReport."""
+    return SyncInstructions(
+        changed_objects=[
+            dict(element_type=c.element_type, element_id=c.element_id, **changed)
+            for c in report.changed_objects],
+        deleted_objects=[
+            dict(element_type=d.element_type, element_id=d.element_id)
+            for d in report.deleted_objects],
+        added_objects=[
+            dict(element_type=a.element_type, element_id=a.element_id)
+            for a in report.added_objects],
+    )
+
+
+def test_sync_model():
+    base, new = _load(), _edited_model(_load())
+    new_copy = copy.deepcopy(new)
+    instructions = _instructions(compare_models(base, new))
+    synced = sync_model(base, new, instructions.model_dump(exclude_none=True))
+
+    assert synced is base
+    assert new == new_copy
+    assert synced["rooms"] == new["rooms"]
+    energy = synced["properties"]["energy"]
+    assert energy["program_types"][-1]["identifier"] == "Edited Program"
+    assert energy["schedules"][-1]["identifier"] == "Edited Occupancy"
+    assert check_references(synced).valid
+    Model.model_validate(synced)
+
+
+def test_sync_model_keep_geometry():
+    base, new = _load(), _edited_model(_load())
+    original_room = copy.deepcopy(base["rooms"][0])
+    instructions = SyncInstructions(changed_objects=[{
+        "element_type": "Room", "element_id": original_room["identifier"],
+        "update_geometry": False, "update_radiance": False}])
+    synced = sync_model(base, new, instructions)
+
+    room = synced["rooms"][0]
+    assert room["faces"] == original_room["faces"]
+    assert room["properties"]["energy"]["program_type"] == "Edited Program"
+    assert len(synced["rooms"]) == len(new["rooms"])
+    assert check_references(synced).valid
+
+    instructions = SyncInstructions(changed_objects=[{
+        "element_type": "Room", "element_id": original_room["identifier"],
+        "update_energy": False}])
+    synced = sync_model(_load(), new, instructions)
+    room = synced["rooms"][0]
+    assert room["faces"] == new["rooms"][0]["faces"]
+    assert room["properties"]["energy"] == original_room["properties"]["energy"]
+
+
+def test_sync_model_missing_object():
+    instructions = SyncInstructions(added_objects=[
+        {"element_type": "Room", "element_id": "Not_A_Room"}])
+    with pytest.raises(ValueError):
+        sync_model(_load(), _load(), instructions)
@@ -0,0 +1,118 @@
+"""Test the conversion of Model dictionaries to other units."""
+import os
+import copy
+import json
+
+import pytest
+
+from honeybee_schema.model import Model
+from honeybee_schema.units import conversion_factor, convert_units, scale_model
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, "samples", "model")
+
+
+def _load(file_name, folder=target_folder):
+    with open(os.path.join(folder, file_name)) as json_file:
+        return json.load(json_file)
+
+
+def test_conversion_factor():
+    assert conversion_factor("Meters", "Millimeters") == pytest.approx(1000)
+    assert conversion_factor("Feet", "Inches") == pytest.approx(12)
+    assert conversion_factor("Centimeters", "Centimeters") == 1
+    with pytest.raises(ValueError):
+        conversion_factor("Meters", "Furlongs")
+
+
+def test_convert_units_radiance_assets():
+    model_dict = _load("model_radiance_grid_views.hbjson")
+    original = copy.deepcopy(model_dict)
+    assert convert_units(model_dict, "Millimeters") is model_dict
+    assert model_dict["units"] == "Millimeters"
+    assert "tolerance" not in original
+    assert model_dict["tolerance"] == pytest.approx(0.01 * 1000)
+
+    face, original_face = model_dict["rooms"][0]["faces"][0], \
+        original["rooms"][0]["faces"][0]
+    assert face["geometry"]["boundary"][1] == pytest.approx(
+        [c * 1000 for c in original_face["geometry"]["boundary"][1]])
+
+    grid = model_dict["properties"]["radiance"]["sensor_grids"][0]
+    original_grid = original["properties"]["radiance"]["sensor_grids"][0]
+    assert grid["sensors"][1]["pos"] == pytest.approx(
+        [c * 1000 for c in original_grid["sensors"][1]["pos"]])
+    assert grid["sensors"][1]["dir"] == original_grid["sensors"][1]["dir"]
+    assert grid["mesh"]["vertices"][5] == pytest.approx(
+        [c * 1000 for c in original_grid["mesh"]["vertices"][5]])
+    assert grid["mesh"]["faces"] == original_grid["mesh"]["faces"]
+
+    view = model_dict["properties"]["radiance"]["views"][0]
+    original_view = original["properties"]["radiance"]["views"][0]
+    assert view["position"] == pytest.approx(
+        [c * 1000 for c in original_view["position"]])
+    assert view["direction"] == original_view["direction"]
+    assert view["h_size"] == original_view["h_size"]
+    Model.model_validate(model_dict)
+
+    convert_units(model_dict, "Meters")
+    assert model_dict["units"] == "Meters"
+    assert model_dict["tolerance"] == pytest.approx(0.01)
+    assert grid["mesh"]["vertices"][5] == pytest.approx(original_grid["mesh"]["vertices"][5])
+
+
+def test_convert_units_parallel_view():
+    view = _load("view_parallel.json", os.path.join(root, "samples", "radiance_asset"))
+    model_dict = {"type": "Model", "identifier": "Views", "units": "Meters",
+                  "properties": {"type": "ModelProperties",
+                                 "radiance": {"type": "ModelRadianceProperties",
+                                              "views": [view]}}}
+    convert_units(model_dict, "Feet")
+    assert view["position"] == pytest.approx([0, 0, 10 / 0.3048])
+    assert view["h_size"] == pytest.approx(240 / 0.3048)
+    assert view["v_size"] == pytest.approx(300 / 0.3048)
+    # shift and lift are fractions of the view size
+    assert (view["shift"], view["lift"]) == (-10, -25)
+
+
+def test_convert_units_room_properties():
+    model_dict = _load("model_complete_holes.hbjson")
+    model_dict["units"] = "Feet"
+    room = model_dict["rooms"][0]
+    room["properties"]["energy"]["daylighting_control"] = \
+        _load("daylight_control.json", os.path.join(root, "samples", "daylight"))
+    room["properties"]["doe2"] = {
+        "type": "RoomDoe2Properties",
+        "space_polygon_geometry": {
+            "type": "Face3D", "boundary": [[0, 0, 0], [10, 0, 0], [10, 10, 0]]},
+    }
+    face = next(f for f in room["faces"] if f["geometry"].get("holes"))
+    hole = copy.deepcopy(face["geometry"]["holes"][0])
+    convert_units(model_dict)
+    assert model_dict["units"] == "Meters"
+    assert room["properties"]["energy"]["daylighting_control"]["sensor_position"] == \
+        pytest.approx([5 * 0.3048, 5 * 0.3048, 0.8 * 0.3048])
+    assert room["properties"]["doe2"]["space_polygon_geometry"]["boundary"][1] == \
+        pytest.approx([10 * 0.3048, 0, 0])
+    assert face["geometry"]["holes"][0][2] == pytest.approx(
+        [c * 0.3048 for c in hole[2]])
+    Model.model_validate(model_dict)
+
+
+def test_scale_model_states():
+    model_dict = _load("model_radiance_dynamic_states.hbjson")
+    states = [
+        state for room in model_dict["rooms"] for face in room["faces"]
+        for aperture in face.get("apertures", [])
+        for state in aperture["properties"]["radiance"].get("states") or []
+        if state.get("shades")
+    ]
+    assert states
+    geometry = states[0]["shades"][0]["geometry"]
+    original = copy.deepcopy(geometry)
+    scale_model(model_dict, 2)
+    assert model_dict["units"] == "Meters"
+    assert geometry["boundary"] == [[c * 2 for c in point] for point in original["boundary"]]
+    assert geometry["plane"]["o"] == [c * 2 for c in original["plane"]["o"]]
+    assert geometry["plane"]["n"] == original["plane"]["n"]